@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Benchmark the markdown fetcher end to end against the local stub server.
+
+Runs ``fetch_markdown`` sequentially, ``fetch_markdown_many`` and the async
+fetcher at several concurrency levels against ``scripts/markdown_stub_server.py``
+and reports p50/p95/p99 latency and requests per second. Results can be saved
+as a baseline and later runs compared against it, so regressions in the
+request path show up as a non-zero exit code.
+
+Usage:
+    python -m scripts.benchmark_markdown_fetcher
+    python -m scripts.benchmark_markdown_fetcher --save-baseline
+    python -m scripts.benchmark_markdown_fetcher --compare --tolerance 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from dataclasses import asdict
+from itertools import cycle, islice
+from pathlib import Path
+
+from scripts.benchmark_markdown_tiers import percentile
+from scripts.markdown_stub_server import PAGES, StubServer, StubSettings
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownPoolConfig,
+    fetch_markdown,
+    fetch_markdown_many,
+)
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "markdown_fetcher.json"
+
+
+class _TimedFetcher:
+    """Fetcher wrapper that records the latency of every ``fetch`` call."""
+
+    def __init__(self, fetcher: MarkdownFetcher):
+        self.fetcher = fetcher
+        self.config = fetcher.config
+        self.samples: list[float] = []
+        self._lock = threading.Lock()
+
+    def fetch(self, url, config=None):
+        start = time.perf_counter()
+        try:
+            return self.fetcher.fetch(url, config)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.samples.append(elapsed)
+
+
+def summarize(samples: list[float], errors: int, elapsed: float) -> dict:
+    """Latency percentiles (ms) and throughput for one scenario."""
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "rps": round(len(samples) / elapsed, 3) if elapsed > 0 else 0.0,
+    }
+
+
+def bench_sequential(urls: list[str], config: MarkdownFetcherConfig) -> dict:
+    """Call ``fetch_markdown`` once per URL, one after another."""
+    samples = []
+    errors = 0
+    started = time.perf_counter()
+    for url in urls:
+        start = time.perf_counter()
+        try:
+            fetch_markdown(url, config)
+        except MarkdownFetchError:
+            errors += 1
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples, errors, time.perf_counter() - started)
+
+
+def bench_many(
+    urls: list[str], config: MarkdownFetcherConfig, concurrency: int
+) -> dict:
+    """Fetch all URLs with ``fetch_markdown_many`` at ``concurrency``."""
+    pool = MarkdownPoolConfig(pool_maxsize=max(concurrency, 10))
+    with MarkdownFetcher(config, pool=pool) as fetcher:
+        timed = _TimedFetcher(fetcher)
+        started = time.perf_counter()
+        items = list(
+            fetch_markdown_many(
+                urls,
+                config,
+                max_workers=concurrency,
+                max_per_host=concurrency,
+                fetcher=timed,  # type: ignore[arg-type]
+            )
+        )
+        elapsed = time.perf_counter() - started
+    errors = sum(not item.ok for item in items)
+    return summarize(timed.samples, errors, elapsed)
+
+
+def bench_async(
+    urls: list[str], config: MarkdownFetcherConfig, concurrency: int
+) -> dict:
+    """Fetch all URLs with ``AsyncMarkdownFetcher`` at ``concurrency``."""
+    from vibe_coding.utils.markdown_fetcher_async import AsyncMarkdownFetcher
+
+    async def run() -> dict:
+        samples = []
+        errors = 0
+        semaphore = asyncio.Semaphore(concurrency)
+        pool = MarkdownPoolConfig(pool_maxsize=max(concurrency, 10))
+
+        async with AsyncMarkdownFetcher(config, pool=pool) as fetcher:
+
+            async def one(url: str) -> None:
+                nonlocal errors
+                async with semaphore:
+                    start = time.perf_counter()
+                    try:
+                        await fetcher.fetch(url, config)
+                    except MarkdownFetchError:
+                        errors += 1
+                    samples.append((time.perf_counter() - start) * 1000)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one(url) for url in urls))
+            elapsed = time.perf_counter() - started
+        return summarize(samples, errors, elapsed)
+
+    return asyncio.run(run())
+
+
+def run(
+    requests: int,
+    concurrency: list[int],
+    settings: StubSettings,
+    method: str = "ai",
+) -> dict[str, dict]:
+    """Run every scenario against a fresh stub server.
+
+    Returns:
+        Mapping of ``"<scenario>@<concurrency>"`` to its summary.
+    """
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        has_httpx = False
+    else:
+        has_httpx = True
+
+    results = {}
+    with StubServer(settings) as stub:
+        urls = [stub.page_url(name) for name in islice(cycle(PAGES), requests)]
+        config = MarkdownFetcherConfig(
+            method=method, endpoint=stub.endpoint, max_retries=3, jitter=0
+        )
+        results["fetch_markdown@1"] = bench_sequential(urls, config)
+        for level in concurrency:
+            results[f"fetch_markdown_many@{level}"] = bench_many(urls, config, level)
+            if has_httpx:
+                results[f"async@{level}"] = bench_async(urls, config, level)
+    return results
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float
+) -> list[str]:
+    """Describe every scenario that regressed beyond ``tolerance``.
+
+    A scenario regresses when its p95 latency grows, or its throughput
+    drops, by more than ``tolerance`` (a fraction) relative to the baseline.
+    """
+    regressions = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']:.1f}ms > "
+                f"baseline {base['p95_ms']:.1f}ms"
+            )
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {current['rps']:.1f} req/s < baseline {base['rps']:.1f} req/s"
+            )
+        if current["errors"] > base["errors"]:
+            regressions.append(
+                f"{name}: {current['errors']} errors > baseline {base['errors']}"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=60, help="URLs per scenario")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16],
+        help="Concurrency levels for the bulk and async scenarios",
+    )
+    parser.add_argument("--method", default="ai", help="Fetcher method to use")
+    parser.add_argument("--ai-latency", type=float, default=0.02)
+    parser.add_argument("--browser-latency", type=float, default=0.1)
+    parser.add_argument("--payload-kb", type=int, default=0)
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="Inject a 429 into every Nth stub response",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative regression before --compare fails",
+    )
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        ai_latency=args.ai_latency,
+        browser_latency=args.browser_latency,
+        native_markdown=args.method == "auto",
+        payload_kb=args.payload_kb,
+        rate_limit_every=args.rate_limit_every,
+    )
+    results = run(args.requests, args.concurrency, settings, args.method)
+
+    print(
+        f"{'scenario':<24} {'reqs':>5} {'errs':>5} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9} {'req/s':>8}"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:<24} {row['requests']:>5} {row['errors']:>5} "
+            f"{row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms "
+            f"{row['p99_ms']:>7.1f}ms {row['rps']:>8.1f}"
+        )
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "requests": args.requests,
+            "method": args.method,
+            "settings": asdict(settings),
+            "results": results,
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.compare:
+        if not args.baseline.exists():
+            sys.exit(f"No baseline at {args.baseline}; run with --save-baseline")
+        baseline = json.loads(args.baseline.read_text())
+        if (
+            baseline.get("settings") != asdict(settings)
+            or baseline.get("requests") != args.requests
+        ):
+            print("\nWarning: baseline was recorded with different settings")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark the content-addressed markdown store against plain files.
+
+Generates a synthetic corpus of markdown documents, a fraction of which are
+exact duplicates published under other URLs, and writes it both as one plain
+``.md`` file per URL (the crawler layout) and into ``MarkdownStore`` with each
+available codec. Reports disk usage, space saved, and write and read
+throughput in MB/s of uncompressed content.
+
+Usage:
+    python -m scripts.benchmark_markdown_store
+    python -m scripts.benchmark_markdown_store --documents 2000 --duplicates 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from vibe_coding.utils.markdown_fetcher import MarkdownMetadata, MarkdownResult
+from vibe_coding.utils.markdown_store import MarkdownStore, default_codec
+
+WORDS = (
+    "markdown fetcher store token cache page site crawl index blob hash "
+    "content request response server client latency throughput header "
+    "section paragraph example install usage reference config"
+).split()
+
+METADATA = MarkdownMetadata(
+    token_count=None, method_used="ai", status_code=200, response_time_ms=0
+)
+
+
+def make_document(rng: random.Random, size_kb: int) -> str:
+    """Build a markdown document of roughly ``size_kb`` kilobytes."""
+    parts = [f"# {rng.choice(WORDS).title()} {rng.randrange(10**6)}\n"]
+    size = len(parts[0])
+    while size < size_kb * 1024:
+        if rng.random() < 0.1:
+            part = f"\n## {' '.join(rng.choices(WORDS, k=3)).title()}\n"
+        elif rng.random() < 0.1:
+            body = "\n".join(
+                f"    {rng.choice(WORDS)}({rng.randrange(100)})" for _ in range(5)
+            )
+            part = f"\n```python\n{body}\n```\n"
+        else:
+            part = "\n" + " ".join(rng.choices(WORDS, k=rng.randint(20, 80))) + ".\n"
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)
+
+
+def make_corpus(
+    documents: int, duplicates: float, size_kb: int, seed: int = 0
+) -> list[tuple[str, str]]:
+    """Return ``(url, content)`` pairs with a share of duplicate contents."""
+    rng = random.Random(seed)
+    corpus: list[tuple[str, str]] = []
+    for i in range(documents):
+        url = f"https://docs.example.com/page/{i}"
+        if corpus and rng.random() < duplicates:
+            corpus.append((url, rng.choice(corpus)[1]))
+        else:
+            corpus.append((url, make_document(rng, size_kb)))
+    return corpus
+
+
+def _mb_per_s(raw_bytes: int, seconds: float) -> float:
+    return round(raw_bytes / 1e6 / seconds, 1) if seconds > 0 else 0.0
+
+
+def _disk_usage(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def bench_plain(corpus: list[tuple[str, str]], directory: Path) -> dict:
+    """Write and read every document as its own plain file."""
+    raw = sum(len(content.encode("utf-8")) for _, content in corpus)
+    paths = [directory / f"{i}.md" for i in range(len(corpus))]
+    directory.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    for path, (_, content) in zip(paths, corpus):
+        path.write_text(content, encoding="utf-8")
+    write_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for path in paths:
+        path.read_text(encoding="utf-8")
+    read_s = time.perf_counter() - started
+
+    return {
+        "disk_bytes": _disk_usage(directory),
+        "write_mb_s": _mb_per_s(raw, write_s),
+        "read_mb_s": _mb_per_s(raw, read_s),
+        "stream_mb_s": None,
+    }
+
+
+def bench_store(corpus: list[tuple[str, str]], directory: Path, codec: str) -> dict:
+    """Write every document into a ``MarkdownStore`` and read it back."""
+    raw = sum(len(content.encode("utf-8")) for _, content in corpus)
+    store = MarkdownStore(directory, codec=codec)
+
+    started = time.perf_counter()
+    for url, content in corpus:
+        store.put(url, MarkdownResult(content=content, metadata=METADATA))
+    write_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for url, _ in corpus:
+        store.get(url)
+    read_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for url, _ in corpus:
+        for _ in store.iter_text(url):
+            pass
+    stream_s = time.perf_counter() - started
+
+    return {
+        "disk_bytes": _disk_usage(directory),
+        "write_mb_s": _mb_per_s(raw, write_s),
+        "read_mb_s": _mb_per_s(raw, read_s),
+        "stream_mb_s": _mb_per_s(raw, stream_s),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument(
+        "--duplicates",
+        type=float,
+        default=0.2,
+        help="Fraction of documents that repeat an earlier document's content",
+    )
+    parser.add_argument("--size-kb", type=int, default=16, help="Document size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents, args.duplicates, args.size_kb, args.seed)
+    raw = sum(len(content.encode("utf-8")) for _, content in corpus)
+    unique = len({content for _, content in corpus})
+    print(
+        f"{len(corpus)} documents, {unique} unique, {raw / 1e6:.1f} MB uncompressed\n"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {"plain": bench_plain(corpus, Path(tmp) / "plain")}
+        for codec in sorted({"gzip", default_codec()}):
+            results[f"store-{codec}"] = bench_store(corpus, Path(tmp) / codec, codec)
+
+    print(
+        f"{'layout':<12} {'disk MB':>8} {'saved':>7} "
+        f"{'write MB/s':>11} {'read MB/s':>10} {'stream MB/s':>12}"
+    )
+    for name, row in results.items():
+        saved = 1 - row["disk_bytes"] / raw
+        stream = "-" if row["stream_mb_s"] is None else f"{row['stream_mb_s']:.1f}"
+        print(
+            f"{name:<12} {row['disk_bytes'] / 1e6:>8.1f} {saved:>7.0%} "
+            f"{row['write_mb_s']:>11.1f} {row['read_mb_s']:>10.1f} {stream:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
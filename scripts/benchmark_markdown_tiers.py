@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local HTML-to-Markdown tier against the remote tiers.
+
+Fixture pages and markdown.new are served by the local stub in
+``scripts/markdown_stub_server.py``, with remote latency simulated, so the
+numbers show what the local tier saves per page and whether it falls back.
+
+Usage:
+    python -m scripts.benchmark_markdown_tiers --requests 20 --ai-latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from scripts.markdown_stub_server import PAGES, StubServer, StubSettings
+from vibe_coding.utils.markdown_fetcher import MarkdownFetcher, MarkdownFetcherConfig
+
+TIERS = {
+    "local": {"method": "auto", "local_conversion": True},
+    "ai": {"method": "ai"},
+    "browser": {"method": "browser"},
+}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples`` (nearest rank)."""
+    ordered = sorted(samples)
+    index = max(int(round(pct / 100 * len(ordered))) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def run(requests: int, settings: StubSettings) -> list[dict]:
+    """Fetch every fixture page through every tier and collect latencies."""
+    rows = []
+    with StubServer(settings) as stub, MarkdownFetcher() as fetcher:
+        for page in PAGES:
+            for tier, options in TIERS.items():
+                config = MarkdownFetcherConfig(
+                    endpoint=stub.endpoint, max_retries=1, **options
+                )
+                samples = []
+                used = set()
+                for _ in range(requests):
+                    start = time.perf_counter()
+                    result = fetcher.fetch(stub.page_url(page), config)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    used.add(result.metadata.method_used)
+                rows.append(
+                    {
+                        "page": page,
+                        "tier": tier,
+                        "served_by": ",".join(sorted(used)),
+                        "mean_ms": statistics.fmean(samples),
+                        "p50_ms": percentile(samples, 50),
+                        "p95_ms": percentile(samples, 95),
+                    }
+                )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20, help="Requests per cell")
+    parser.add_argument("--ai-latency", type=float, default=0.2)
+    parser.add_argument("--browser-latency", type=float, default=1.0)
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        ai_latency=args.ai_latency, browser_latency=args.browser_latency
+    )
+    rows = run(args.requests, settings)
+
+    print(
+        f"{'page':<8} {'tier':<8} {'served by':<10} {'mean':>9} {'p50':>9} {'p95':>9}"
+    )
+    for row in rows:
+        print(
+            f"{row['page']:<8} {row['tier']:<8} {row['served_by']:<10} "
+            f"{row['mean_ms']:>7.1f}ms {row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,25 @@
 """
 CLI entrypoint for Vibe Coding utility scripts.
 
-This script aggregates subcommands from init_session, init_template, and check_links.
+This script aggregates subcommands from init_session, init_template, and check_links,
+plus the markdown crawler, manifest refresh and full-text search.
 
 Usage:
-    python scripts/cli.py [subcommand]
+    python -m scripts.cli [subcommand]
 
 Subcommands:
     init-session
     init-template
     check-links
+    crawl
+    refresh
+    index
+    search
 """
 
-import typer
+from pathlib import Path
 
-from scripts.check_links import main as check_links_main
-from scripts.init_session import main as init_session_main
-from scripts.init_template import main as init_template_main
+import typer
 
 app = typer.Typer(help="Vibe Coding Utility CLI")
 
@@ -24,20 +27,165 @@ app = typer.Typer(help="Vibe Coding Utility CLI")
 @app.command("init-session")
 def init_session():
     """Initialize a new session."""
+    from scripts.init_session import main as init_session_main
+
     init_session_main()
 
 
 @app.command("init-template")
 def init_template():
     """Initialize a new template."""
+    from scripts.init_template import main as init_template_main
+
     init_template_main()
 
 
 @app.command("check-links")
 def check_links():
     """Check documentation links for validity."""
+    from scripts.check_links import main as check_links_main
+
     check_links_main()
 
 
+@app.command("crawl")
+def crawl(
+    seeds: list[str] = typer.Argument(None, help="Seed URLs to start from."),
+    sitemap: str = typer.Option(None, help="Sitemap or sitemap index URL."),
+    out: Path = typer.Option(None, help="Output directory (default data/raw/crawl)."),
+    max_depth: int = typer.Option(2, help="Link hops to follow from the seeds."),
+    max_pages: int = typer.Option(1000, help="Pages to fetch in this run."),
+    delay: float = typer.Option(1.0, help="Seconds between requests per host."),
+    workers: int = typer.Option(4, help="Concurrent fetches."),
+    method: str = typer.Option("auto", help="Fetcher method."),
+    robots: bool = typer.Option(True, help="Honor robots.txt."),
+    resume: bool = typer.Option(True, help="Continue from a saved frontier."),
+):
+    """Crawl a site into markdown files with a manifest."""
+    from vibe_coding.utils.markdown_crawler import (
+        DEFAULT_CRAWL_DIR,
+        CrawlConfig,
+        MarkdownCrawler,
+    )
+    from vibe_coding.utils.markdown_fetcher import MarkdownFetcherConfig
+
+    config = CrawlConfig(
+        max_depth=max_depth,
+        max_pages=max_pages,
+        politeness_delay=delay,
+        respect_robots=robots,
+        max_workers=workers,
+    )
+    with MarkdownCrawler(
+        out or DEFAULT_CRAWL_DIR, config, MarkdownFetcherConfig(method=method)
+    ) as crawler:
+        report = crawler.crawl(seeds or (), sitemap=sitemap, resume=resume)
+
+    typer.echo(
+        f"Wrote {report.pages_written} pages ({report.failed} failed, "
+        f"{report.robots_skipped} disallowed by robots.txt, "
+        f"{report.remaining} still queued). Manifest: {report.manifest_path}"
+    )
+
+
+@app.command("refresh")
+def refresh(
+    out: Path = typer.Option(None, help="Manifest directory (default data/raw/crawl)."),
+    urls: Path = typer.Option(
+        None, help="File with one URL per line (default: URLs in the manifest)."
+    ),
+    changed_list: Path = typer.Option(
+        None, help="Write the paths of new and changed files here."
+    ),
+    workers: int = typer.Option(8, help="Concurrent fetches."),
+    method: str = typer.Option("auto", help="Fetcher method."),
+):
+    """Re-fetch manifest URLs and rewrite only changed markdown files."""
+    from vibe_coding.utils.markdown_crawler import DEFAULT_CRAWL_DIR
+    from vibe_coding.utils.markdown_fetcher import MarkdownFetcherConfig
+    from vibe_coding.utils.markdown_refresh import refresh_manifest
+
+    url_list = None
+    if urls is not None:
+        url_list = [
+            line.strip()
+            for line in urls.read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.startswith("#")
+        ]
+    report = refresh_manifest(
+        out or DEFAULT_CRAWL_DIR,
+        url_list,
+        MarkdownFetcherConfig(method=method),
+        max_workers=workers,
+    )
+
+    if changed_list is not None:
+        changed_list.write_text(
+            "".join(f"{path}\n" for path in report.written), encoding="utf-8"
+        )
+    counts = report.counts
+    typer.echo(
+        f"{counts['added']} added, {counts['changed']} changed, "
+        f"{counts['unchanged']} unchanged, {counts['failed']} failed. "
+        f"Manifest: {report.manifest_path}"
+    )
+
+
+@app.command("index")
+def index(
+    crawl_dir: Path = typer.Argument(
+        None, help="Crawl directory (default data/raw/crawl)."
+    ),
+    db: Path = typer.Option(
+        None, help="Index file (default data/raw/search/index.sqlite3)."
+    ),
+    batch_size: int = typer.Option(1000, help="Documents per commit."),
+    optimize: bool = typer.Option(True, help="Merge posting blocks afterwards."),
+):
+    """Add or update crawled pages in the full-text search index."""
+    from vibe_coding.utils.markdown_crawler import DEFAULT_CRAWL_DIR
+    from vibe_coding.utils.markdown_search import (
+        DEFAULT_INDEX_PATH,
+        MarkdownSearchIndex,
+        iter_crawl_documents,
+    )
+
+    with MarkdownSearchIndex(db or DEFAULT_INDEX_PATH) as search_index:
+        report = search_index.add_many(
+            iter_crawl_documents(crawl_dir or DEFAULT_CRAWL_DIR), batch_size
+        )
+        if optimize:
+            search_index.optimize()
+        total = len(search_index)
+
+    typer.echo(
+        f"{report.added} added, {report.updated} updated, "
+        f"{report.unchanged} unchanged in {report.took_ms:.0f}ms. "
+        f"{total} documents indexed."
+    )
+
+
+@app.command("search")
+def search(
+    query: str = typer.Argument(..., help='Words and "quoted phrases".'),
+    db: Path = typer.Option(
+        None, help="Index file (default data/raw/search/index.sqlite3)."
+    ),
+    limit: int = typer.Option(10, help="Maximum number of results."),
+):
+    """Search indexed markdown with BM25 ranking."""
+    from vibe_coding.utils.markdown_search import (
+        DEFAULT_INDEX_PATH,
+        MarkdownSearchIndex,
+    )
+
+    with MarkdownSearchIndex(db or DEFAULT_INDEX_PATH) as search_index:
+        results = search_index.search(query, limit)
+
+    for hit in results.hits:
+        typer.echo(f"{hit.score:8.3f}  {hit.url}  {hit.title}")
+    typer.echo(f"{results.total} matches in {results.took_ms:.1f}ms")
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start import time of vibe_coding entry points.
+
+Imports each entry point in a fresh interpreter with ``python -X importtime``
+and parses the per-module timings that CPython writes to stderr. Modules
+imported during interpreter startup (``site``, ``encodings``) are excluded,
+so the reported time is what the import itself costs. Each entry point is
+measured several times and the fastest run is kept, which filters out noise
+from a busy machine. Results can be saved as a budget and later runs compared
+against it, so a change that pulls a heavy dependency into a cheap import
+path shows up as a non-zero exit code.
+
+Usage:
+    python -m scripts.import_time
+    python -m scripts.import_time vibe_coding.config --top 15
+    python -m scripts.import_time --save-baseline
+    python -m scripts.import_time --compare --tolerance 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "import_time.json"
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+ENTRY_POINTS = (
+    "vibe_coding",
+    "vibe_coding.config",
+    "vibe_coding.utils.logging",
+    "vibe_coding.utils.markdown_fetcher",
+    "scripts.cli",
+)
+
+# Written to stderr right before the measured import, separating it from the
+# modules imported while the interpreter starts up.
+_MARKER = "-- import_time start --"
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output.
+
+    Attributes:
+        module: Fully qualified module name.
+        self_us: Time spent in the module itself, in microseconds.
+        cumulative_us: Time including the imports it triggered.
+        depth: Nesting level; ``0`` for modules imported directly.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Import timings of one entry point.
+
+    Attributes:
+        entry_point: The imported module.
+        records: Every module imported, in the order they finished.
+    """
+
+    entry_point: str
+    records: tuple[ImportRecord, ...]
+
+    @property
+    def total_ms(self) -> float:
+        """Wall time of the whole import, in milliseconds."""
+        return sum(r.cumulative_us for r in self.records if r.depth == 0) / 1000
+
+    @property
+    def modules(self) -> frozenset[str]:
+        """Names of every module the import loaded."""
+        return frozenset(r.module for r in self.records)
+
+    def slowest(self, count: int = 10) -> list[ImportRecord]:
+        """Modules with the highest self time."""
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:count]
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` output into records.
+
+    Only lines after the start marker are parsed when it is present. Other
+    stderr output and the header line are ignored.
+
+    Args:
+        stderr: Captured stderr of ``python -X importtime``.
+
+    Returns:
+        Records in output order (children before their parent).
+    """
+    _, marker, after = stderr.partition(_MARKER)
+    if marker:
+        stderr = after
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(
+                    module=module,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=(len(indent) - 1) // 2,
+                )
+            )
+    return records
+
+
+def measure(entry_point: str, runs: int = 5) -> ImportProfile:
+    """Import ``entry_point`` in fresh interpreters and keep the fastest run.
+
+    Args:
+        entry_point: Module to import.
+        runs: Number of interpreters to start.
+
+    Returns:
+        ImportProfile of the fastest run.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    code = (
+        f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush(); "
+        f"import {entry_point}"
+    )
+    env = dict(os.environ)
+    # Measure imports from cached bytecode, as deployed code runs; the first
+    # run writes the cache if it is missing.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")])
+    )
+    best: ImportProfile | None = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"import {entry_point} failed:\n{result.stderr}")
+        profile = ImportProfile(entry_point, tuple(parse_importtime(result.stderr)))
+        if best is None or profile.total_ms < best.total_ms:
+            best = profile
+    return best
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float,
+    slack_ms: float = 5.0,
+) -> list[str]:
+    """Describe every entry point slower than its budget plus allowances.
+
+    Args:
+        results: Measured import time in milliseconds per entry point.
+        baseline: Budget in milliseconds per entry point.
+        tolerance: Allowed excess as a fraction of the budget.
+        slack_ms: Allowed excess in milliseconds on top of ``tolerance``, so
+            imports of a millisecond or two are not failed by timer noise.
+
+    Returns:
+        One message per entry point over budget.
+    """
+    regressions = []
+    for name, budget in baseline.items():
+        current = results.get(name)
+        if current is not None and current > budget * (1 + tolerance) + slack_ms:
+            regressions.append(
+                f"{name}: {current:.1f}ms > budget {budget:.1f}ms "
+                f"(+{tolerance:.0%} +{slack_ms:g}ms)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "entry_points",
+        nargs="*",
+        default=list(ENTRY_POINTS),
+        help="Modules to import (default: the key vibe_coding entry points)",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Runs per entry point")
+    parser.add_argument("--top", type=int, default=5, help="Slowest modules shown")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown over the budget, as a fraction",
+    )
+    parser.add_argument(
+        "--slack-ms",
+        type=float,
+        default=5.0,
+        help="Allowed slowdown over the budget, in milliseconds",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for entry_point in args.entry_points:
+        profile = measure(entry_point, args.runs)
+        results[entry_point] = round(profile.total_ms, 1)
+        print(
+            f"{entry_point}: {profile.total_ms:.1f}ms, {len(profile.modules)} modules"
+        )
+        for record in profile.slowest(args.top):
+            print(f"    {record.self_us / 1000:>7.1f}ms  {record.module}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"python": sys.version.split()[0], "budgets_ms": results}
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.compare:
+        if not args.baseline.exists():
+            sys.exit(f"No baseline at {args.baseline}; run with --save-baseline")
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(
+            results, baseline["budgets_ms"], args.tolerance, args.slack_ms
+        )
+        if regressions:
+            print("\nOver budget:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nAll entry points within {args.tolerance:.0%} of budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for markdown.new and for the sites it converts.
+
+The stub serves fixture pages under ``/pages/<name>`` and answers markdown.new
+style ``POST /`` conversion requests, with configurable per-tier latency,
+payload size, ``429`` injection and ``x-markdown-tokens`` headers. It lets the
+fetcher tiers be benchmarked without touching the live service:
+
+    >>> with StubServer(StubSettings(ai_latency=0.2)) as stub:
+    ...     config = MarkdownFetcherConfig(method="ai", endpoint=stub.endpoint)
+    ...     fetch_markdown(stub.page_url("article"), config)
+
+``StubServer(http2=True)`` serves the same routes over cleartext HTTP/2 for
+exercising the multiplexed transport.
+"""
+
+from __future__ import annotations
+
+import json
+import socketserver
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from vibe_coding.utils.html_to_markdown import html_to_markdown
+
+_PARAGRAPH = (
+    "<p>Markdown is a lightweight markup language with plain text formatting "
+    "syntax. It is designed so that it can be converted to HTML and many other "
+    'formats, and is <a href="/pages/docs">documented here</a>.</p>'
+)
+
+PAGES = {
+    "article": (
+        "<html><head><title>Article</title><script src='/analytics.js'></script>"
+        "</head><body><nav><a href='/'>Home</a></nav><article><h1>An Article</h1>"
+        + "".join([_PARAGRAPH] * 20)
+        + "<h2>Summary</h2><ul><li>Short</li><li>Readable</li></ul>"
+        "</article></body></html>"
+    ),
+    "docs": (
+        "<html><head><title>Docs</title></head><body><main><h1>API Reference</h1>"
+        + _PARAGRAPH * 5
+        + "<pre><code class='language-python'>def fetch(url):\n    return url\n"
+        "</code></pre><table><tr><th>Option</th><th>Default</th></tr>"
+        + "".join(f"<tr><td>option_{i}</td><td>{i}</td></tr>" for i in range(40))
+        + "</table></main></body></html>"
+    ),
+    "spa": (
+        "<html><head><title>App</title></head><body><div id='root'></div>"
+        "<noscript>You need to enable JavaScript to run this app.</noscript>"
+        "<script src='/static/js/main.js'></script></body></html>"
+    ),
+}
+
+
+@dataclass
+class StubSettings:
+    """Behavior of the stub server.
+
+    Attributes:
+        native_latency: Seconds before a page is served.
+        ai_latency: Seconds before an ``ai`` conversion is answered.
+        browser_latency: Seconds before a ``browser`` conversion is answered.
+        native_markdown: Whether pages are served as markdown when the client
+            asks for ``text/markdown``.
+        payload_kb: Minimum size of each fixture page in KiB; pages are padded
+            with extra paragraphs to reach it. ``0`` keeps them as defined.
+        rate_limit_every: Answer every Nth request with ``429 Too Many
+            Requests``. ``0`` disables injection.
+        retry_after: ``Retry-After`` seconds sent with injected ``429`` responses.
+        markdown_tokens: Whether markdown responses carry ``x-markdown-tokens``.
+    """
+
+    native_latency: float = 0.0
+    ai_latency: float = 0.2
+    browser_latency: float = 1.0
+    native_markdown: bool = False
+    payload_kb: int = 0
+    rate_limit_every: int = 0
+    retry_after: float = 0.0
+    markdown_tokens: bool = True
+
+
+def build_pages(payload_kb: int = 0) -> dict[str, str]:
+    """Return the fixture pages, padded to at least ``payload_kb`` KiB each.
+
+    The ``spa`` page stays an empty JavaScript shell regardless of size.
+    """
+    pages = {}
+    for name, html in PAGES.items():
+        missing = payload_kb * 1024 - len(html)
+        if missing > 0 and name != "spa":
+            padding = _PARAGRAPH * (missing // len(_PARAGRAPH) + 1)
+            html = html.replace("</body>", padding + "</body>", 1)
+        pages[name] = html
+    return pages
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 request handler for the stub server."""
+
+    server: _StubHTTPServer
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        """Silence per-request logging."""
+
+    def _send(self, status: int, headers: dict[str, str], data: bytes) -> None:
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._send(*self.server.respond("GET", self.path, self.headers, b""))
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self._send(*self.server.respond("POST", self.path, self.headers, body))
+
+
+class StubHTTP2Handler(socketserver.BaseRequestHandler):
+    """HTTP/2 request handler speaking h2c with prior knowledge.
+
+    Frames are read on the connection's thread and every completed stream is
+    answered on a thread of its own, so slow responses are multiplexed over
+    the connection instead of queueing behind each other.
+    """
+
+    server: _StubHTTPServer
+
+    def handle(self) -> None:
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self._conn = H2Connection(
+            H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self._cond = threading.Condition()
+        self._closed = False
+        self._streams: dict[int, tuple[dict[str, str], bytearray]] = {}
+        with self._cond:
+            self._conn.initiate_connection()
+            self._flush()
+        try:
+            while data := self.request.recv(65536):
+                with self._cond:
+                    for event in self._conn.receive_data(data):
+                        self._handle_event(event)
+                    self._flush()
+        except OSError:
+            pass
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+
+    def _handle_event(self, event) -> None:
+        from h2 import events
+
+        if isinstance(event, events.RequestReceived):
+            self._streams[event.stream_id] = (dict(event.headers), bytearray())
+        elif isinstance(event, events.DataReceived):
+            self._streams[event.stream_id][1].extend(event.data)
+            self._conn.acknowledge_received_data(
+                event.flow_controlled_length, event.stream_id
+            )
+        elif isinstance(event, events.StreamEnded):
+            headers, body = self._streams.pop(event.stream_id)
+            threading.Thread(
+                target=self._answer,
+                args=(event.stream_id, headers, bytes(body)),
+                daemon=True,
+            ).start()
+        elif isinstance(event, events.StreamReset):
+            self._streams.pop(event.stream_id, None)
+        elif isinstance(event, events.WindowUpdated):
+            self._cond.notify_all()
+
+    def _flush(self) -> None:
+        self.request.sendall(self._conn.data_to_send())
+
+    def _answer(self, stream_id: int, headers: dict[str, str], body: bytes) -> None:
+        from h2.exceptions import H2Error
+
+        status, response_headers, data = self.server.respond(
+            headers[":method"], headers[":path"], headers, body
+        )
+        try:
+            with self._cond:
+                self._conn.send_headers(
+                    stream_id,
+                    [(":status", str(status))]
+                    + [(key.lower(), value) for key, value in response_headers.items()],
+                    end_stream=not data,
+                )
+                self._flush()
+            offset = 0
+            while offset < len(data):
+                with self._cond:
+                    window = self._conn.local_flow_control_window(stream_id)
+                    while window <= 0 and not self._closed:
+                        self._cond.wait(1.0)
+                        window = self._conn.local_flow_control_window(stream_id)
+                    if self._closed:
+                        return
+                    size = min(window, self._conn.max_outbound_frame_size)
+                    chunk = data[offset : offset + size]
+                    offset += len(chunk)
+                    self._conn.send_data(
+                        stream_id, chunk, end_stream=offset >= len(data)
+                    )
+                    self._flush()
+        except (H2Error, OSError):
+            pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog of 5 drops connections at benchmark
+    # concurrency, and the client only retries them about a second later.
+    request_queue_size = 128
+
+    def __init__(self, settings: StubSettings, http2: bool = False):
+        super().__init__(("127.0.0.1", 0), StubHTTP2Handler if http2 else StubHandler)
+        self.settings = settings
+        self.pages = build_pages(settings.payload_kb)
+        self.connections = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+        self._markdown: dict[tuple[str, bool], str] = {}
+
+    def process_request(self, request, client_address) -> None:
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def next_is_rate_limited(self) -> bool:
+        """Count a request and report whether it should get a ``429``."""
+        every = self.settings.rate_limit_every
+        with self._lock:
+            self.requests += 1
+            limited = every > 0 and self.requests % every == 0
+            self.rate_limited += limited
+        return limited
+
+    def markdown(self, name: str, retain_images: bool = False) -> str:
+        """Markdown for a page, converted once and then reused."""
+        key = (name, retain_images)
+        if key not in self._markdown:
+            self._markdown[key] = html_to_markdown(
+                self.pages[name], retain_images=retain_images
+            )
+        return self._markdown[key]
+
+    def respond(
+        self, method: str, path: str, headers: Mapping[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer one request with its status, headers and body.
+
+        Shared by the HTTP/1.1 and HTTP/2 handlers. ``headers`` is looked up
+        with lowercase names.
+        """
+        if method == "GET":
+            status, text, content_type, extra = self._page(path, headers)
+        elif method == "POST":
+            status, text, content_type, extra = self._convert(body)
+        else:
+            status, text, content_type, extra = 405, "Not allowed", "text/plain", {}
+        data = text.encode("utf-8")
+        response_headers = {
+            "Content-Type": f"{content_type}; charset=utf-8",
+            "Content-Length": str(len(data)),
+        }
+        if content_type == "text/markdown" and self.settings.markdown_tokens:
+            response_headers["x-markdown-tokens"] = str(len(text) // 4)
+        response_headers.update(extra)
+        return status, response_headers, data
+
+    def _rate_limited(self) -> tuple[int, str, str, dict[str, str]] | None:
+        """A ``429`` response if this request is due for injection."""
+        if not self.next_is_rate_limited():
+            return None
+        retry_after = f"{self.settings.retry_after:g}"
+        return 429, "Too Many Requests", "text/plain", {"Retry-After": retry_after}
+
+    def _page(
+        self, path: str, headers: Mapping[str, str]
+    ) -> tuple[int, str, str, dict[str, str]]:
+        settings = self.settings
+        name = path.rsplit("/", 1)[-1]
+        if not path.startswith("/pages/") or name not in self.pages:
+            return 404, "Not found", "text/plain", {}
+        time.sleep(settings.native_latency)
+        if limited := self._rate_limited():
+            return limited
+        accept = headers.get("accept", "")
+        if settings.native_markdown and "text/markdown" in accept:
+            return 200, self.markdown(name), "text/markdown", {}
+        return 200, self.pages[name], "text/html", {}
+
+    def _convert(self, body: bytes) -> tuple[int, str, str, dict[str, str]]:
+        settings = self.settings
+        payload = json.loads(body or b"{}")
+        name = urlsplit(payload.get("url", "")).path.rsplit("/", 1)[-1]
+        if name not in self.pages:
+            return 404, "Not found", "text/plain", {}
+        method = payload.get("method", "ai")
+        time.sleep(
+            settings.browser_latency if method == "browser" else settings.ai_latency
+        )
+        if limited := self._rate_limited():
+            return limited
+        markdown = self.markdown(name, retain_images=bool(payload.get("retain_images")))
+        return 200, markdown, "text/markdown", {}
+
+
+class StubServer:
+    """Stub server running on a background thread on a free local port.
+
+    With ``http2`` set, the server speaks HTTP/2 with prior knowledge (h2c)
+    instead of HTTP/1.1; this requires the ``h2`` package.
+    """
+
+    def __init__(self, settings: StubSettings | None = None, http2: bool = False):
+        self.settings = settings or StubSettings()
+        self._server = _StubHTTPServer(self.settings, http2=http2)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="markdown-stub", daemon=True
+        )
+
+    @property
+    def endpoint(self) -> str:
+        """Base URL, usable as ``MarkdownFetcherConfig.endpoint``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page_url(self, name: str) -> str:
+        """URL of a fixture page."""
+        return f"{self.endpoint}pages/{name}"
+
+    @property
+    def requests(self) -> int:
+        """Requests counted so far, including injected ``429`` responses."""
+        return self._server.requests
+
+    @property
+    def connections(self) -> int:
+        """Client connections accepted so far."""
+        return self._server.connections
+
+    @property
+    def rate_limited(self) -> int:
+        """Requests answered with an injected ``429``."""
+        return self._server.rate_limited
+
+    def __enter__(self) -> StubServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
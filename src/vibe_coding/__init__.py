@@ -2,16 +2,20 @@
 
 This package provides utilities and patterns for AI-assisted development projects.
 
+Subpackages and the names below are loaded on first access (PEP 562), so
+``import vibe_coding`` stays cheap for short-lived CLI and pipeline runs.
+
 Example:
     >>> from vibe_coding import config
     >>> cfg = config.get_config()
     >>> value = cfg.get('KEY', 'default')
 """
 
-__version__ = "0.1.0"
+from typing import TYPE_CHECKING
+
+from vibe_coding._lazy import attach
 
-from vibe_coding.config import Config, get_config, load_env_file
-from vibe_coding.utils.logging import get_logger, setup_logging
+__version__ = "0.1.0"
 
 __all__ = [
     "Config",
@@ -20,3 +24,19 @@ __all__ = [
     "get_logger",
     "setup_logging",
 ]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["api", "config", "core", "data", "models", "pipelines", "utils"],
+    attributes={
+        "Config": "config",
+        "get_config": "config",
+        "load_env_file": "config",
+        "get_logger": "utils.logging",
+        "setup_logging": "utils.logging",
+    },
+)
+
+if TYPE_CHECKING:
+    from vibe_coding.config import Config, get_config, load_env_file
+    from vibe_coding.utils.logging import get_logger, setup_logging
@@ -0,0 +1,54 @@
+"""Lazy attribute loading for ``vibe_coding`` packages (PEP 562).
+
+Packages expose their submodules and selected names without importing them
+up front; the module is imported on first attribute access and the value is
+cached in the package namespace, so later lookups cost nothing. This keeps
+short-lived CLI and pipeline runs from paying for FastAPI, pydantic or
+requests when they do not use them.
+
+Example:
+    >>> __getattr__, __dir__ = attach(
+    ...     __name__, submodules=["config"], attributes={"settings": "config"}
+    ... )
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def attach(
+    package: str,
+    submodules: Iterable[str] = (),
+    attributes: Mapping[str, str] | None = None,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        submodules: Submodules importable as attributes, e.g. ``"config"``.
+        attributes: Names mapped to the submodule that defines them, e.g.
+            ``{"Config": "config"}``.
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package's ``__init__``.
+    """
+    submodules = frozenset(submodules)
+    attributes = dict(attributes or {})
+
+    def _getattr(name: str) -> Any:
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name in attributes:
+            module = importlib.import_module(f"{package}.{attributes[name]}")
+            value = getattr(module, name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def _dir() -> list[str]:
+        loaded = vars(sys.modules[package])
+        return sorted(set(loaded) | submodules | attributes.keys())
+
+    return _getattr, _dir
@@ -0,0 +1,11 @@
+"""API service; ``app`` and the submodules are imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["endpoints", "main"],
+    attributes={
+        "app": "main",
+    },
+)
@@ -0,0 +1,8 @@
+"""API endpoint routers, imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["predict"],
+)
@@ -7,12 +7,35 @@ Example usage:
     >>> from vibe_coding.config import get_config
     >>> config = get_config()
     >>> database_url = config.get('DATABASE_URL', 'sqlite:///default.db')
+
+For hot paths such as request handlers, a snapshot config resolves every value
+once and caches typed conversions; call ``refresh()`` to pick up changes:
+    >>> config = Config(snapshot=True)
+    >>> port = config.get_int('PORT', 8080)  # a dictionary lookup
+
+Long-running workers can pick up .env edits without restarting:
+    >>> config = Config(reload_interval=5.0)
+    >>> config.on_change(lambda cfg, changed: print(sorted(changed)))
+
+To merge several sources with explicit precedence (later sources win):
+    >>> config = LayeredConfig(".env", ".env.local", "config.toml", os.environ)
+    >>> db = config.section("DB_")
+    >>> db.get_int("PORT", 5432)  # DB_PORT
 """
 
+import logging
 import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = ("true", "1", "yes", "on")
+_INVALID = object()
+
 
 def load_env_file(filepath: Path | str) -> dict[str, str]:
     """Load environment variables from a .env file.
@@ -43,36 +66,320 @@ def load_env_file(filepath: Path | str) -> dict[str, str]:
     return env_vars
 
 
+def load_config_file(filepath: Path | str) -> dict[str, Any]:
+    """Load key-value pairs from a .env, TOML or JSON file.
+
+    Files ending in ``.toml`` or ``.json`` are parsed as such; anything else
+    (``.env``, ``.env.local``, ``prod.env``) is read with ``load_env_file``.
+    Keys from TOML and JSON are upper-cased and nested tables are joined with
+    underscores, so ``[db] host = "x"`` becomes ``DB_HOST``. Values keep
+    their parsed types.
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        Dictionary of key-value pairs, empty if the file does not exist
+
+    Raises:
+        ValueError: If a JSON file does not hold an object
+        ImportError: If a TOML file is read on Python < 3.11 without tomli
+    """
+    filepath = Path(filepath)
+    suffix = filepath.suffix.lower()
+    if suffix not in (".toml", ".json"):
+        return load_env_file(filepath)
+    if not filepath.exists():
+        return {}
+
+    # Parsers are imported here to keep ``import vibe_coding.config`` cheap.
+    if suffix == ".toml":
+        try:
+            import tomllib
+        except ModuleNotFoundError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ModuleNotFoundError as e:
+                raise ImportError(
+                    "Reading TOML config needs Python 3.11+ or tomli. "
+                    "Install it with: uv add tomli"
+                ) from e
+        with open(filepath, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        import json
+
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{filepath} must hold a JSON object")
+    return _flatten(data)
+
+
+def _flatten(data: Mapping[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten nested tables into upper-cased, underscore-joined keys."""
+    flat: dict[str, Any] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}".upper()
+        if isinstance(value, Mapping):
+            flat.update(_flatten(value, f"{name}_"))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _default_env_file() -> Path:
+    """Return the .env file in the project root."""
+    return Path(__file__).parent.parent.parent / ".env"
+
+
+class EnvFile:
+    """Parsed contents of one .env file, shared by every Config view on it.
+
+    The file is parsed on creation and again only when ``reload`` finds its
+    modification time or size changed, so views with different prefixes or
+    modes never parse it twice. ``values`` is replaced, never mutated.
+
+    Attributes:
+        path: Path to the .env file
+        values: Parsed key-value pairs
+        version: Incremented on every parse, so views can tell they are stale
+    """
+
+    def __init__(self, path: Path | str):
+        """Parse the file.
+
+        Args:
+            path: Path to the .env file (a missing file has no values)
+        """
+        self.path = Path(path)
+        self.values: dict[str, str] = {}
+        self.version = 0
+        self._signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+        self.reload(force=True)
+
+    def reload(self, force: bool = False) -> bool:
+        """Re-parse the file if its mtime or size changed.
+
+        Args:
+            force: Re-parse even if the file looks unchanged
+
+        Returns:
+            True if the file was parsed
+        """
+        with self._lock:
+            signature = self._stat()
+            if not force and signature == self._signature:
+                return False
+            # Stat before reading, so a write racing the read is seen as a
+            # change on the next check rather than missed.
+            self._signature = signature
+            self.values = load_env_file(self.path)
+            self.version += 1
+        return True
+
+    def _stat(self) -> tuple[int, int] | None:
+        """Modification time and size of the file, or None if missing."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _after_fork(self) -> None:
+        """Replace the lock, which another thread may have held at fork."""
+        self._lock = threading.Lock()
+
+
+class _Snapshot:
+    """Resolved values of a snapshot ``Config`` plus their typed conversions.
+
+    Replaced as a whole on refresh, so readers never mix old and new values.
+    """
+
+    __slots__ = ("values", "bools", "ints")
+
+    def __init__(self, values: dict[str, str]):
+        self.values = values
+        self.bools: dict[str, bool] = {}
+        self.ints: dict[str, Any] = {}
+
+
 class Config:
     """Configuration manager that reads from environment and config files.
 
     This class provides a unified interface for accessing configuration values
     from multiple sources with priority: environment variables > config files
 
+    By default every lookup reads the environment, so changes made with
+    ``os.environ`` are seen immediately. In snapshot mode all sources are
+    resolved once into a dictionary and typed values are cached, which makes
+    lookups on hot paths cheap; ``refresh()`` rebuilds the snapshot.
+
+    With ``reload_interval`` set, lookups also check the .env file's
+    modification time and size, at most once per interval, and reload the
+    configuration when either changed. Callbacks registered with
+    ``on_change`` are called after each reload that changed a value.
+    Replace the file atomically (write a temporary file, then rename it) so
+    a check never parses a half-written file.
+
+    Pass an ``EnvFile`` instead of a path to share one parsed file between
+    several views; ``get_config`` does this for you.
+
     Attributes:
         env_file: Path to the .env file to load
         prefix: Optional prefix for environment variables
+        snapshot: Whether lookups are served from a frozen snapshot
+        reload_interval: Minimum seconds between .env change checks, or
+            ``None`` to disable hot reloading
     """
 
-    def __init__(self, env_file: Path | str | None = None, prefix: str = ""):
+    def __init__(
+        self,
+        env_file: Path | str | EnvFile | None = None,
+        prefix: str = "",
+        snapshot: bool = False,
+        reload_interval: float | None = None,
+    ):
         """Initialize configuration manager.
 
         Args:
-            env_file: Path to .env file (default: .env in project root)
+            env_file: Path to .env file (default: .env in project root), or
+                an already parsed ``EnvFile`` to share
             prefix: Optional prefix for environment variables
+            snapshot: Resolve values once instead of on every lookup
+            reload_interval: Check the .env file for changes at most once
+                per this many seconds during lookups
         """
         self.prefix = prefix
-        self._config = {}
+        self.snapshot = snapshot
+        self.reload_interval = reload_interval
+
+        if not isinstance(env_file, EnvFile):
+            env_file = EnvFile(_default_env_file() if env_file is None else env_file)
+        self._env = env_file
+        self.env_file = env_file.path
+
+        self._config: dict[str, str] = {}
+        self._snapshot: _Snapshot | None = None
+        self._version = 0
+        self._callbacks: list[Callable[[Config, set[str]], None]] = []
+        self._reload_lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._next_check = 0.0
+        self._apply()
+
+    def refresh(self) -> set[str]:
+        """Re-read the .env file and, in snapshot mode, rebuild the snapshot.
+
+        The new values replace the old ones in a single assignment, so
+        concurrent readers see either the old or the new configuration.
+        Change callbacks are called if any value changed.
 
-        # Default to .env in project root
-        if env_file is None:
-            project_root = Path(__file__).parent.parent.parent
-            env_file = project_root / ".env"
-        else:
-            env_file = Path(env_file)
+        Returns:
+            Keys whose values were added, changed or removed
+        """
+        self._env.reload(force=True)
+        return self._apply()
+
+    def reload_if_changed(self) -> bool:
+        """Reload the configuration if the .env file's mtime or size changed.
+
+        Also picks up a reload of a shared ``EnvFile`` done through another
+        view.
 
-        # Load from .env file
-        self._config.update(load_env_file(env_file))
+        Returns:
+            True if the configuration was reloaded
+        """
+        self._env.reload()
+        if self._env.version == self._version:
+            return False
+        self._apply()
+        return True
+
+    def _apply(self) -> set[str]:
+        """Rebuild this view from the ``EnvFile`` and notify callbacks."""
+        with self._reload_lock:
+            old = self._values()
+            # Version first: a parse racing this read leaves the view marked
+            # stale, so it is rebuilt again rather than missed.
+            version = self._env.version
+            config = self._env.values
+            if self.snapshot:
+                self._snapshot = _Snapshot(self._resolve(config))
+            self._config = config
+            self._version = version
+            new = self._values()
+            callbacks = list(self._callbacks)
+
+        keys = old.keys() | new.keys()
+        changed = {key for key in keys if old.get(key) != new.get(key)}
+        if changed:
+            for callback in callbacks:
+                try:
+                    callback(self, changed)
+                except Exception:
+                    logger.exception("Config change callback %r failed", callback)
+        return changed
+
+    def on_change(
+        self, callback: Callable[["Config", set[str]], None]
+    ) -> Callable[["Config", set[str]], None]:
+        """Register a callback called with ``(config, changed_keys)`` on reload.
+
+        Returns the callback, so this can be used as a decorator.
+
+        Example:
+            >>> @config.on_change
+            ... def log_change(config, changed):
+            ...     print(f"Reloaded: {sorted(changed)}")
+        """
+        with self._reload_lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def _values(self) -> dict[str, str]:
+        """Current resolved values in snapshot mode, else the file values."""
+        if self._snapshot is not None:
+            return self._snapshot.values
+        return self._config
+
+    def _maybe_reload(self) -> None:
+        """Check the .env file for changes if the reload interval elapsed."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        # Only one thread checks; the others keep reading the current values.
+        if not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = now + self.reload_interval
+            self.reload_if_changed()
+        except OSError:
+            # Keep serving the current values; the next check retries.
+            logger.warning("Could not reload %s", self.env_file, exc_info=True)
+        finally:
+            self._check_lock.release()
+
+    def _after_fork(self) -> None:
+        """Replace locks that another thread may have held at fork."""
+        self._reload_lock = threading.Lock()
+        self._check_lock = threading.Lock()
+
+    def _resolve(self, config: dict[str, str]) -> dict[str, str]:
+        """Resolve file and environment values with ``get``'s precedence."""
+        values = dict(config)
+        environ = dict(os.environ)
+        values.update((key, value) for key, value in environ.items() if value)
+        if self.prefix:
+            start = len(self.prefix)
+            values.update(
+                (key[start:], value)
+                for key, value in environ.items()
+                if value and key.startswith(self.prefix) and len(key) > start
+            )
+        return values
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
@@ -94,6 +401,11 @@ class Config:
             >>> config = Config()
             >>> value = config.get('DATABASE_URL', 'sqlite:///default.db')
         """
+        if self.reload_interval is not None:
+            self._maybe_reload()
+        if self._snapshot is not None:
+            return self._snapshot.values.get(key, default)
+
         # Check environment with prefix first
         if self.prefix:
             env_key = f"{self.prefix}{key}"
@@ -123,8 +435,21 @@ class Config:
         Example:
             >>> debug = config.get_bool('DEBUG', False)
         """
+        if self.reload_interval is not None:
+            self._maybe_reload()
+        snapshot = self._snapshot
+        if snapshot is not None:
+            cached = snapshot.bools.get(key)
+            if cached is not None:
+                return cached
+            if key not in snapshot.values:
+                return str(default).lower() in _TRUE_VALUES
+            parsed = snapshot.values[key].lower() in _TRUE_VALUES
+            snapshot.bools[key] = parsed
+            return parsed
+
         value = self.get(key, str(default).lower())
-        return value.lower() in ("true", "1", "yes", "on")
+        return value.lower() in _TRUE_VALUES
 
     def get_int(self, key: str, default: int = 0) -> int:
         """Get an integer configuration value.
@@ -139,24 +464,292 @@ class Config:
         Example:
             >>> port = config.get_int('PORT', 8080)
         """
+        if self.reload_interval is not None:
+            self._maybe_reload()
+        snapshot = self._snapshot
+        if snapshot is not None:
+            if key not in snapshot.values:
+                return default
+            cached = snapshot.ints.get(key)
+            if cached is None:
+                try:
+                    cached = int(snapshot.values[key])
+                except ValueError:
+                    cached = _INVALID
+                snapshot.ints[key] = cached
+            return default if cached is _INVALID else cached
+
         try:
             return int(self.get(key, default))
         except (ValueError, TypeError):
             return default
 
 
-# Global config instance for convenience
-_config_instance: Config | None = None
+ConfigSource = Path | str | Mapping[str, Any]
+
+
+def default_sources() -> list[ConfigSource]:
+    """Sources of the shared layered config, lowest precedence first.
+
+    ``.env``, ``.env.local`` and ``config.toml`` in the project root, then the
+    environment. Missing files are skipped.
+    """
+    root = _default_env_file().parent
+    return [root / ".env", root / ".env.local", root / "config.toml", os.environ]
 
 
-def get_config(env_file: Path | str | None = None, prefix: str = "") -> Config:
-    """Get the global configuration instance.
+class ConfigSection:
+    """Typed, read-only view on a ``LayeredConfig`` under a key prefix.
 
-    This function returns a singleton Config instance for convenience.
+    ``section.get("HOST")`` looks up ``<prefix>HOST`` in the resolution table.
+    Sections see reloads of the config they were taken from, and share its
+    cache of typed conversions.
+
+    Attributes:
+        prefix: Key prefix of this view
+    """
+
+    def __init__(self, root: "LayeredConfig", prefix: str = ""):
+        """Initialize the view.
+
+        Args:
+            root: Config holding the resolution table
+            prefix: Key prefix of this view
+        """
+        self._root = root
+        self.prefix = prefix
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a configuration value.
+
+        Args:
+            key: Configuration key name, without this view's prefix
+            default: Default value if key not found
+
+        Returns:
+            Configuration value or default
+        """
+        return self._root._snapshot.values.get(self.prefix + key, default)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Get a boolean configuration value.
+
+        Args:
+            key: Configuration key name, without this view's prefix
+            default: Default boolean value
+
+        Returns:
+            Boolean value (True for 'true', '1', 'yes', 'on' and true booleans)
+        """
+        snapshot = self._root._snapshot
+        key = self.prefix + key
+        cached = snapshot.bools.get(key)
+        if cached is not None:
+            return cached
+        if key not in snapshot.values:
+            return default
+        value = snapshot.values[key]
+        parsed = (
+            value if isinstance(value, bool) else str(value).lower() in _TRUE_VALUES
+        )
+        snapshot.bools[key] = parsed
+        return parsed
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        """Get an integer configuration value.
+
+        Args:
+            key: Configuration key name, without this view's prefix
+            default: Default integer value
+
+        Returns:
+            Integer value or default if conversion fails
+        """
+        snapshot = self._root._snapshot
+        key = self.prefix + key
+        if key not in snapshot.values:
+            return default
+        cached = snapshot.ints.get(key)
+        if cached is None:
+            try:
+                cached = int(snapshot.values[key])
+            except (ValueError, TypeError):
+                cached = _INVALID
+            snapshot.ints[key] = cached
+        return default if cached is _INVALID else cached
+
+    def section(self, prefix: str) -> "ConfigSection":
+        """Return a nested view, e.g. ``config.section("DB_").section("RO_")``."""
+        return ConfigSection(self._root, self.prefix + prefix)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Values under this view's prefix, with the prefix stripped."""
+        start = len(self.prefix)
+        return {
+            key[start:]: value
+            for key, value in self._root._snapshot.values.items()
+            if key.startswith(self.prefix)
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        return self._root._snapshot.values[self.prefix + key]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.prefix + key in self._root._snapshot.values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.as_dict())
+
+
+class LayeredConfig(ConfigSection):
+    """Configuration merged from several sources into one resolution table.
+
+    Sources are files (.env, TOML or JSON, see ``load_config_file``) or
+    mappings such as ``os.environ``, listed lowest precedence first: a key
+    takes its value from the last source that defines it. The table is built
+    once, so every lookup is a dictionary hit; ``reload()`` rebuilds it and
+    swaps it in a single assignment. Empty environment variables count as
+    unset, as in ``Config``.
+
+    Attributes:
+        sources: Sources in order of increasing precedence
+
+    Example:
+        >>> config = LayeredConfig("base.toml", ".env", os.environ)
+        >>> config.get("PROJECT_NAME")
+        >>> config.section("DB_").get("HOST")
+    """
+
+    def __init__(self, *sources: ConfigSource):
+        """Resolve the sources.
+
+        Args:
+            *sources: Sources, lowest precedence first. Defaults to
+                ``default_sources()``
+        """
+        super().__init__(self)
+        self.sources = list(sources) if sources else default_sources()
+        self._snapshot = _Snapshot({})
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read every source and swap in the new resolution table."""
+        table: dict[str, Any] = {}
+        for source in self.sources:
+            if source is os.environ:
+                table.update((key, value) for key, value in source.items() if value)
+            elif isinstance(source, Mapping):
+                table.update(source)
+            else:
+                table.update(load_config_file(source))
+        self._snapshot = _Snapshot(table)
+
+
+class ConfigRegistry:
+    """Thread-safe cache of Config views shared across a process.
+
+    Views are keyed by the resolved .env path, the prefix and the lookup
+    mode. Each .env file is parsed once, and its ``EnvFile`` is shared by
+    every view on it, so asking for another prefix costs no parsing. After
+    ``os.fork`` the child replaces every lock, which another thread may have
+    held at fork time, and keeps the already parsed values.
+
+    Example:
+        >>> registry = ConfigRegistry()
+        >>> db = registry.get(prefix="DB_")
+        >>> api = registry.get(prefix="API_")  # shares the parsed .env
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._files: dict[Path, EnvFile] = {}
+        self._configs: dict[tuple[Path, str, bool, float | None], Config] = {}
+        self._layered: LayeredConfig | None = None
+
+    def get(
+        self,
+        env_file: Path | str | None = None,
+        prefix: str = "",
+        snapshot: bool = False,
+        reload_interval: float | None = None,
+    ) -> Config:
+        """Return the view for these arguments, creating it on first use.
+
+        Args:
+            env_file: Path to .env file (default: .env in project root)
+            prefix: Optional prefix for environment variables
+            snapshot: Resolve values once instead of on every lookup
+            reload_interval: Check the .env file for changes at most once
+                per this many seconds during lookups
+
+        Returns:
+            Config instance shared by every caller passing the same arguments
+        """
+        path = Path(_default_env_file() if env_file is None else env_file).resolve()
+        key = (path, prefix, snapshot, reload_interval)
+        config = self._configs.get(key)
+        if config is None:
+            with self._lock:
+                config = self._configs.get(key)
+                if config is None:
+                    env = self._files.get(path)
+                    if env is None:
+                        env = self._files[path] = EnvFile(path)
+                    config = Config(env, prefix, snapshot, reload_interval)
+                    self._configs[key] = config
+        return config
+
+    def layered(self) -> LayeredConfig:
+        """Return the shared ``LayeredConfig`` over ``default_sources()``."""
+        layered = self._layered
+        if layered is None:
+            with self._lock:
+                if self._layered is None:
+                    self._layered = LayeredConfig()
+                layered = self._layered
+        return layered
+
+    def clear(self) -> None:
+        """Forget every view, parsed file and the shared layered config."""
+        with self._lock:
+            self._files.clear()
+            self._configs.clear()
+            self._layered = None
+
+    def _after_fork(self) -> None:
+        """Replace every lock in the child process after ``os.fork``."""
+        self._lock = threading.Lock()
+        for env in self._files.values():
+            env._after_fork()
+        for config in self._configs.values():
+            config._after_fork()
+
+
+# Process-wide registry used by get_config
+_registry = ConfigRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._after_fork)
+
+
+def get_config(
+    env_file: Path | str | None = None,
+    prefix: str = "",
+    snapshot: bool = False,
+    reload_interval: float | None = None,
+) -> Config:
+    """Get the shared configuration instance for these arguments.
+
+    Instances are cached per .env file, prefix and mode, and views on the
+    same file share its parsed contents. Safe to call from several threads.
 
     Args:
         env_file: Path to .env file
         prefix: Optional prefix for environment variables
+        snapshot: Resolve values once instead of on every lookup
+        reload_interval: Check the .env file for changes at most once per
+            this many seconds during lookups
 
     Returns:
         Config instance
@@ -165,7 +758,20 @@ def get_config(env_file: Path | str | None = None, prefix: str = "") -> Config:
         >>> config = get_config()
         >>> value = config.get('API_KEY')
     """
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config(env_file, prefix)
-    return _config_instance
+    return _registry.get(env_file, prefix, snapshot, reload_interval)
+
+
+def get_layered_config() -> LayeredConfig:
+    """Get the shared layered configuration over ``default_sources()``.
+
+    ``vibe_coding.core.config.Settings`` is populated from the same table, so
+    both see identical values.
+
+    Returns:
+        LayeredConfig instance
+
+    Example:
+        >>> db = get_layered_config().section("DB_")
+        >>> host = db.get("HOST", "localhost")
+    """
+    return _registry.layered()
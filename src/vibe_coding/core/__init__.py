@@ -0,0 +1,12 @@
+"""Core settings; ``settings`` and the submodules are imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["config"],
+    attributes={
+        "Settings": "config",
+        "settings": "config",
+    },
+)
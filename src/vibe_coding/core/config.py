@@ -1,8 +1,63 @@
 """
 Configuration for the project.
+
+Settings are populated from the shared layered configuration
+(``vibe_coding.config.get_layered_config``) rather than by pydantic-settings
+reading the environment and .env files itself, so ``Settings`` and
+``LayeredConfig`` always agree and each source is parsed once.
 """
 
-from pydantic_settings import BaseSettings
+from typing import Any
+
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+)
+
+from vibe_coding.config import LayeredConfig, get_layered_config
+
+
+class LayeredSettingsSource(PydanticBaseSettingsSource):
+    """
+    Settings source reading fields from a ``LayeredConfig`` resolution table.
+
+    Field names are looked up with the model's ``env_prefix``, and case
+    insensitively unless ``case_sensitive`` is set. String values of complex
+    fields (lists, dicts, models) are decoded as JSON, as for environment
+    variables.
+    """
+
+    def __init__(
+        self,
+        settings_cls: type[BaseSettings],
+        layered: LayeredConfig | None = None,
+    ):
+        super().__init__(settings_cls)
+        self.layered = get_layered_config() if layered is None else layered
+        self._folded: dict[str, Any] | None = None
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> tuple[Any, str, bool]:
+        key = f"{self.config.get('env_prefix', '')}{field_name}"
+        if key in self.layered or self.config.get("case_sensitive", False):
+            return self.layered.get(key), key, False
+        if self._folded is None:
+            self._folded = {
+                name.lower(): value for name, value in self.layered.as_dict().items()
+            }
+        return self._folded.get(key.lower()), key, False
+
+    def __call__(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for field_name, field in self.settings_cls.model_fields.items():
+            value, key, is_complex = self.get_field_value(field, field_name)
+            if isinstance(value, str):
+                value = self.prepare_field_value(field_name, field, value, is_complex)
+            if value is not None:
+                data[field.alias or field_name] = value
+        return data
 
 
 class Settings(BaseSettings):
@@ -13,5 +68,21 @@ class Settings(BaseSettings):
     # Example setting
     PROJECT_NAME: str = "Vibe Coding Data Science Template"
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        # The layered table already holds the environment and .env files.
+        return (
+            init_settings,
+            LayeredSettingsSource(settings_cls),
+            file_secret_settings,
+        )
+
 
 settings = Settings()
@@ -0,0 +1,8 @@
+"""Dataset creation and feature processing, imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["make_dataset", "process_features"],
+)
@@ -0,0 +1,8 @@
+"""Model training, evaluation and prediction, imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["evaluate_model", "predict_model", "train_model"],
+)
@@ -0,0 +1,8 @@
+"""Training and prediction pipelines, imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["prediction_pipeline", "training_pipeline"],
+)
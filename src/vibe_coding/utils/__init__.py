@@ -0,0 +1,23 @@
+"""Utility modules, imported on first access."""
+
+from vibe_coding._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "html_to_markdown",
+        "log_queue",
+        "logging",
+        "markdown_cache",
+        "markdown_chunker",
+        "markdown_crawler",
+        "markdown_fetcher",
+        "markdown_fetcher_async",
+        "markdown_metrics",
+        "markdown_policies",
+        "markdown_refresh",
+        "markdown_search",
+        "markdown_store",
+        "markdown_transport",
+    ],
+)
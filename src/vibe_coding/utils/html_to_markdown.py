@@ -0,0 +1,515 @@
+"""Offline HTML to Markdown conversion.
+
+This module converts HTML to Markdown in-process with the standard library's
+incremental ``html.parser``, so simple static pages do not need a round trip
+to markdown.new. It backs the ``local`` tier of the markdown fetcher.
+
+Supported elements:
+
+- Headings, paragraphs, line breaks and horizontal rules
+- Ordered and unordered lists, including nesting
+- Links (resolved against a base URL) and, optionally, images
+- Inline code and fenced code blocks with a language from ``language-*``
+- Emphasis, block quotes and tables
+
+Scripts, styles and other non-content elements are dropped. Pages that render
+their content with JavaScript convert to little or no text, which
+``HtmlConversion.is_adequate`` detects so callers can fall back to a remote
+renderer.
+
+Example:
+    >>> from vibe_coding.utils.html_to_markdown import html_to_markdown
+    >>> html_to_markdown("<h1>Title</h1><p>Hello <b>world</b></p>")
+    '# Title\\n\\nHello **world**\\n'
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+MIN_TEXT_CHARS = 200
+
+_SKIP_TAGS = frozenset(
+    {
+        "canvas",
+        "head",
+        "iframe",
+        "noscript",
+        "script",
+        "style",
+        "svg",
+        "template",
+        "title",
+    }
+)
+_BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "dd",
+        "details",
+        "div",
+        "dl",
+        "dt",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "header",
+        "main",
+        "nav",
+        "p",
+        "section",
+        "summary",
+    }
+)
+_LINE_BREAK = "\x00"
+_EMPHASIS = {"b": "**", "strong": "**", "i": "*", "em": "*", "s": "~~", "del": "~~"}
+_JS_NOTICE = re.compile(r"enable javascript|requires javascript", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_BACKTICKS = re.compile(r"`+")
+
+
+@dataclass
+class HtmlConversion:
+    """Result of converting an HTML document.
+
+    Attributes:
+        markdown: Converted Markdown text.
+        title: Contents of the ``<title>`` element, if any.
+        text_chars: Number of visible text characters in the document.
+        script_count: Number of ``<script>`` elements.
+        js_notice: Whether a ``<noscript>`` block asks for JavaScript.
+    """
+
+    markdown: str
+    title: str | None
+    text_chars: int
+    script_count: int
+    js_notice: bool
+
+    def is_adequate(self, min_text_chars: int = MIN_TEXT_CHARS) -> bool:
+        """Whether the conversion looks like the real page content.
+
+        A page that has almost no visible text, or that asks for JavaScript
+        and has little text, is most likely rendered client-side.
+
+        Args:
+            min_text_chars: Minimum visible text characters.
+
+        Returns:
+            True if the conversion can be used instead of a remote renderer.
+        """
+        if self.text_chars < min_text_chars:
+            return False
+        return not (self.js_notice and self.text_chars < 5 * min_text_chars)
+
+
+@dataclass
+class _Block:
+    """A rendered block with the context needed to join it to its neighbors."""
+
+    text: str
+    quote_depth: int
+    list_id: int
+
+
+class MarkdownConverter(HTMLParser):
+    """Incremental HTML to Markdown converter.
+
+    Feed HTML with ``feed`` as it arrives, then call ``finish`` once to get
+    the result. Memory use is proportional to the Markdown output, not to the
+    HTML input.
+
+    Example:
+        >>> converter = MarkdownConverter(base_url="https://example.com/docs/")
+        >>> for chunk in chunks:
+        ...     converter.feed(chunk)
+        >>> result = converter.finish()
+    """
+
+    def __init__(self, base_url: str | None = None, retain_images: bool = False):
+        """Initialize the converter.
+
+        Args:
+            base_url: URL the HTML was fetched from, used to resolve relative
+                links and image sources.
+            retain_images: Whether to emit images as Markdown image links.
+        """
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.retain_images = retain_images
+        self._blocks: list[_Block] = []
+        self._inline: list[str] = []
+        self._skip_depth = 0
+        self._quote_depth = 0
+        # One entry per open list: [ordered, next number]
+        self._lists: list[list] = []
+        self._list_id = 0
+        self._item_marker: str | None = None
+        self._item_indent = ""
+        self._links: list[tuple[int, str | None]] = []
+        self._codes: list[int] = []
+        self._pre: list[str] | None = None
+        self._pre_language = ""
+        self._table: list[list[str]] | None = None
+        self._table_depth = 0
+        self._cell: list[str] | None = None
+        self._heading: int | None = None
+        self._title: list[str] | None = None
+        self.title: str | None = None
+        self.text_chars = 0
+        self.script_count = 0
+        self.js_notice = False
+
+    # -- helpers -----------------------------------------------------------
+
+    @property
+    def _buffer(self) -> list[str]:
+        """Return the buffer inline content is currently written to."""
+        return self._cell if self._cell is not None else self._inline
+
+    def _resolve(self, url: str | None) -> str | None:
+        """Resolve a link target against the base URL, dropping scripts."""
+        if not url or url.strip().lower().startswith(("javascript:", "data:")):
+            return None
+        return urljoin(self.base_url, url.strip()) if self.base_url else url.strip()
+
+    def _emit(self, text: str) -> None:
+        """Append a finished block, applying list and quote prefixes."""
+        lines = text.split("\n")
+        if self._item_marker is not None:
+            first = self._item_indent + self._item_marker
+            rest = self._item_indent + " " * len(self._item_marker)
+            lines = [first + lines[0]] + [
+                rest + line if line else "" for line in lines[1:]
+            ]
+            self._item_marker = None
+        elif self._lists:
+            rest = self._item_indent + " " * self._marker_width()
+            lines = [rest + line if line else "" for line in lines]
+        if self._quote_depth:
+            quote = "> " * self._quote_depth
+            lines = [(quote + line).rstrip() for line in lines]
+        self._blocks.append(
+            _Block(
+                "\n".join(lines),
+                self._quote_depth,
+                self._list_id if self._lists else 0,
+            )
+        )
+
+    def _marker_width(self) -> int:
+        """Return the width of the innermost list's item marker."""
+        ordered, number = self._lists[-1]
+        return len(f"{number - 1}. ") if ordered else 2
+
+    def _flush(self) -> None:
+        """Emit the pending inline text as a block."""
+        text = _WHITESPACE.sub(" ", "".join(self._inline))
+        lines = [line.strip() for line in text.split(_LINE_BREAK)]
+        self._inline = []
+        while lines and not lines[-1]:
+            lines.pop()
+        while lines and not lines[0]:
+            lines.pop(0)
+        if not lines:
+            return
+        if self._heading is not None:
+            # A heading is a single line, so breaks in it become spaces.
+            self._emit("#" * self._heading + " " + " ".join(filter(None, lines)))
+            return
+        # A backslash before the newline keeps it a hard line break; trailing
+        # spaces would be stripped by quote prefixes and most editors.
+        self._emit("\\\n".join(lines))
+
+    # -- parser callbacks --------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script":
+            self.script_count += 1
+        if tag == "title" and self._title is None and self.title is None:
+            self._title = []
+        if tag == "body":
+            # Browsers end an unclosed <head> here, so do we.
+            self._skip_depth = 0
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+
+        attributes = dict(attrs)
+        if self._pre is not None:
+            if tag == "code" and not self._pre_language:
+                self._pre_language = _language(attributes.get("class"))
+            return
+
+        if tag == "table":
+            self._table_depth += 1
+            if self._table_depth == 1:
+                self._flush()
+                self._table = []
+            return
+        if self._table is not None and self._table_depth == 1:
+            if tag == "tr":
+                self._table.append([])
+                return
+            if tag in ("td", "th"):
+                if not self._table:
+                    self._table.append([])
+                self._cell = []
+                return
+
+        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._flush()
+            self._heading = int(tag[1])
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+        elif tag == "br":
+            self._buffer.append(_LINE_BREAK if self._cell is None else " ")
+        elif tag == "hr":
+            self._flush()
+            self._emit("---")
+        elif tag == "pre":
+            self._flush()
+            self._pre = []
+            self._pre_language = _language(attributes.get("class"))
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth += 1
+        elif tag in ("ul", "ol"):
+            self._flush()
+            if self._lists:
+                self._item_indent += " " * self._marker_width()
+            else:
+                self._list_id += 1
+            start = attributes.get("start")
+            number = int(start) if start and start.isdigit() else 1
+            self._lists.append([tag == "ol", number])
+        elif tag == "li":
+            self._flush()
+            if self._lists:
+                ordered, number = self._lists[-1]
+                self._item_marker = f"{number}. " if ordered else "- "
+                self._lists[-1][1] = number + 1
+        elif tag in _EMPHASIS:
+            self._buffer.append(_EMPHASIS[tag])
+        elif tag == "code":
+            self._codes.append(len(self._buffer))
+        elif tag == "a":
+            self._links.append(
+                (len(self._buffer), self._resolve(attributes.get("href")))
+            )
+        elif tag == "img" and self.retain_images:
+            src = self._resolve(attributes.get("src"))
+            if src:
+                alt = _WHITESPACE.sub(" ", attributes.get("alt") or "").strip()
+                self._buffer.append(f"![{alt}]({src})")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._title is not None:
+            self.title = _WHITESPACE.sub(" ", "".join(self._title)).strip() or None
+            self._title = None
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if self._skip_depth:
+            return
+
+        if self._pre is not None:
+            if tag == "pre":
+                code = "".join(self._pre).strip("\n")
+                self._pre = None
+                fence = "`" * max(3, _longest_backtick_run(code) + 1)
+                self._emit(f"{fence}{self._pre_language}\n{code}\n{fence}")
+            return
+
+        if tag == "table":
+            self._table_depth = max(self._table_depth - 1, 0)
+            if self._table_depth == 0 and self._table is not None:
+                rows, self._table = self._table, None
+                self._cell = None
+                table = _render_table(rows)
+                if table:
+                    self._emit(table)
+            return
+        if self._table is not None and self._table_depth == 1:
+            if tag in ("td", "th") and self._cell is not None:
+                cell = _WHITESPACE.sub(" ", "".join(self._cell)).strip()
+                self._table[-1].append(cell.replace("|", "\\|"))
+                self._cell = None
+                return
+
+        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._flush()
+            self._heading = None
+        elif tag in _BLOCK_TAGS or tag == "li":
+            self._flush()
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth = max(self._quote_depth - 1, 0)
+        elif tag in ("ul", "ol"):
+            self._flush()
+            if self._lists:
+                self._lists.pop()
+            if self._lists:
+                width = self._marker_width()
+                self._item_indent = self._item_indent[:-width] if width else ""
+            else:
+                self._item_indent = ""
+        elif tag in _EMPHASIS:
+            self._buffer.append(_EMPHASIS[tag])
+        elif tag == "code" and self._codes:
+            buffer = self._buffer
+            start = min(self._codes.pop(), len(buffer))
+            code = "".join(buffer[start:])
+            del buffer[start:]
+            buffer.append(_inline_code(code) if code.strip() else code)
+        elif tag == "a" and self._links:
+            start, href = self._links.pop()
+            buffer = self._buffer
+            start = min(start, len(buffer))
+            text = _WHITESPACE.sub(" ", "".join(buffer[start:])).strip()
+            del buffer[start:]
+            if text and href:
+                buffer.append(f"[{text}]({href})")
+            elif text:
+                buffer.append(text)
+
+    def handle_data(self, data: str) -> None:
+        if self._title is not None:
+            self._title.append(data)
+        if self._skip_depth:
+            if self._skip_depth == 1 and _JS_NOTICE.search(data):
+                self.js_notice = True
+            return
+        if self._pre is not None:
+            self._pre.append(data)
+            self.text_chars += len(data.strip())
+            return
+        self.text_chars += len(data.strip())
+        self._buffer.append(data)
+
+    # -- results -----------------------------------------------------------
+
+    def finish(self) -> HtmlConversion:
+        """Flush remaining input and return the conversion.
+
+        Returns:
+            HtmlConversion with the Markdown and adequacy signals.
+        """
+        self.close()
+        if self._pre is not None:
+            self.handle_endtag("pre")
+        if self._table is not None:
+            self._table_depth = 1
+            self.handle_endtag("table")
+        self._flush()
+        return HtmlConversion(
+            markdown=_join_blocks(self._blocks),
+            title=self.title,
+            text_chars=self.text_chars,
+            script_count=self.script_count,
+            js_notice=self.js_notice,
+        )
+
+
+def _language(class_attr: str | None) -> str:
+    """Return the language from a ``language-*`` or ``lang-*`` class."""
+    for name in (class_attr or "").split():
+        for prefix in ("language-", "lang-"):
+            if name.startswith(prefix):
+                return name[len(prefix) :]
+    return ""
+
+
+def _longest_backtick_run(text: str) -> int:
+    """Return the length of the longest run of backticks in ``text``."""
+    return max((len(run) for run in _BACKTICKS.findall(text)), default=0)
+
+
+def _inline_code(code: str) -> str:
+    """Wrap ``code`` in a backtick string that none of its own runs close."""
+    ticks = "`" * (_longest_backtick_run(code) + 1)
+    if code.startswith("`") or code.endswith("`"):
+        code = f" {code} "
+    return f"{ticks}{code}{ticks}"
+
+
+def _render_table(rows: list[list[str]]) -> str:
+    """Render table rows as a Markdown table, using the first row as header."""
+    rows = [row for row in rows if row]
+    if not rows:
+        return ""
+    width = max(len(row) for row in rows)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * width]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+
+def _join_blocks(blocks: list[_Block]) -> str:
+    """Join rendered blocks with the right separators."""
+    parts: list[str] = []
+    previous: _Block | None = None
+    for block in blocks:
+        if previous is not None:
+            if previous.list_id and previous.list_id == block.list_id:
+                parts.append("\n")
+            elif previous.quote_depth and block.quote_depth:
+                depth = min(previous.quote_depth, block.quote_depth)
+                parts.append("\n" + ">" * depth + "\n")
+            else:
+                parts.append("\n\n")
+        parts.append(block.text)
+        previous = block
+    return "".join(parts) + "\n" if parts else ""
+
+
+def convert_html(
+    html: str | Iterable[str],
+    base_url: str | None = None,
+    retain_images: bool = False,
+) -> HtmlConversion:
+    """Convert an HTML document, or an iterable of HTML chunks, to Markdown.
+
+    Args:
+        html: HTML text, or chunks of it as they are downloaded.
+        base_url: URL the HTML was fetched from, for resolving relative links.
+        retain_images: Whether to emit images as Markdown image links.
+
+    Returns:
+        HtmlConversion with the Markdown and adequacy signals.
+    """
+    converter = MarkdownConverter(base_url=base_url, retain_images=retain_images)
+    for chunk in [html] if isinstance(html, str) else html:
+        converter.feed(chunk)
+    return converter.finish()
+
+
+def html_to_markdown(
+    html: str,
+    base_url: str | None = None,
+    retain_images: bool = False,
+) -> str:
+    """Convert an HTML document to Markdown.
+
+    Args:
+        html: HTML text.
+        base_url: URL the HTML was fetched from, for resolving relative links.
+        retain_images: Whether to emit images as Markdown image links.
+
+    Returns:
+        Markdown text.
+
+    Example:
+        >>> html_to_markdown('<a href="/docs">Docs</a>', "https://example.com")
+        '[Docs](https://example.com/docs)\\n'
+    """
+    return convert_html(html, base_url, retain_images).markdown
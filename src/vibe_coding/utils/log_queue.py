@@ -0,0 +1,133 @@
+"""Bounded queue handler and listener for non-blocking logging.
+
+Used by ``setup_logging(async_mode=True)``: the root logger gets a
+``BoundedQueueHandler`` that only puts records on a bounded queue, and a
+``BlockingQueueListener`` thread hands them to the real handlers. Kept apart
+from ``vibe_coding.utils.logging`` so that importing it stays cheap for code
+that logs synchronously.
+
+Example:
+    >>> log_queue = queue.Queue(maxsize=1000)
+    >>> handler = BoundedQueueHandler(log_queue, overflow="drop_new")
+    >>> listener = BlockingQueueListener(log_queue, logging.StreamHandler())
+    >>> listener.start()
+"""
+
+import logging
+import logging.handlers
+import queue
+import threading
+from dataclasses import dataclass
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_new")
+
+
+def _check_overflow(overflow: str) -> None:
+    """Raise ValueError unless ``overflow`` is one of ``OVERFLOW_POLICIES``."""
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(
+            f"Invalid overflow policy: {overflow!r}. "
+            f"Must be one of {', '.join(OVERFLOW_POLICIES)}"
+        )
+
+
+@dataclass(frozen=True)
+class LogQueueStats:
+    """Counters of an async logging queue.
+
+    Attributes:
+        enqueued: Records put on the queue.
+        blocked: Records whose caller waited because the queue was full.
+        dropped_new: Records discarded because the queue was full.
+        dropped_oldest: Queued records discarded to make room for new ones.
+    """
+
+    enqueued: int
+    blocked: int
+    dropped_new: int
+    dropped_oldest: int
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler applying an overflow policy when its queue is full.
+
+    Policies:
+        block: Wait for the listener to make room. Nothing is lost, but a
+            burst can stall the caller.
+        drop_oldest: Discard the oldest queued record. Keeps recent context
+            and never blocks.
+        drop_new: Discard the record being logged. Never blocks.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "block"):
+        """Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue shared with the listener
+            overflow: One of ``OVERFLOW_POLICIES``
+
+        Raises:
+            ValueError: If ``overflow`` is not a known policy
+        """
+        _check_overflow(overflow)
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self._counts = dict.fromkeys(
+            ("enqueued", "blocked", "dropped_new", "dropped_oldest"), 0
+        )
+        self._count_lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._count_lock:
+            self._counts[name] += 1
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, applying the overflow policy."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == "drop_new":
+                self._count("dropped_new")
+                return
+            if self.overflow == "block":
+                self._count("blocked")
+                self.queue.put(record)
+            elif not self._put_dropping_oldest(record):
+                return
+        self._count("enqueued")
+
+    def _put_dropping_oldest(self, record: logging.LogRecord) -> bool:
+        """Make room by discarding queued records; False if ``record`` was not put."""
+        while True:
+            try:
+                oldest = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if oldest is BlockingQueueListener._sentinel:
+                    # The listener is stopping; keep its stop marker.
+                    self.queue.put(oldest)
+                    self._count("dropped_new")
+                    return False
+                self._count("dropped_oldest")
+            try:
+                self.queue.put_nowait(record)
+                return True
+            except queue.Full:
+                continue
+
+    @property
+    def stats(self) -> LogQueueStats:
+        """Snapshot of the queue counters."""
+        with self._count_lock:
+            return LogQueueStats(**self._counts)
+
+
+class BlockingQueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop sentinel waits for room in a full queue.
+
+    ``QueueListener.stop`` would raise ``queue.Full`` on a bounded queue.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
@@ -7,32 +7,80 @@ Example usage:
     >>> setup_logging()
     >>> logger = get_logger(__name__)
     >>> logger.info("Application started")
+
+In latency-sensitive services, keep handler I/O off the request path:
+    >>> setup_logging(async_mode=True, queue_size=10_000, overflow="drop_oldest")
 """
 
+import atexit
 import logging
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vibe_coding.utils.log_queue import (
+        BlockingQueueListener,
+        BoundedQueueHandler,
+        LogQueueStats,
+    )
+
+# Async logging state: the root queue handler and the listener draining it
+_queue_handler: "BoundedQueueHandler | None" = None
+_listener: "BlockingQueueListener | None" = None
+_state_lock = threading.Lock()
+_atexit_registered = False
 
 
 def setup_logging(
     level: str = "INFO",
     log_file: Path | str | None = None,
     format_string: str | None = None,
+    async_mode: bool = False,
+    queue_size: int = 10_000,
+    overflow: str = "block",
 ) -> None:
     """Configure logging for the application.
 
     Sets up logging to both console and optional file output.
 
+    With ``async_mode``, the root logger only puts records on a bounded queue
+    and a background listener thread owns the console and file handlers, so
+    logging calls no longer wait on stream or disk writes. Queued records are
+    flushed by ``shutdown_logging``, which also runs at interpreter exit.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file
         format_string: Custom format string (uses default if None)
+        async_mode: Hand records to a background thread through a queue
+        queue_size: Maximum number of queued records in async mode
+        overflow: What to do when the queue is full: ``"block"``,
+            ``"drop_oldest"`` or ``"drop_new"`` (see ``BoundedQueueHandler``
+            in ``vibe_coding.utils.log_queue``)
+
+    Raises:
+        ValueError: If ``queue_size`` is not positive or ``overflow`` is unknown
 
     Example:
         >>> setup_logging(level="DEBUG", log_file="app.log")
+        >>> setup_logging(async_mode=True, overflow="drop_new")
     """
+    global _queue_handler, _listener, _atexit_registered
+
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    if async_mode:
+        # Validate before tearing down the current setup or opening files
+        from vibe_coding.utils.log_queue import _check_overflow
+
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        _check_overflow(overflow)
+
+    # Reconfiguring replaces the previous setup; drain its queue first.
+    shutdown_logging()
 
     handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
 
@@ -41,6 +89,32 @@ def setup_logging(
         file_handler.setFormatter(logging.Formatter(format_string))
         handlers.append(file_handler)
 
+    if async_mode:
+        # Imported here: logging.handlers is costly and only async mode needs it
+        import queue
+
+        from vibe_coding.utils.log_queue import (
+            BlockingQueueListener,
+            BoundedQueueHandler,
+        )
+
+        for handler in handlers:
+            handler.setFormatter(logging.Formatter(format_string))
+        queue_handler = BoundedQueueHandler(queue.Queue(queue_size), overflow)
+        # Only merge the message here; the listener's handlers apply the
+        # full format off the calling thread.
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = BlockingQueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        with _state_lock:
+            _queue_handler, _listener = queue_handler, listener
+            if not _atexit_registered:
+                atexit.register(shutdown_logging)
+                _atexit_registered = True
+        listener.start()
+        handlers = [queue_handler]
+
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format=format_string,
@@ -49,6 +123,41 @@ def setup_logging(
     )
 
 
+def shutdown_logging() -> None:
+    """Stop async logging, writing every queued record before returning.
+
+    The queue handler is detached from the root logger first, so nothing is
+    queued after the final flush. Does nothing unless ``setup_logging`` ran
+    with ``async_mode=True``. Safe to call more than once.
+    """
+    global _queue_handler, _listener
+
+    with _state_lock:
+        queue_handler, listener = _queue_handler, _listener
+        _queue_handler = _listener = None
+    if queue_handler is None or listener is None:
+        return
+
+    logging.getLogger().removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        handler.close()
+    queue_handler.close()
+
+
+def get_log_queue_stats() -> "LogQueueStats | None":
+    """Return the async logging counters, or None when not in async mode.
+
+    Example:
+        >>> stats = get_log_queue_stats()
+        >>> if stats and stats.dropped_new:
+        ...     print(f"{stats.dropped_new} log records dropped")
+    """
+    queue_handler = _queue_handler
+    return None if queue_handler is None else queue_handler.stats
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance.
 
@@ -0,0 +1,446 @@
+"""Caches for converted markdown.
+
+This module provides two caches for ``MarkdownResult`` objects so repeated
+conversions of the same URL skip the round trip to markdown.new:
+
+- ``MarkdownMemoryCache``: in-process TTL cache with single-flight request
+  coalescing, so concurrent callers for the same URL share one fetch.
+- ``MarkdownDiskCache``: persistent cache with conditional revalidation.
+
+Entries are keyed by URL and the config fields that change the output: the
+conversion method, ``retain_images``, ``local_conversion`` and the endpoint. Fresh
+entries are served directly; stale entries that carry an ETag or Last-Modified
+validator are revalidated with a conditional request, so an unchanged page
+costs a 304 instead of a full re-conversion. The cache is bounded by size and
+evicts least recently used entries.
+
+Example:
+    >>> from vibe_coding.utils.markdown_cache import MarkdownDiskCache
+    >>> from vibe_coding.utils.markdown_fetcher import fetch_markdown
+    >>> cache = MarkdownDiskCache(ttl=3600)
+    >>> result = fetch_markdown("https://example.com", cache=cache)
+    >>> result.metadata.cache_hit
+    False
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFetcherConfig,
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownTimeoutError,
+)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data/raw/markdown"
+
+
+def cache_key(url: str, config: MarkdownFetcherConfig) -> str:
+    """Build the cache key for a URL and fetch configuration.
+
+    Args:
+        url: URL being fetched.
+        config: Fetcher configuration.
+
+    Returns:
+        Hex digest identifying the URL and the config fields that affect the
+        converted output.
+    """
+    raw = "\n".join(
+        [
+            url,
+            config.method,
+            str(config.retain_images),
+            str(config.local_conversion),
+            config.endpoint,
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedMarkdown:
+    """A cached markdown result and its bookkeeping.
+
+    Attributes:
+        result: Cached result, with ``metadata.cache_hit`` set.
+        stored_at: Unix time when the entry was stored or last revalidated.
+        ttl: Freshness lifetime in seconds.
+    """
+
+    result: MarkdownResult
+    stored_at: float
+    ttl: float
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return time.time() - self.stored_at < self.ttl
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.result.metadata.etag:
+            headers["If-None-Match"] = self.result.metadata.etag
+        if self.result.metadata.last_modified:
+            headers["If-Modified-Since"] = self.result.metadata.last_modified
+        return headers
+
+
+class MarkdownMemoryCache:
+    """Size-bounded in-memory TTL cache with single-flight coalescing.
+
+    ``get_or_fetch`` guarantees that at most one fetch per key is in flight:
+    concurrent callers for the same key wait for the leader's fetch and share
+    its ``MarkdownResult`` (or its exception). Errors are never cached.
+
+    Attributes:
+        ttl: Seconds an entry is served from memory.
+        max_entries: Maximum number of entries before LRU eviction.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served from memory.
+            max_entries: Maximum number of entries before LRU eviction.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, MarkdownResult]] = OrderedDict()
+        self._in_flight: dict[str, Future[MarkdownResult]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, url: str, config: MarkdownFetcherConfig) -> MarkdownResult | None:
+        """Return a fresh cached result, or None.
+
+        Args:
+            url: URL being fetched.
+            config: Fetcher configuration.
+
+        Returns:
+            Cached result with ``metadata.cache_hit`` set, or None.
+        """
+        with self._lock:
+            return self._get_locked(cache_key(url, config))
+
+    def put(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        result: MarkdownResult,
+    ) -> None:
+        """Store a result, evicting the least recently used entry if full.
+
+        Args:
+            url: URL that was fetched.
+            config: Fetcher configuration used for the fetch.
+            result: Result to cache.
+        """
+        with self._lock:
+            self._put_locked(cache_key(url, config), result)
+
+    def get_or_fetch(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        fetch: Callable[[], MarkdownResult],
+    ) -> MarkdownResult:
+        """Return a cached result or run ``fetch`` once for all waiters.
+
+        Waiters honor ``config.deadline``: they stop waiting for the shared
+        fetch once it has passed.
+
+        Args:
+            url: URL being fetched.
+            config: Fetcher configuration.
+            fetch: Callable performing the real fetch.
+
+        Returns:
+            Cached, shared, or freshly fetched result.
+
+        Raises:
+            MarkdownTimeoutError: If a waiter's deadline passes first.
+            Exception: Whatever ``fetch`` raised, re-raised in every waiter.
+        """
+        key = cache_key(url, config)
+        with self._lock:
+            cached = self._get_locked(key)
+            if cached is not None:
+                return cached
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            try:
+                return future.result(timeout=config.deadline)
+            except FutureTimeoutError as e:
+                raise MarkdownTimeoutError("Deadline exceeded") from e
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._put_locked(key, result)
+            self._in_flight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get_locked(self, key: str) -> MarkdownResult | None:
+        """Look up a fresh entry. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return replace(result, metadata=replace(result.metadata, cache_hit=True))
+
+    def _put_locked(self, key: str, result: MarkdownResult) -> None:
+        """Store an entry and enforce ``max_entries``. Caller holds the lock."""
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class MarkdownDiskCache:
+    """Size-bounded, persistent LRU cache of converted markdown.
+
+    Each entry is stored as a ``.md`` content file and a ``.json`` metadata
+    file under ``directory``. The metadata file's mtime records the last
+    access, which drives LRU eviction once ``max_bytes`` is exceeded. Writes
+    are atomic, so concurrent readers never see a partial entry.
+
+    Attributes:
+        directory: Root directory for cache entries.
+        ttl: Seconds an entry is served without revalidation.
+        max_bytes: Upper bound on the total size of cached files.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_CACHE_DIR,
+        ttl: float = 24 * 60 * 60,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: Root directory for cache entries (default:
+                data/raw/markdown in the project root).
+            ttl: Seconds an entry is served without revalidation.
+            max_bytes: Upper bound on the total size of cached files.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Return the (content, metadata) paths for a cache key."""
+        shard = self.directory / key[:2]
+        return shard / f"{key}.md", shard / f"{key}.json"
+
+    def get(self, url: str, config: MarkdownFetcherConfig) -> CachedMarkdown | None:
+        """Look up a cached entry, fresh or stale.
+
+        Args:
+            url: URL being fetched.
+            config: Fetcher configuration.
+
+        Returns:
+            CachedMarkdown if present, None otherwise. Callers should check
+            ``is_fresh`` before serving it without revalidation.
+        """
+        content_path, meta_path = self._paths(cache_key(url, config))
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            content = content_path.read_text(encoding="utf-8")
+            metadata = MarkdownMetadata(**meta["metadata"])
+            stored_at = float(meta["stored_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+        return CachedMarkdown(
+            result=MarkdownResult(
+                content=content,
+                metadata=replace(metadata, cache_hit=True),
+            ),
+            stored_at=stored_at,
+            ttl=self.ttl,
+        )
+
+    def put(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        result: MarkdownResult,
+    ) -> None:
+        """Store a result, evicting least recently used entries if needed.
+
+        Args:
+            url: URL that was fetched.
+            config: Fetcher configuration used for the fetch.
+            result: Result to cache.
+        """
+        content_path, meta_path = self._paths(cache_key(url, config))
+        metadata = asdict(replace(result.metadata, cache_hit=False))
+        meta = json.dumps({"url": url, "stored_at": time.time(), "metadata": metadata})
+
+        with self._lock:
+            freed = self._size_of(content_path, meta_path)
+            content_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(content_path, result.content)
+            _atomic_write(meta_path, meta)
+            added = self._size_of(content_path, meta_path)
+            if self._total_bytes is not None:
+                self._total_bytes += added - freed
+            self._evict_locked()
+
+    def revalidated(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        entry: CachedMarkdown,
+        response_time_ms: float,
+    ) -> MarkdownResult:
+        """Refresh an entry after a 304 Not Modified response.
+
+        Args:
+            url: URL that was revalidated.
+            config: Fetcher configuration used for the fetch.
+            entry: Stale entry that the server confirmed is unchanged.
+            response_time_ms: Time taken by the revalidation request.
+
+        Returns:
+            The cached result with an updated response time.
+        """
+        self.put(url, config, entry.result)
+        return replace(
+            entry.result,
+            metadata=replace(
+                entry.result.metadata,
+                response_time_ms=response_time_ms,
+                cache_hit=True,
+            ),
+        )
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for path in self._entry_files():
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of cached files in bytes."""
+        with self._lock:
+            return self._scan_total_locked()
+
+    def _entry_files(self) -> list[Path]:
+        """List every content and metadata file in the cache."""
+        if not self.directory.exists():
+            return []
+        return [
+            path
+            for path in self.directory.glob("*/*")
+            if path.suffix in (".md", ".json")
+        ]
+
+    def _scan_total_locked(self) -> int:
+        """Compute (and memoize) the total cache size. Caller holds the lock."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(
+                path.stat().st_size for path in self._entry_files() if path.exists()
+            )
+        return self._total_bytes
+
+    def _evict_locked(self) -> None:
+        """Evict least recently used entries once over ``max_bytes``.
+
+        Evicts down to 90% of the budget so that a full cache does not rescan
+        the directory on every subsequent write.
+        """
+        if self._scan_total_locked() <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        entries = []
+        for meta_path in self.directory.glob("*/*.json"):
+            try:
+                entries.append((meta_path.stat().st_mtime, meta_path))
+            except OSError:
+                continue
+
+        for _, meta_path in sorted(entries):
+            if self._total_bytes <= target:
+                break
+            content_path = meta_path.with_suffix(".md")
+            self._total_bytes -= self._size_of(content_path, meta_path)
+            content_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _size_of(*paths: Path) -> int:
+        """Total size of the given files, ignoring missing ones."""
+        total = 0
+        for path in paths:
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write text to a file atomically via a temporary file and rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
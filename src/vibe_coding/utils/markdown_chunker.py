@@ -0,0 +1,368 @@
+"""Token-bounded chunking of fetched markdown.
+
+``chunk_markdown`` splits markdown into chunks that fit a context window. It
+reads the input once, line by line, cuts on heading, paragraph and code-fence
+boundaries, and yields chunks as soon as they are full, so memory use is
+bounded by the chunk size rather than the document size. The input can be a
+string or any iterable of text pieces, such as ``MarkdownFetcher.iter_markdown``.
+
+Token counts come from ``TokenEstimator``, a characters-per-token ratio that
+can be calibrated against the ``x-markdown-tokens`` count markdown.new returns.
+
+Example:
+    >>> from vibe_coding.utils.markdown_chunker import chunk_result
+    >>> result = fetch_markdown("https://example.com/docs")
+    >>> for chunk in chunk_result(result, target_tokens=800, overlap_tokens=100):
+    ...     print(chunk.index, chunk.tokens, " > ".join(chunk.headings))
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from vibe_coding.utils.markdown_fetcher import MarkdownResult, MarkdownValidationError
+
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+# Strings are split into lines a window at a time, so a large document is
+# never copied into one list of lines.
+_WINDOW = 64 * 1024
+
+# Joins blocks within a chunk; counted in every chunk's size.
+_SEPARATOR = "\n\n"
+
+_HEADING = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.*?)[ \t#]*$")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+
+@dataclass(frozen=True)
+class TokenEstimator:
+    """Estimates token counts from character counts.
+
+    Attributes:
+        chars_per_token: Average characters per token for the text at hand.
+    """
+
+    chars_per_token: float = DEFAULT_CHARS_PER_TOKEN
+
+    def count(self, text: str) -> int:
+        """Return the estimated number of tokens in ``text``."""
+        return self.count_chars(len(text))
+
+    def count_chars(self, chars: int) -> int:
+        """Return the estimated number of tokens in ``chars`` characters."""
+        return math.ceil(chars / self.chars_per_token)
+
+    def chars_for(self, tokens: int) -> int:
+        """Return the number of characters that make up about ``tokens``."""
+        return max(int(tokens * self.chars_per_token), 1)
+
+    @classmethod
+    def calibrated(cls, text_chars: int, token_count: int | None) -> TokenEstimator:
+        """Build an estimator from a known token count for some text.
+
+        Args:
+            text_chars: Length of the text in characters.
+            token_count: Tokens reported for that text, such as
+                ``MarkdownMetadata.token_count``.
+
+        Returns:
+            Calibrated estimator, or the default one if either count is not
+            positive.
+        """
+        if not token_count or token_count <= 0 or text_chars <= 0:
+            return cls()
+        return cls(text_chars / token_count)
+
+
+@dataclass(frozen=True)
+class MarkdownChunk:
+    """A contiguous piece of a markdown document.
+
+    Attributes:
+        index: Position of the chunk in the document, starting at 0.
+        text: Chunk content, including any overlap with the previous chunk.
+        tokens: Estimated token count of ``text``.
+        headings: Heading titles in effect at the first block that is new in
+            this chunk (not overlap), outermost first.
+    """
+
+    index: int
+    text: str
+    tokens: int
+    headings: tuple[str, ...] = ()
+
+
+def _iter_lines(source: str | Iterable[str]) -> Iterator[str]:
+    """Yield lines, without newlines, from a string or iterable of pieces."""
+    if isinstance(source, str):
+        text = source
+        source = (text[i : i + _WINDOW] for i in range(0, len(text), _WINDOW))
+
+    pending: list[str] = []
+    for piece in source:
+        if "\n" not in piece:
+            pending.append(piece)
+            continue
+        lines = piece.split("\n")
+        pending.append(lines[0])
+        yield "".join(pending)
+        yield from lines[1:-1]
+        pending = [lines[-1]]
+    if pending:
+        yield "".join(pending)
+
+
+def _iter_blocks(source: str | Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    """Yield ``(kind, lines)`` blocks: ``heading``, ``code`` or ``text``.
+
+    Paragraphs end at blank lines; a fenced code block is one block however
+    many blank lines it contains.
+    """
+    lines: list[str] = []
+    fence: str | None = None
+    for line in _iter_lines(source):
+        if fence is not None:
+            lines.append(line)
+            # A closing fence starts within the first four characters.
+            if fence[0] in line[:4]:
+                stripped = line.strip()
+                if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                    yield "code", lines
+                    lines, fence = [], None
+            continue
+
+        if line[:4].lstrip()[:1] in ("#", "`", "~"):
+            fence_match = _FENCE.match(line)
+            if fence_match or _HEADING.match(line):
+                if lines:
+                    yield "text", lines
+                    lines = []
+                if fence_match:
+                    fence = fence_match.group(1)
+                    lines = [line]
+                else:
+                    yield "heading", [line]
+                continue
+        if line.strip():
+            lines.append(line)
+        elif lines:
+            yield "text", lines
+            lines = []
+
+    if lines:
+        yield ("code" if fence is not None else "text"), lines
+
+
+def _joined_chars(blocks: Iterable[tuple[str, bool]]) -> int:
+    """Return the length of ``blocks`` joined with ``_SEPARATOR``."""
+    lengths = [len(text) for text, _ in blocks]
+    return sum(lengths) + len(_SEPARATOR) * max(len(lengths) - 1, 0)
+
+
+def _split_block(
+    kind: str,
+    lines: list[str],
+    max_tokens: int,
+    estimator: TokenEstimator,
+) -> Iterator[tuple[str, int]]:
+    """Yield ``(text, tokens)`` pieces of a block, each within ``max_tokens``.
+
+    Oversized blocks are split on line boundaries; code pieces are re-wrapped
+    in their fences, and single lines longer than the limit are cut by length.
+    """
+    text = "\n".join(lines)
+    tokens = estimator.count(text)
+    if tokens <= max_tokens:
+        yield text, tokens
+        return
+
+    opener = closer = ""
+    body = lines
+    if kind == "code":
+        opener = lines[0]
+        fence = _FENCE.match(opener).group(1)
+        has_closer = len(lines) > 1 and lines[-1].strip().startswith(fence)
+        closer = lines[-1] if has_closer else fence
+        body = lines[1:-1] if has_closer else lines[1:]
+    wrap_chars = len(opener) + len(closer) + 2 if kind == "code" else 0
+    max_chars = max(estimator.chars_for(max_tokens) - wrap_chars, 1)
+
+    def wrap(piece: list[str]) -> tuple[str, int]:
+        joined = "\n".join(piece)
+        if kind == "code":
+            joined = f"{opener}\n{joined}\n{closer}"
+        return joined, estimator.count(joined)
+
+    piece: list[str] = []
+    size = 0
+    for line in body:
+        while len(line) > max_chars:
+            if piece:
+                yield wrap(piece)
+                piece, size = [], 0
+            yield wrap([line[:max_chars]])
+            line = line[max_chars:]
+        if piece and size + len(line) + 1 > max_chars:
+            yield wrap(piece)
+            piece, size = [], 0
+        piece.append(line)
+        size += len(line) + 1
+    if piece:
+        yield wrap(piece)
+
+
+def chunk_markdown(
+    source: str | Iterable[str],
+    target_tokens: int = 512,
+    overlap_tokens: int = 64,
+    estimator: TokenEstimator | None = None,
+) -> Iterator[MarkdownChunk]:
+    """Split markdown into token-bounded chunks in a single pass.
+
+    Blocks (headings, paragraphs, fenced code) are packed into a chunk until
+    the next one would exceed ``target_tokens``. A heading starts a new chunk
+    once the current one is at least half full, and a heading that would
+    otherwise end a chunk moves to the next one, so sections tend to stay
+    together. Each chunk after the first repeats whole trailing blocks of the
+    previous chunk, up to ``overlap_tokens``. Blocks larger than the target
+    are split on line boundaries.
+
+    Args:
+        source: Markdown text, or an iterable of text pieces.
+        target_tokens: Maximum estimated tokens per chunk.
+        overlap_tokens: Maximum estimated tokens repeated from the previous
+            chunk.
+        estimator: Token estimator. Uses the default ratio if omitted.
+
+    Yields:
+        MarkdownChunk objects in document order.
+
+    Raises:
+        MarkdownValidationError: If ``target_tokens`` is less than 1 or
+            ``overlap_tokens`` is negative or not below ``target_tokens``.
+    """
+    if target_tokens < 1:
+        raise MarkdownValidationError("target_tokens must be at least 1")
+    if not 0 <= overlap_tokens < target_tokens:
+        raise MarkdownValidationError(
+            "overlap_tokens must be non-negative and less than target_tokens"
+        )
+    estimator = estimator or TokenEstimator()
+
+    sep = len(_SEPARATOR)
+
+    # (text, is_heading) of every block in the current chunk. Sizes are
+    # tracked in characters of the joined text, separators included, so
+    # chunk token counts match ``estimator.count(chunk.text)``.
+    current: deque[tuple[str, bool]] = deque()
+    current_chars = 0
+    fresh = 0
+    index = 0
+    headings: list[tuple[int, str]] = []
+    chunk_headings: tuple[str, ...] = ()
+
+    for kind, lines in _iter_blocks(source):
+        starts_section = (
+            kind == "heading"
+            and estimator.count_chars(current_chars) * 2 >= target_tokens
+        )
+        if kind == "heading":
+            match = _HEADING.match(lines[0])
+            level = len(match.group(1))
+            while headings and headings[-1][0] >= level:
+                headings.pop()
+            headings.append((level, match.group(2)))
+
+        for text, _ in _split_block(kind, lines, target_tokens, estimator):
+            size = len(text)
+            overflows = (
+                estimator.count_chars(current_chars + sep + size) > target_tokens
+            )
+            if fresh and (overflows or starts_section):
+                # Move headings that would end the chunk to the next one, so
+                # they stay with the section they introduce. ``tail`` is the
+                # joined size of the carried headings and this block.
+                carried: deque[tuple[str, bool]] = deque()
+                tail = size
+                while (
+                    kind != "heading"
+                    and len(carried) < fresh - 1
+                    and current[-1][1]
+                    and estimator.count_chars(len(current[-1][0]) + sep + tail)
+                    <= target_tokens
+                ):
+                    carried.appendleft(current.pop())
+                    tail += len(carried[0][0]) + sep
+                current_chars = _joined_chars(current)
+
+                yield MarkdownChunk(
+                    index,
+                    _SEPARATOR.join(text for text, _ in current),
+                    estimator.count_chars(current_chars),
+                    chunk_headings,
+                )
+                index += 1
+
+                kept: deque[tuple[str, bool]] = deque()
+                kept_chars = 0
+                for block in reversed(current):
+                    grown = len(block[0]) + (sep + kept_chars if kept else 0)
+                    if estimator.count_chars(grown) > overlap_tokens:
+                        break
+                    kept.appendleft(block)
+                    kept_chars = grown
+                while (
+                    kept
+                    and estimator.count_chars(kept_chars + sep + tail) > target_tokens
+                ):
+                    kept.popleft()
+                    kept_chars = _joined_chars(kept)
+                current = kept + carried
+                current_chars = _joined_chars(current)
+                fresh = len(carried)
+                if carried:
+                    chunk_headings = tuple(title for _, title in headings)
+
+            if not fresh:
+                chunk_headings = tuple(title for _, title in headings)
+            current_chars += (sep if current else 0) + size
+            current.append((text, kind == "heading"))
+            fresh += 1
+            starts_section = False
+
+    if fresh:
+        yield MarkdownChunk(
+            index,
+            _SEPARATOR.join(text for text, _ in current),
+            estimator.count_chars(current_chars),
+            chunk_headings,
+        )
+
+
+def chunk_result(
+    result: MarkdownResult,
+    target_tokens: int = 512,
+    overlap_tokens: int = 64,
+) -> Iterator[MarkdownChunk]:
+    """Chunk a fetch result, calibrating token estimates from its metadata.
+
+    When the server reported ``x-markdown-tokens``, the estimator uses that
+    document's own characters-per-token ratio.
+
+    Args:
+        result: Result from ``fetch_markdown`` or ``MarkdownFetcher.fetch``.
+        target_tokens: Maximum estimated tokens per chunk.
+        overlap_tokens: Maximum estimated tokens repeated between chunks.
+
+    Yields:
+        MarkdownChunk objects in document order.
+    """
+    estimator = TokenEstimator.calibrated(
+        len(result.content), result.metadata.token_count
+    )
+    return chunk_markdown(result.content, target_tokens, overlap_tokens, estimator)
@@ -0,0 +1,681 @@
+"""Site crawler that converts whole sites to markdown.
+
+``MarkdownCrawler`` starts from seed URLs and/or a ``sitemap.xml``, follows
+same-site links found in the converted markdown up to a configurable depth,
+and writes every page under ``data/raw/crawl`` next to a JSON-lines manifest.
+Pages are fetched in batches through ``fetch_markdown_many``, so the usual
+tier fallback, retries and per-host concurrency limits apply.
+
+The crawler is polite by default: it honors ``robots.txt`` (including
+``Crawl-delay``) and spaces out requests to each host with a
+``MarkdownRateLimiter``. Its URL frontier is saved after every batch, so an
+interrupted crawl picks up where it stopped when run again with the same
+output directory.
+
+Example:
+    >>> from vibe_coding.utils.markdown_crawler import CrawlConfig, MarkdownCrawler
+    >>> crawler = MarkdownCrawler("data/raw/crawl/docs", CrawlConfig(max_depth=2))
+    >>> report = crawler.crawl(["https://docs.example.com/"])
+    >>> print(report.pages_written, report.remaining)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from vibe_coding.utils.markdown_cache import _atomic_write
+from vibe_coding.utils.markdown_fetcher import (
+    USER_AGENT,
+    MarkdownBatchItem,
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    MarkdownPoolConfig,
+    MarkdownResult,
+    MarkdownValidationError,
+    fetch_markdown_many,
+)
+from vibe_coding.utils.markdown_policies import MarkdownRateLimiter
+
+DEFAULT_CRAWL_DIR = Path(__file__).parent.parent.parent.parent / "data/raw/crawl"
+
+MANIFEST_FILE = "manifest.jsonl"
+FRONTIER_FILE = "frontier.json"
+
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_MARKDOWN_LINK = re.compile(r"\]\(\s*<?([^)\s>]+)|<(https?://[^>\s]+)>")
+_SKIP_EXTENSIONS = frozenset(
+    {
+        ".css",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jpeg",
+        ".jpg",
+        ".js",
+        ".mp3",
+        ".mp4",
+        ".pdf",
+        ".png",
+        ".svg",
+        ".tar",
+        ".webp",
+        ".zip",
+    }
+)
+
+
+@dataclass
+class CrawlConfig:
+    """Configuration for a site crawl.
+
+    Attributes:
+        max_depth: Link hops followed from the seeds. ``0`` fetches only the
+            seeds and sitemap URLs.
+        max_pages: Maximum pages fetched per ``crawl`` call, or None for no
+            limit. A resumed crawl gets a fresh allowance.
+        politeness_delay: Minimum seconds between requests to the same host.
+            A longer ``Crawl-delay`` in robots.txt wins.
+        respect_robots: Whether to skip URLs disallowed by robots.txt.
+        same_site: Whether to follow only links to the seed hosts.
+        allowed_prefixes: Optional URL prefixes links must start with, such as
+            ``"https://example.com/docs/"``. Empty allows any URL.
+        max_workers: Concurrent fetches, passed to ``fetch_markdown_many``.
+        batch_size: URLs fetched between frontier checkpoints.
+    """
+
+    max_depth: int = 2
+    max_pages: int | None = 1000
+    politeness_delay: float = 1.0
+    respect_robots: bool = True
+    same_site: bool = True
+    allowed_prefixes: tuple[str, ...] = ()
+    max_workers: int = 4
+    batch_size: int = 32
+
+
+@dataclass
+class CrawlPage:
+    """Manifest entry for one crawled URL.
+
+    Attributes:
+        url: Normalized page URL.
+        depth: Link hops from the nearest seed.
+        path: Markdown file relative to the crawl directory, or None on error.
+        sha256: Hex digest of the markdown content.
+        size_bytes: UTF-8 size of the markdown content.
+        method_used: Tier that produced the markdown.
+        token_count: Token count reported by the server, if any.
+        fetched_at: ISO 8601 UTC time of the fetch.
+        changed_at: ISO 8601 UTC time the content last changed.
+        etag: ETag returned with the content, if any.
+        last_modified: Last-Modified returned with the content, if any.
+        error: Error message if the fetch failed.
+    """
+
+    url: str
+    depth: int
+    path: str | None = None
+    sha256: str | None = None
+    size_bytes: int = 0
+    method_used: str | None = None
+    token_count: int | None = None
+    fetched_at: str = ""
+    changed_at: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class CrawlReport:
+    """Summary of one ``crawl`` call.
+
+    Attributes:
+        pages_written: Pages converted and written this run.
+        failed: URLs whose fetch failed this run.
+        robots_skipped: URLs skipped because robots.txt disallows them.
+        remaining: URLs still queued in the frontier; non-zero when the crawl
+            stopped at ``max_pages``.
+        manifest_path: Path of the manifest file.
+    """
+
+    pages_written: int = 0
+    failed: int = 0
+    robots_skipped: int = 0
+    remaining: int = 0
+    manifest_path: Path | None = None
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication.
+
+    Lowercases the scheme and host, drops the fragment and default ports, and
+    turns an empty path into ``/``. Query strings are kept.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(":")[2]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rpartition(":")[0]
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def extract_links(markdown: str, base_url: str) -> list[str]:
+    """Return the absolute http(s) URLs linked from markdown content.
+
+    Args:
+        markdown: Markdown text with ``[text](url)`` or ``<url>`` links.
+        base_url: URL of the page, used to resolve relative links.
+
+    Returns:
+        Normalized URLs in order of first appearance, without duplicates.
+    """
+    links = {}
+    for match in _MARKDOWN_LINK.finditer(markdown):
+        href = match.group(1) or match.group(2)
+        url = urljoin(base_url, href)
+        if urlsplit(url).scheme in ("http", "https"):
+            links.setdefault(normalize_url(url), None)
+    return list(links)
+
+
+def parse_sitemap(xml_text: str) -> tuple[list[str], list[str]]:
+    """Parse a sitemap or sitemap index.
+
+    Args:
+        xml_text: Sitemap XML.
+
+    Returns:
+        Tuple of (page URLs, nested sitemap URLs).
+
+    Raises:
+        MarkdownValidationError: If the XML cannot be parsed.
+    """
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError as e:
+        raise MarkdownValidationError(f"Invalid sitemap: {e}") from e
+
+    locs = [
+        loc.text.strip()
+        for loc in root.iter(f"{_SITEMAP_NS}loc")
+        if loc.text and loc.text.strip()
+    ]
+    if root.tag == f"{_SITEMAP_NS}sitemapindex":
+        return [], locs
+    return locs, []
+
+
+class CrawlFrontier:
+    """Deduplicating FIFO queue of ``(url, depth)`` pairs.
+
+    Every URL is queued at most once, at the depth it was first seen. The
+    queue and the set of seen URLs can be saved to and loaded from a JSON
+    file, so a crawl can resume after an interruption.
+
+    Attributes:
+        path: Optional JSON file used to persist the frontier.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        """Initialize an empty frontier.
+
+        Args:
+            path: Optional JSON file used by ``save`` and ``load``.
+        """
+        self.path = Path(path) if path is not None else None
+        self._queue: deque[tuple[str, int]] = deque()
+        self._seen: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __contains__(self, url: str) -> bool:
+        return normalize_url(url) in self._seen
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        return iter(self._queue)
+
+    def add(self, url: str, depth: int) -> bool:
+        """Queue a URL unless it was seen before.
+
+        Returns:
+            True if the URL was queued.
+        """
+        url = normalize_url(url)
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        self._queue.append((url, depth))
+        return True
+
+    def pop_batch(self, size: int) -> list[tuple[str, int]]:
+        """Remove and return up to ``size`` queued pairs, oldest first."""
+        return [self._queue.popleft() for _ in range(min(size, len(self._queue)))]
+
+    def save(self) -> None:
+        """Persist the frontier to ``path`` atomically, if a path is set."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"queue": list(self._queue), "seen": sorted(self._seen)}
+        _atomic_write(self.path, json.dumps(data))
+
+    def load(self) -> bool:
+        """Load persisted state from ``path``, ignoring missing or bad files.
+
+        Returns:
+            True if state was loaded.
+        """
+        if self.path is None:
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            queue = deque((str(url), int(depth)) for url, depth in data["queue"])
+            seen = {str(url) for url in data["seen"]}
+        except (OSError, ValueError, TypeError, KeyError):
+            return False
+        self._queue = queue
+        self._seen = seen
+        return True
+
+
+class RobotsPolicy:
+    """Per-host robots.txt rules, fetched on first use and kept in memory.
+
+    Following RFC 9309, a robots.txt answering 404 or another 4xx status
+    allows everything, except 401 and 403, which disallow everything as in
+    ``urllib.robotparser``. A 5xx status or an unreachable server disallows
+    everything, and robots.txt is fetched again after ``error_ttl`` seconds,
+    so a temporary outage does not lift the site's rules.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        user_agent: str = USER_AGENT,
+        timeout: float = 10.0,
+        error_ttl: float = 60.0,
+    ):
+        """Initialize the policy.
+
+        Args:
+            session: Session used to download robots.txt files.
+            user_agent: User agent matched against robots.txt groups.
+            timeout: Request timeout for robots.txt downloads.
+            error_ttl: Seconds a robots.txt that failed with a server or
+                connection error stays disallowed before it is retried.
+        """
+        self.session = session
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.error_ttl = error_ttl
+        # origin -> (parser, monotonic expiry or None if kept for good)
+        self._parsers: dict[str, tuple[RobotFileParser, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def _parser(self, url: str) -> RobotFileParser:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            entry = self._parsers.get(origin)
+        if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+            return entry[0]
+
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        expires_at = None
+        try:
+            response = self.session.get(parser.url, timeout=self.timeout)
+        except requests.RequestException:
+            response = None
+        if response is None or response.status_code >= 500:
+            parser.disallow_all = True
+            expires_at = time.monotonic() + self.error_ttl
+        elif response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code == 200:
+            parser.parse(response.text.splitlines())
+        else:
+            parser.allow_all = True
+
+        with self._lock:
+            current = self._parsers.get(origin)
+            if current is not None and current is not entry:
+                return current[0]
+            self._parsers[origin] = (parser, expires_at)
+        return parser
+
+    def can_fetch(self, url: str) -> bool:
+        """Whether robots.txt allows fetching ``url``."""
+        return self._parser(url).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url: str) -> float | None:
+        """Return the ``Crawl-delay`` for the host of ``url``, if any."""
+        delay = self._parser(url).crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+
+class _PoliteFetcher:
+    """Fetcher wrapper that waits for the host's politeness slot per request.
+
+    The wait happens in the ``fetch_markdown_many`` worker that sends the
+    request, so one host's delay never holds up dispatch to other hosts.
+    """
+
+    def __init__(
+        self,
+        fetcher: MarkdownFetcher,
+        politeness: MarkdownRateLimiter,
+        delays: dict[str, float],
+    ):
+        self.fetcher = fetcher
+        self.config = fetcher.config
+        self.politeness = politeness
+        self.delays = delays
+
+    def fetch(
+        self, url: str, config: MarkdownFetcherConfig | None = None
+    ) -> MarkdownResult:
+        host = _host(url)
+        if self.delays.get(host, 0) > 0:
+            self.politeness.acquire(host)
+        return self.fetcher.fetch(url, config)
+
+
+class MarkdownCrawler:
+    """Crawl sites into markdown files with a resumable frontier.
+
+    Output layout under ``out_dir``:
+
+    - ``pages/<host>/<slug>-<hash>.md``: converted pages.
+    - ``manifest.jsonl``: one ``CrawlPage`` per fetched URL, appended as pages
+      finish. When a URL appears more than once, the last entry wins.
+    - ``frontier.json``: queue and seen URLs, saved after every batch.
+    """
+
+    def __init__(
+        self,
+        out_dir: Path | str = DEFAULT_CRAWL_DIR,
+        config: CrawlConfig | None = None,
+        fetch_config: MarkdownFetcherConfig | None = None,
+        fetcher: MarkdownFetcher | None = None,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            out_dir: Directory for pages, manifest and frontier state.
+            config: Crawl configuration. Uses defaults if not provided.
+            fetch_config: Fetch configuration for every page.
+            fetcher: Optional fetcher to use. The crawler does not close a
+                fetcher it did not create.
+        """
+        self.out_dir = Path(out_dir)
+        self.config = config or CrawlConfig()
+        self.fetch_config = fetch_config or MarkdownFetcherConfig()
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher or MarkdownFetcher(
+            self.fetch_config,
+            pool=MarkdownPoolConfig(pool_maxsize=max(self.config.max_workers, 10)),
+        )
+        self.frontier = CrawlFrontier(self.out_dir / FRONTIER_FILE)
+        self.robots = RobotsPolicy(self.fetcher.session)
+        self.politeness = MarkdownRateLimiter(burst=1, jitter=0)
+        self._hosts: set[str] = set()
+        self._delays: dict[str, float] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the JSON-lines manifest."""
+        return self.out_dir / MANIFEST_FILE
+
+    def crawl(
+        self,
+        seeds: Iterable[str] = (),
+        sitemap: str | None = None,
+        resume: bool = True,
+    ) -> CrawlReport:
+        """Crawl from seeds and/or a sitemap until the frontier is empty.
+
+        Args:
+            seeds: Start URLs, queued at depth 0.
+            sitemap: Optional sitemap or sitemap index URL whose pages are
+                queued at depth 0.
+            resume: Continue from a saved frontier in ``out_dir`` if present.
+
+        Returns:
+            CrawlReport for this run.
+
+        Raises:
+            MarkdownValidationError: If there is nothing to crawl or the
+                sitemap is invalid.
+        """
+        if resume:
+            self.frontier.load()
+            self._hosts.update(_host(url) for url, _ in self.frontier)
+
+        start_urls = list(seeds)
+        if sitemap is not None:
+            start_urls.extend(self._sitemap_urls(sitemap))
+        for url in start_urls:
+            self._hosts.add(_host(url))
+            self.frontier.add(url, 0)
+
+        if not self.frontier and not self.manifest_path.exists():
+            raise MarkdownValidationError("No seed URLs to crawl")
+
+        report = CrawlReport(manifest_path=self.manifest_path)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        with self.manifest_path.open("a", encoding="utf-8") as manifest:
+            while self.frontier:
+                budget = self.config.batch_size
+                if self.config.max_pages is not None:
+                    fetched = report.pages_written + report.failed
+                    budget = min(budget, self.config.max_pages - fetched)
+                    if budget <= 0:
+                        break
+                batch = self.frontier.pop_batch(budget)
+                self._crawl_batch(batch, manifest, report)
+                manifest.flush()
+                self.frontier.save()
+
+        report.remaining = len(self.frontier)
+        return report
+
+    def _crawl_batch(
+        self,
+        batch: list[tuple[str, int]],
+        manifest: Any,
+        report: CrawlReport,
+    ) -> None:
+        """Fetch one batch, write pages and manifest entries, queue new links."""
+        depths = dict(batch)
+        allowed = []
+        for url, _ in batch:
+            if self.config.respect_robots and not self.robots.can_fetch(url):
+                report.robots_skipped += 1
+            else:
+                allowed.append(url)
+
+        self._prepare_delays(allowed)
+        polite = any(self._delays[_host(url)] > 0 for url in allowed)
+        items = fetch_markdown_many(
+            allowed,
+            self.fetch_config,
+            max_workers=self.config.max_workers,
+            # Delayed hosts take turns anyway; one slot each leaves the rest
+            # of the pool to other hosts.
+            max_per_host=1 if polite else self.config.max_workers,
+            fetcher=_PoliteFetcher(self.fetcher, self.politeness, self._delays),
+        )
+        for item in items:
+            page = self._record(item, depths[item.url])
+            manifest.write(json.dumps(asdict(page)) + "\n")
+            if item.ok:
+                report.pages_written += 1
+                if page.depth < self.config.max_depth:
+                    for link in extract_links(item.result.content, item.url):
+                        if self._should_follow(link):
+                            self.frontier.add(link, page.depth + 1)
+            else:
+                report.failed += 1
+
+    def _prepare_delays(self, urls: list[str]) -> None:
+        """Set up the politeness delay of every host in ``urls``."""
+        for url in urls:
+            host = _host(url)
+            if host not in self._delays:
+                delay = self.config.politeness_delay
+                if self.config.respect_robots:
+                    delay = max(delay, self.robots.crawl_delay(url) or 0)
+                if delay > 0:
+                    self.politeness.host_limits[host] = (1 / delay, 1)
+                self._delays[host] = delay
+
+    def _record(self, item: MarkdownBatchItem, depth: int) -> CrawlPage:
+        """Write a fetched page to disk and build its manifest entry."""
+        page = CrawlPage(url=item.url, depth=depth, fetched_at=utc_now())
+        if not item.ok:
+            page.error = str(item.error)
+            return page
+
+        write_page(self.out_dir, page, item.result)
+        return page
+
+    def _should_follow(self, url: str) -> bool:
+        """Whether a discovered link belongs in the frontier."""
+        parts = urlsplit(url)
+        if Path(parts.path).suffix.lower() in _SKIP_EXTENSIONS:
+            return False
+        if self.config.same_site and parts.netloc not in self._hosts:
+            return False
+        prefixes = self.config.allowed_prefixes
+        return not prefixes or url.startswith(prefixes)
+
+    def _sitemap_urls(self, sitemap: str, max_sitemaps: int = 50) -> list[str]:
+        """Collect page URLs from a sitemap, following sitemap indexes."""
+        pending = [sitemap]
+        visited: set[str] = set()
+        urls: list[str] = []
+        while pending and len(visited) < max_sitemaps:
+            sitemap_url = pending.pop(0)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+            try:
+                response = self.fetcher.session.get(
+                    sitemap_url, timeout=self.fetch_config.timeout
+                )
+                response.raise_for_status()
+            except requests.RequestException as e:
+                raise MarkdownValidationError(
+                    f"Could not fetch sitemap {sitemap_url}: {e}"
+                ) from e
+            pages, nested = parse_sitemap(response.text)
+            urls.extend(pages)
+            pending.extend(nested)
+        return urls
+
+    def close(self) -> None:
+        """Close the fetcher if this crawler created it."""
+        if self._owns_fetcher:
+            self.fetcher.close()
+
+    def __enter__(self) -> MarkdownCrawler:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def page_path(url: str) -> Path:
+    """Return the manifest-relative markdown path for a page URL.
+
+    The name keeps a readable slug of the URL path and adds a short hash of
+    the full URL so that distinct URLs never collide.
+    """
+    parts = urlsplit(url)
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", parts.path.strip("/")).strip("-.")
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+    host = re.sub(r"[^A-Za-z0-9._-]+", "_", parts.netloc)
+    return Path("pages") / host / f"{slug[:80] or 'index'}-{digest}.md"
+
+
+def utc_now() -> str:
+    """Return the current UTC time as an ISO 8601 string in whole seconds."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of markdown content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def write_page(out_dir: Path, page: CrawlPage, result: MarkdownResult) -> None:
+    """Write a result's markdown under ``out_dir`` and fill in ``page``.
+
+    Sets the path, hash, size, tier, token count and validators of ``page``,
+    and marks it changed at its ``fetched_at`` time.
+    """
+    data = result.content.encode("utf-8")
+    relative = page_path(page.url)
+    path = out_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, result.content)
+
+    page.path = relative.as_posix()
+    page.sha256 = hashlib.sha256(data).hexdigest()
+    page.size_bytes = len(data)
+    page.method_used = result.metadata.method_used
+    page.token_count = result.metadata.token_count
+    page.etag = result.metadata.etag
+    page.last_modified = result.metadata.last_modified
+    page.changed_at = page.fetched_at
+    page.error = None
+
+
+def save_manifest(path: Path | str, pages: Iterable[CrawlPage]) -> None:
+    """Write a compacted manifest, one line per page, atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, "".join(json.dumps(asdict(page)) + "\n" for page in pages))
+
+
+def load_manifest(path: Path | str) -> dict[str, CrawlPage]:
+    """Load a crawl manifest, keeping the last entry for each URL.
+
+    Args:
+        path: Manifest file written by ``MarkdownCrawler``.
+
+    Returns:
+        Mapping of URL to its latest ``CrawlPage``. Empty if the file is
+        missing.
+    """
+    pages: dict[str, CrawlPage] = {}
+    try:
+        with Path(path).open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    page = CrawlPage(**json.loads(line))
+                    pages[page.url] = page
+    except FileNotFoundError:
+        pass
+    return pages
+
+
+def _host(url: str) -> str:
+    return urlsplit(normalize_url(url)).netloc
@@ -9,6 +9,17 @@ Features:
 - Retry logic with exponential backoff
 - Comprehensive error handling
 - Token count extraction from response headers
+- Reusable ``MarkdownFetcher`` client with a pooled, persistent HTTP session
+- Bulk fetching with global and per-host concurrency limits
+- Optional on-disk cache with ETag/Last-Modified revalidation
+- Optional in-memory cache that coalesces concurrent fetches of the same URL
+- Optional per-domain tier memory so ``auto`` mode skips tiers known to fail
+- Optional shared rate limiter that honors Retry-After and rate-limit headers
+- Total deadline budget across tiers and retries, with optional hedging
+- Optional circuit breaker that fails fast while markdown.new is degraded
+- Streaming downloads to a file or text iterator with a ``max_bytes`` cap
+- Optional local tier that converts static HTML in-process before markdown.new
+- Pluggable transport adapter, with an optional HTTP/2 multiplexed transport
 
 Example:
     >>> from vibe_coding.utils.markdown_fetcher import (
@@ -19,15 +30,58 @@ Example:
     >>> result = fetch_markdown("https://example.com", config)
     >>> print(result.content)
     >>> print(f"Tokens: {result.metadata.token_count}")
+
+For bulk conversions, reuse one fetcher so connections stay warm:
+    >>> with MarkdownFetcher(pool=MarkdownPoolConfig(pool_maxsize=20)) as fetcher:
+    ...     for url in urls:
+    ...         result = fetcher.fetch(url)
 """
 
 from __future__ import annotations
 
+import codecs
+import io
+import os
+import random
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Literal
+import weakref
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Literal
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from vibe_coding.utils.html_to_markdown import convert_html
+
+if TYPE_CHECKING:
+    from vibe_coding.utils.markdown_cache import (
+        CachedMarkdown,
+        MarkdownDiskCache,
+        MarkdownMemoryCache,
+    )
+    from vibe_coding.utils.markdown_metrics import MarkdownMetrics
+    from vibe_coding.utils.markdown_policies import (
+        MarkdownCircuitBreaker,
+        MarkdownRateLimiter,
+        MarkdownTierMemory,
+    )
+
+MARKDOWN_NEW_URL = "https://markdown.new/"
+USER_AGENT = (
+    "Mozilla/5.0 (compatible; VibeCoding/1.0; "
+    "+https://github.com/connorkitchings/Vibe-Coding)"
+)
+LOCAL_ACCEPT = "text/markdown, text/html;q=0.9"
+STREAM_CHUNK_SIZE = 64 * 1024
+SPOOL_MAX_SIZE = 1024 * 1024
 
 
 class MarkdownFetchError(Exception):
@@ -43,9 +97,39 @@ class MarkdownTimeoutError(MarkdownFetchError):
 
 
 class MarkdownRateLimitError(MarkdownFetchError):
-    """Raised when markdown.new rate limit is exceeded."""
+    """Raised when markdown.new rate limit is exceeded.
+
+    Attributes:
+        retry_after: Seconds the server asked us to wait, if it said.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MarkdownCircuitOpenError(MarkdownFetchError):
+    """Raised without a request while a tier's circuit breaker is open.
+
+    Attributes:
+        retry_after: Seconds until the breaker lets a probe request through.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
-    pass
+
+class MarkdownTooLargeError(MarkdownFetchError):
+    """Raised when a response body exceeds ``MarkdownFetcherConfig.max_bytes``.
+
+    Attributes:
+        max_bytes: Configured size cap in bytes.
+    """
+
+    def __init__(self, message: str, max_bytes: int | None = None):
+        super().__init__(message)
+        self.max_bytes = max_bytes
 
 
 class MarkdownValidationError(MarkdownFetchError):
@@ -56,12 +140,25 @@ class MarkdownValidationError(MarkdownFetchError):
 
 @dataclass
 class MarkdownMetadata:
-    """Metadata from markdown fetch response."""
+    """Metadata from markdown fetch response.
+
+    Attributes:
+        token_count: Token count reported in the x-markdown-tokens header.
+        method_used: Tier that produced the content.
+        status_code: HTTP status code of the response.
+        response_time_ms: Time taken by the request in milliseconds.
+        etag: ETag validator returned with the content, if any.
+        last_modified: Last-Modified validator returned with the content.
+        cache_hit: Whether the content was served from a cache.
+    """
 
     token_count: int | None
-    method_used: Literal["native", "ai", "browser"]
+    method_used: Literal["native", "local", "ai", "browser"]
     status_code: int
     response_time_ms: float
+    etag: str | None = None
+    last_modified: str | None = None
+    cache_hit: bool = False
 
 
 @dataclass
@@ -72,23 +169,113 @@ class MarkdownResult:
     metadata: MarkdownMetadata
 
 
+@dataclass
+class MarkdownFileResult:
+    """Result from a streamed fetch whose content lives on disk.
+
+    Attributes:
+        path: UTF-8 file holding the markdown content.
+        metadata: Response metadata, as for ``MarkdownResult``.
+        size_bytes: Size of the written file in bytes.
+    """
+
+    path: Path
+    metadata: MarkdownMetadata
+    size_bytes: int
+
+    def read_text(self) -> str:
+        """Load the markdown content into memory."""
+        return self.path.read_text(encoding="utf-8")
+
+
+@dataclass
+class MarkdownBatchItem:
+    """Outcome of a single URL in a bulk fetch.
+
+    Attributes:
+        index: Position of the URL in the input iterable.
+        url: URL that was fetched.
+        result: Fetch result, or None if the fetch failed.
+        error: Error raised for this URL, or None on success.
+    """
+
+    index: int
+    url: str
+    result: MarkdownResult | None = None
+    error: MarkdownFetchError | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the URL was fetched successfully."""
+        return self.error is None
+
+
 @dataclass
 class MarkdownFetcherConfig:
     """Configuration for markdown fetching operations.
 
     Attributes:
-        method: Conversion method to use. "auto" tries all tiers in order.
+        method: Conversion method to use. "auto" tries all tiers in order;
+            "local" only converts HTML in-process.
         retain_images: Whether to keep images in the output.
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retry attempts for failed requests.
         backoff_factor: Exponential backoff multiplier for retries.
+        jitter: Maximum random fraction added to each backoff delay, so that
+            concurrent callers do not retry in lockstep.
+        deadline: Optional cap in seconds on total wall time across all tiers,
+            retries and backoff sleeps. Request timeouts are shortened to fit.
+        hedge_after: Optional latency threshold in seconds. If a tier has not
+            answered by then, the next tier is started in parallel and the
+            first markdown result wins.
+        max_bytes: Optional cap on the response body size. Bodies are then
+            streamed and the download is aborted with ``MarkdownTooLargeError``
+            as soon as the cap is passed.
+        local_conversion: In ``auto`` mode, replace the native tier with the
+            local tier, which also converts HTML responses in-process and
+            only falls back to markdown.new when the result looks inadequate.
+        endpoint: markdown.new endpoint the remote tiers post to.
     """
 
-    method: Literal["auto", "ai", "browser"] = "auto"
+    method: Literal["auto", "local", "ai", "browser"] = "auto"
     retain_images: bool = False
-    timeout: int = 30
+    timeout: float = 30
     max_retries: int = 3
     backoff_factor: float = 2.0
+    jitter: float = 0.1
+    deadline: float | None = None
+    hedge_after: float | None = None
+    max_bytes: int | None = None
+    local_conversion: bool = False
+    endpoint: str = MARKDOWN_NEW_URL
+
+
+@dataclass
+class MarkdownPoolConfig:
+    """Connection pool settings for a long-lived ``MarkdownFetcher``.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to keep cached.
+        pool_maxsize: Maximum number of connections kept alive per host.
+        pool_block: Block when a host's pool is exhausted instead of opening
+            extra, non-pooled connections. Turns ``pool_maxsize`` into a hard
+            per-host concurrency limit.
+        keep_alive: Reuse connections between requests. Disabling sends
+            ``Connection: close`` with every request.
+        http2: Send requests through ``HTTP2Adapter`` (requires the ``http2``
+            extra) so concurrent requests to one host are multiplexed over a
+            shared connection. ``pool_block`` then caps the total number of
+            open connections at ``pool_connections * pool_maxsize``.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    http2: bool = False
+
+
+TierFunc = Callable[..., "MarkdownResult | None"]
 
 
 def _validate_url(url: str) -> None:
@@ -141,10 +328,197 @@ def _extract_token_count(headers: Any) -> int | None:
         return None
 
 
+def _parse_retry_after(headers: Any) -> float | None:
+    """Extract the wait time from a Retry-After header.
+
+    Args:
+        headers: Response headers dictionary.
+
+    Returns:
+        Seconds to wait (delta-seconds or HTTP-date form), or None if the
+        header is missing or invalid.
+    """
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value or not isinstance(value, str):
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _parse_rate_limit_reset(headers: Any) -> float | None:
+    """Extract the wait time until a rate-limit window resets.
+
+    Reads the ``RateLimit-Remaining``/``RateLimit-Reset`` header pair (or the
+    ``X-RateLimit-`` variants) and only reports a wait once the remaining
+    quota is exhausted.
+
+    Args:
+        headers: Response headers dictionary.
+
+    Returns:
+        Seconds until the window resets, or None if quota remains or the
+        headers are missing or invalid.
+    """
+    for prefix in ("ratelimit-", "x-ratelimit-"):
+        remaining = headers.get(f"{prefix}remaining")
+        reset = headers.get(f"{prefix}reset")
+        if not isinstance(remaining, str) or not isinstance(reset, str):
+            continue
+        try:
+            if int(remaining) > 0:
+                return None
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Some servers send an absolute epoch timestamp instead of seconds
+        if reset_value > 1_000_000_000:
+            reset_value -= time.time()
+        return max(reset_value, 0.0)
+    return None
+
+
+def _stream_kwargs(
+    config: MarkdownFetcherConfig,
+    sink: BinaryIO | None,
+) -> dict[str, Any]:
+    """Return extra request arguments enabling streaming when it is needed."""
+    if sink is not None or config.max_bytes is not None:
+        return {"stream": True}
+    return {}
+
+
+def _response_charset(response: requests.Response) -> str:
+    """Return the charset declared in the Content-Type header, or UTF-8."""
+    content_type = response.headers.get("content-type", "")
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset" and value:
+            try:
+                return codecs.lookup(value.strip("\"'")).name
+            except LookupError:
+                break
+    return "utf-8"
+
+
+def _iter_text(
+    response: requests.Response,
+    max_bytes: int | None,
+) -> Iterator[str]:
+    """Yield the decoded body of a streamed response chunk by chunk.
+
+    Args:
+        response: Response opened with ``stream=True``.
+        max_bytes: Optional cap on the number of body bytes received.
+
+    Yields:
+        Decoded text chunks.
+
+    Raises:
+        MarkdownTooLargeError: If the body is larger than ``max_bytes``.
+    """
+    declared = response.headers.get("content-length")
+    if max_bytes is not None and declared and declared.isdigit():
+        if int(declared) > max_bytes:
+            raise MarkdownTooLargeError(
+                f"Response of {declared} bytes exceeds max_bytes={max_bytes}",
+                max_bytes=max_bytes,
+            )
+
+    decoder = codecs.getincrementaldecoder(_response_charset(response))(
+        errors="replace"
+    )
+    received = 0
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        received += len(chunk)
+        if max_bytes is not None and received > max_bytes:
+            raise MarkdownTooLargeError(
+                f"Response exceeds max_bytes={max_bytes}", max_bytes=max_bytes
+            )
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _stream_body(
+    response: requests.Response,
+    sink: BinaryIO,
+    max_bytes: int | None,
+) -> None:
+    """Copy a streamed response body into ``sink`` as UTF-8.
+
+    Args:
+        response: Response opened with ``stream=True``.
+        sink: Binary file-like object receiving the body.
+        max_bytes: Optional cap on the number of body bytes received.
+
+    Raises:
+        MarkdownTooLargeError: If the body is larger than ``max_bytes``.
+    """
+    for text in _iter_text(response, max_bytes):
+        sink.write(text.encode("utf-8"))
+
+
+def _build_result(
+    response: requests.Response,
+    method: Literal["native", "local", "ai", "browser"],
+    response_time_ms: float,
+    content: str | None = None,
+    max_bytes: int | None = None,
+    sink: BinaryIO | None = None,
+) -> MarkdownResult:
+    """Build a MarkdownResult from a tier response.
+
+    Args:
+        response: Response returned by the tier request.
+        method: Tier that produced the response.
+        response_time_ms: Time taken by the request in milliseconds.
+        content: Content override. Defaults to the response body.
+        max_bytes: Optional body size cap. The body is read incrementally
+            from a streamed response so oversized bodies are never buffered.
+        sink: Optional binary file-like object. The body is streamed into it
+            as UTF-8 and the returned result has empty content.
+
+    Returns:
+        MarkdownResult with token count and cache validators extracted.
+
+    Raises:
+        MarkdownTooLargeError: If the body is larger than ``max_bytes``.
+    """
+    if content is None and sink is not None:
+        _stream_body(response, sink, max_bytes)
+        content = ""
+    elif content is None and max_bytes is not None:
+        buffer = io.BytesIO()
+        _stream_body(response, buffer, max_bytes)
+        content = buffer.getvalue().decode("utf-8")
+
+    return MarkdownResult(
+        content=response.text if content is None else content,
+        metadata=MarkdownMetadata(
+            token_count=_extract_token_count(response.headers),
+            method_used=method,
+            status_code=response.status_code,
+            response_time_ms=response_time_ms,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        ),
+    )
+
+
 def _fetch_with_accept_header(
     url: str,
     config: MarkdownFetcherConfig,
     session: requests.Session,
+    headers: dict[str, str] | None = None,
+    sink: BinaryIO | None = None,
 ) -> MarkdownResult | None:
     """Attempt fetch using native Accept: text/markdown header.
 
@@ -156,24 +530,39 @@ def _fetch_with_accept_header(
         url: URL to fetch.
         config: Fetcher configuration.
         session: Requests session to use.
+        headers: Optional extra request headers, such as conditional
+            revalidation headers.
+        sink: Optional binary file to stream the body into.
 
     Returns:
-        MarkdownResult if successful, None if markdown not available.
+        MarkdownResult if successful, None if markdown not available. A 304
+        response is returned with empty content so the caller can serve its
+        cached copy.
 
     Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
         MarkdownFetchError: For HTTP errors or other fetch issues.
     """
+    stream_kwargs = _stream_kwargs(config, sink)
+    response = None
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = session.get(
             url,
-            headers={"Accept": "text/markdown"},
+            headers={"Accept": "text/markdown", **(headers or {})},
             timeout=config.timeout,
+            **stream_kwargs,
         )
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
 
         if response.status_code == 429:
-            raise MarkdownRateLimitError("Rate limit exceeded on native fetch")
+            raise MarkdownRateLimitError(
+                "Rate limit exceeded on native fetch",
+                retry_after=_parse_retry_after(response.headers),
+            )
+
+        if response.status_code == 304:
+            return _build_result(response, "native", response_time_ms, content="")
 
         response.raise_for_status()
 
@@ -181,27 +570,113 @@ def _fetch_with_accept_header(
         if "text/markdown" not in content_type.lower():
             return None
 
-        token_count = _extract_token_count(response.headers)
-
-        return MarkdownResult(
-            content=response.text,
-            metadata=MarkdownMetadata(
-                token_count=token_count,
-                method_used="native",
-                status_code=response.status_code,
-                response_time_ms=response_time_ms,
-            ),
+        return _build_result(
+            response, "native", response_time_ms, max_bytes=config.max_bytes, sink=sink
         )
     except requests.Timeout as e:
         raise MarkdownTimeoutError(f"Native fetch timeout: {e}") from e
     except requests.RequestException as e:
         raise MarkdownFetchError(f"Native fetch failed: {e}") from e
+    finally:
+        if response is not None and stream_kwargs:
+            response.close()
+
+
+def _fetch_with_local_conversion(
+    url: str,
+    config: MarkdownFetcherConfig,
+    session: requests.Session,
+    headers: dict[str, str] | None = None,
+    sink: BinaryIO | None = None,
+) -> MarkdownResult | None:
+    """Fetch the page once and convert HTML to markdown in-process.
+
+    This tier replaces the native tier when ``config.local_conversion`` is
+    set. It asks for markdown but accepts HTML, which is streamed into the
+    incremental converter from ``html_to_markdown``. If the conversion looks
+    inadequate (too little text, typically a JavaScript-rendered page), it
+    returns None so the chain falls back to markdown.new; with
+    ``method="local"`` the conversion is returned regardless.
+
+    Args:
+        url: URL to fetch.
+        config: Fetcher configuration.
+        session: Requests session to use.
+        headers: Optional extra request headers, such as conditional
+            revalidation headers.
+        sink: Optional binary file to write the markdown into.
+
+    Returns:
+        MarkdownResult if markdown was served or converted, None otherwise.
+        A 304 response is returned with empty content so the caller can serve
+        its cached copy.
+
+    Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+        MarkdownFetchError: For HTTP errors or other fetch issues.
+    """
+    response = None
+    try:
+        start_time = time.perf_counter()
+        response = session.get(
+            url,
+            headers={"Accept": LOCAL_ACCEPT, **(headers or {})},
+            timeout=config.timeout,
+            stream=True,
+        )
+
+        if response.status_code == 429:
+            raise MarkdownRateLimitError(
+                "Rate limit exceeded on local fetch",
+                retry_after=_parse_retry_after(response.headers),
+            )
+
+        if response.status_code == 304:
+            return _build_result(
+                response, "local", (time.perf_counter() - start_time) * 1000, content=""
+            )
+
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "").lower()
+        if "text/markdown" in content_type:
+            content = "".join(_iter_text(response, config.max_bytes))
+        elif "html" in content_type:
+            conversion = convert_html(
+                _iter_text(response, config.max_bytes),
+                base_url=url,
+                retain_images=config.retain_images,
+            )
+            if config.method != "local" and not conversion.is_adequate():
+                return None
+            content = conversion.markdown
+        else:
+            return None
+
+        if sink is not None:
+            sink.write(content.encode("utf-8"))
+            content = ""
+        return _build_result(
+            response,
+            "local",
+            (time.perf_counter() - start_time) * 1000,
+            content=content,
+        )
+    except requests.Timeout as e:
+        raise MarkdownTimeoutError(f"Local fetch timeout: {e}") from e
+    except requests.RequestException as e:
+        raise MarkdownFetchError(f"Local fetch failed: {e}") from e
+    finally:
+        if response is not None:
+            response.close()
 
 
 def _fetch_with_workers_ai(
     url: str,
     config: MarkdownFetcherConfig,
     session: requests.Session,
+    headers: dict[str, str] | None = None,
+    sink: BinaryIO | None = None,
 ) -> MarkdownResult:
     """Fetch using markdown.new Workers AI conversion.
 
@@ -212,49 +687,60 @@ def _fetch_with_workers_ai(
         url: URL to fetch and convert.
         config: Fetcher configuration.
         session: Requests session to use.
+        headers: Optional extra request headers, such as conditional
+            revalidation headers.
+        sink: Optional binary file to stream the body into.
 
     Returns:
-        MarkdownResult with converted content.
+        MarkdownResult with converted content. A 304 response is returned with
+        empty content so the caller can serve its cached copy.
 
     Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
         MarkdownFetchError: For HTTP errors or other fetch issues.
     """
+    stream_kwargs = _stream_kwargs(config, sink)
+    response = None
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = session.post(
-            "https://markdown.new/",
+            config.endpoint,
             json={"url": url, "method": "ai", "retain_images": config.retain_images},
-            headers={"Content-Type": "application/json"},
+            headers={"Content-Type": "application/json", **(headers or {})},
             timeout=config.timeout,
+            **stream_kwargs,
         )
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
 
         if response.status_code == 429:
-            raise MarkdownRateLimitError("Rate limit exceeded on Workers AI")
+            raise MarkdownRateLimitError(
+                "Rate limit exceeded on Workers AI",
+                retry_after=_parse_retry_after(response.headers),
+            )
 
-        response.raise_for_status()
+        if response.status_code == 304:
+            return _build_result(response, "ai", response_time_ms, content="")
 
-        token_count = _extract_token_count(response.headers)
+        response.raise_for_status()
 
-        return MarkdownResult(
-            content=response.text,
-            metadata=MarkdownMetadata(
-                token_count=token_count,
-                method_used="ai",
-                status_code=response.status_code,
-                response_time_ms=response_time_ms,
-            ),
+        return _build_result(
+            response, "ai", response_time_ms, max_bytes=config.max_bytes, sink=sink
         )
     except requests.Timeout as e:
         raise MarkdownTimeoutError(f"Workers AI timeout: {e}") from e
     except requests.RequestException as e:
         raise MarkdownFetchError(f"Workers AI failed: {e}") from e
+    finally:
+        if response is not None and stream_kwargs:
+            response.close()
 
 
 def _fetch_with_browser_rendering(
     url: str,
     config: MarkdownFetcherConfig,
     session: requests.Session,
+    headers: dict[str, str] | None = None,
+    sink: BinaryIO | None = None,
 ) -> MarkdownResult:
     """Fetch using markdown.new browser rendering.
 
@@ -265,49 +751,190 @@ def _fetch_with_browser_rendering(
         url: URL to fetch and convert.
         config: Fetcher configuration.
         session: Requests session to use.
+        headers: Optional extra request headers, such as conditional
+            revalidation headers.
+        sink: Optional binary file to stream the body into.
 
     Returns:
-        MarkdownResult with rendered and converted content.
+        MarkdownResult with rendered and converted content. A 304 response is
+        returned with empty content so the caller can serve its cached copy.
 
     Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
         MarkdownFetchError: For HTTP errors or other fetch issues.
     """
     browser_timeout = max(config.timeout, 60)
+    if config.deadline is not None:
+        browser_timeout = min(browser_timeout, config.deadline)
 
+    stream_kwargs = _stream_kwargs(config, sink)
+    response = None
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = session.post(
-            "https://markdown.new/",
+            config.endpoint,
             json={
                 "url": url,
                 "method": "browser",
                 "retain_images": config.retain_images,
             },
-            headers={"Content-Type": "application/json"},
+            headers={"Content-Type": "application/json", **(headers or {})},
             timeout=browser_timeout,
+            **stream_kwargs,
         )
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
 
         if response.status_code == 429:
-            raise MarkdownRateLimitError("Rate limit exceeded on browser rendering")
+            raise MarkdownRateLimitError(
+                "Rate limit exceeded on browser rendering",
+                retry_after=_parse_retry_after(response.headers),
+            )
 
-        response.raise_for_status()
+        if response.status_code == 304:
+            return _build_result(response, "browser", response_time_ms, content="")
 
-        token_count = _extract_token_count(response.headers)
+        response.raise_for_status()
 
-        return MarkdownResult(
-            content=response.text,
-            metadata=MarkdownMetadata(
-                token_count=token_count,
-                method_used="browser",
-                status_code=response.status_code,
-                response_time_ms=response_time_ms,
-            ),
+        return _build_result(
+            response, "browser", response_time_ms, max_bytes=config.max_bytes, sink=sink
         )
     except requests.Timeout as e:
         raise MarkdownTimeoutError(f"Browser rendering timeout: {e}") from e
     except requests.RequestException as e:
         raise MarkdownFetchError(f"Browser rendering failed: {e}") from e
+    finally:
+        if response is not None and stream_kwargs:
+            response.close()
+
+
+def _backoff_delay(
+    config: MarkdownFetcherConfig,
+    attempt: int,
+    retry_after: float | None = None,
+) -> float:
+    """Compute the delay before the next retry.
+
+    Args:
+        config: Fetcher configuration.
+        attempt: Zero-based attempt number that just failed.
+        retry_after: Server-requested wait, which takes precedence over
+            exponential backoff.
+
+    Returns:
+        Delay in seconds, including up to ``config.jitter`` random extra.
+    """
+    delay = config.backoff_factor**attempt if retry_after is None else retry_after
+    if config.jitter > 0:
+        delay *= 1 + random.uniform(0, config.jitter)
+    return delay
+
+
+def _request_host(func: TierFunc, url: str, config: MarkdownFetcherConfig) -> str:
+    """Return the host a tier function sends its request to."""
+    if func is _fetch_with_accept_header or func is _fetch_with_local_conversion:
+        return urlsplit(url).netloc.lower()
+    return urlsplit(config.endpoint).netloc.lower()
+
+
+def _remaining(
+    deadline_at: float,
+    last_exception: Exception | None = None,
+) -> float:
+    """Return seconds left before a deadline.
+
+    Args:
+        deadline_at: ``time.monotonic()`` value of the deadline.
+        last_exception: Most recent failure, chained onto the timeout error.
+
+    Returns:
+        Remaining seconds, always positive.
+
+    Raises:
+        MarkdownTimeoutError: If the deadline has passed.
+    """
+    remaining = deadline_at - time.monotonic()
+    if remaining <= 0:
+        raise MarkdownTimeoutError("Deadline exceeded") from last_exception
+    return remaining
+
+
+def _sleep_within(
+    delay: float,
+    deadline_at: float | None,
+    last_exception: Exception,
+) -> None:
+    """Sleep before a retry, failing fast if the sleep would pass the deadline.
+
+    Raises:
+        MarkdownTimeoutError: If ``delay`` does not fit in the remaining time.
+    """
+    if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+        raise MarkdownTimeoutError(
+            f"Deadline exceeded before retry: {last_exception}"
+        ) from last_exception
+    time.sleep(delay)
+
+
+def _record_attempt(
+    metrics: MarkdownMetrics,
+    tier: str,
+    started: float,
+    outcome: str | None,
+    backoff: float = 0.0,
+    retried: bool = False,
+) -> None:
+    """Record one finished attempt of ``tier`` that started at ``started``.
+
+    Args:
+        metrics: Registry to record into.
+        tier: Tier name used as the metric label.
+        started: ``time.perf_counter()`` value when the attempt started.
+        outcome: Counter to increment for the outcome, if any.
+        backoff: Seconds of backoff that follow the attempt.
+        retried: Whether the attempt will be retried.
+    """
+    metrics.increment("attempts", tier)
+    metrics.observe_latency(tier, (time.perf_counter() - started) * 1000)
+    if outcome is not None:
+        metrics.increment(outcome, tier)
+    if retried:
+        metrics.increment("retries", tier)
+    if backoff > 0:
+        metrics.increment("backoff_seconds", tier, backoff)
+
+
+def _record_result(
+    metrics: MarkdownMetrics,
+    tier: str,
+    result: MarkdownResult,
+    sink: BinaryIO | None = None,
+) -> None:
+    """Record the bytes and tokens of a successful ``tier`` result."""
+    if sink is not None:
+        size = sink.tell()
+    else:
+        size = len(result.content.encode("utf-8"))
+    metrics.increment("bytes", tier, size)
+    if result.metadata.token_count is not None:
+        metrics.increment("tokens", tier, result.metadata.token_count)
+
+
+def _is_service_failure(error: MarkdownFetchError) -> bool:
+    """Check whether an error means the service itself is failing.
+
+    Args:
+        error: Error raised by a tier function.
+
+    Returns:
+        False for 4xx responses, validation errors and oversized bodies,
+        True for timeouts, connection errors, 5xx responses and anything else.
+    """
+    if isinstance(error, (MarkdownValidationError, MarkdownTooLargeError)):
+        return False
+    cause = error.__cause__
+    if isinstance(cause, requests.HTTPError) and cause.response is not None:
+        return cause.response.status_code >= 500
+    return True
 
 
 def _retry_with_backoff(
@@ -315,44 +942,683 @@ def _retry_with_backoff(
     url: str,
     config: MarkdownFetcherConfig,
     session: requests.Session,
+    headers: dict[str, str] | None = None,
+    rate_limiter: MarkdownRateLimiter | None = None,
+    deadline_at: float | None = None,
+    circuit_breaker: MarkdownCircuitBreaker | None = None,
+    circuit_key: str = "",
+    sink: BinaryIO | None = None,
+    metrics: MarkdownMetrics | None = None,
+    tier: str = "",
 ) -> MarkdownResult:
     """Execute a fetch function with retry and exponential backoff.
 
+    Rate-limit errors wait for the server's Retry-After when given. With a
+    shared rate limiter, every attempt first takes a token for the target
+    host, and a 429 pauses that host for all callers instead of just this one.
+
+    With a deadline, each attempt runs with its timeout (and
+    ``config.deadline``) shortened to the remaining budget, and the loop gives
+    up as soon as the next attempt or backoff sleep would overrun it.
+
+    With a circuit breaker, every attempt is checked against and reported to
+    the breaker under ``circuit_key``. Only timeouts, connection errors and
+    5xx responses count as failures; a 4xx response means the service is
+    reachable, so bad URLs cannot open the circuit for other callers. An open
+    circuit raises immediately and is never retried. Neither is a body larger
+    than ``config.max_bytes``.
+
+    With a metrics registry, every attempt is recorded under ``tier`` with its
+    latency, outcome and any backoff that follows it, and time spent waiting
+    for ``rate_limiter`` is added to ``ratelimit_wait_seconds``.
+
     Args:
         func: Fetch function to execute.
         url: URL to fetch.
         config: Fetcher configuration.
         session: Requests session to use.
+        headers: Optional extra request headers passed to ``func``.
+        rate_limiter: Optional shared rate limiter.
+        deadline_at: Optional ``time.monotonic()`` value by which the whole
+            call must finish.
+        circuit_breaker: Optional circuit breaker guarding ``func``.
+        circuit_key: Breaker key for ``func``, such as the tier name.
+        sink: Optional binary file ``func`` streams the body into. It is
+            truncated before every attempt.
+        metrics: Optional metrics registry.
+        tier: Tier name used as the metrics label.
 
     Returns:
         MarkdownResult from successful fetch.
 
     Raises:
+        MarkdownCircuitOpenError: If the circuit for ``circuit_key`` is open.
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+        MarkdownTimeoutError: If the deadline is exceeded.
         MarkdownFetchError: If all retries are exhausted.
     """
     last_exception = None
+    host = _request_host(func, url, config) if rate_limiter is not None else ""
 
     for attempt in range(config.max_retries):
+        attempt_config = config
+        if deadline_at is not None:
+            remaining = _remaining(deadline_at, last_exception)
+            attempt_config = replace(
+                config, timeout=min(config.timeout, remaining), deadline=remaining
+            )
+        waited = 0.0
+        if rate_limiter is not None and deadline_at is not None:
+            waited = rate_limiter.acquire(host, deadline_at=deadline_at)
+        elif rate_limiter is not None:
+            waited = rate_limiter.acquire(host)
+        if metrics is not None and waited:
+            metrics.increment("ratelimit_wait_seconds", tier, waited)
+        if circuit_breaker is not None:
+            circuit_breaker.allow(circuit_key)
+        if sink is not None:
+            sink.seek(0)
+            sink.truncate()
+        started = time.perf_counter() if metrics is not None else 0.0
         try:
-            return func(url, config, session)
+            if sink is None:
+                result = func(url, attempt_config, session, headers=headers)
+            else:
+                result = func(url, attempt_config, session, headers=headers, sink=sink)
+        except MarkdownTooLargeError:
+            if circuit_breaker is not None:
+                circuit_breaker.record_success(circuit_key)
+            if metrics is not None:
+                _record_attempt(metrics, tier, started, "errors")
+            raise
         except MarkdownRateLimitError as e:
+            if circuit_breaker is not None:
+                circuit_breaker.record_success(circuit_key)
             last_exception = e
-            backoff = config.backoff_factor**attempt
-            time.sleep(backoff)
-        except (MarkdownTimeoutError, MarkdownFetchError):
+            delay = _backoff_delay(config, attempt, e.retry_after)
+            if metrics is not None:
+                retried = attempt < config.max_retries - 1
+                _record_attempt(metrics, tier, started, "rate_limited", delay, retried)
+            if rate_limiter is not None:
+                rate_limiter.penalize(host, delay)
+            else:
+                _sleep_within(delay, deadline_at, e)
+        except (MarkdownTimeoutError, MarkdownFetchError) as e:
+            if circuit_breaker is not None and _is_service_failure(e):
+                circuit_breaker.record_failure(circuit_key)
+            elif circuit_breaker is not None:
+                circuit_breaker.record_success(circuit_key)
             if attempt == config.max_retries - 1:
+                if metrics is not None:
+                    _record_attempt(metrics, tier, started, "errors")
                 raise
-            backoff = config.backoff_factor**attempt
-            time.sleep(backoff)
+            last_exception = e
+            delay = _backoff_delay(config, attempt)
+            if metrics is not None:
+                _record_attempt(metrics, tier, started, "errors", delay, True)
+            _sleep_within(delay, deadline_at, e)
+        else:
+            if circuit_breaker is not None:
+                circuit_breaker.record_success(circuit_key)
+            if metrics is not None:
+                outcome = "successes" if result is not None else None
+                _record_attempt(metrics, tier, started, outcome)
+                if result is not None:
+                    _record_result(metrics, tier, result, sink)
+            return result
 
     raise MarkdownFetchError(
         f"All {config.max_retries} retries exhausted. Last error: {last_exception}"
     ) from last_exception
 
 
+MARKDOWN_NEW_TIERS = frozenset({"ai", "browser"})
+
+
+def _tier_chain(
+    method: str,
+    local_conversion: bool = False,
+) -> list[tuple[str, TierFunc]]:
+    """Return the ordered (name, fetch function) tiers for a method.
+
+    Args:
+        method: Configured conversion method.
+        local_conversion: Whether ``auto`` starts with the local tier instead
+            of the native tier.
+
+    Returns:
+        Tiers to try in order.
+
+    Raises:
+        MarkdownValidationError: If the method is unknown.
+    """
+    if method == "auto" and local_conversion:
+        return [("local", _fetch_with_local_conversion), ("ai", _fetch_with_workers_ai)]
+    elif method == "auto":
+        return [("native", _fetch_with_accept_header), ("ai", _fetch_with_workers_ai)]
+    elif method == "local":
+        return [("local", _fetch_with_local_conversion)]
+    elif method == "ai":
+        return [("ai", _fetch_with_workers_ai)]
+    elif method == "browser":
+        return [("browser", _fetch_with_browser_rendering)]
+    else:
+        raise MarkdownValidationError(f"Invalid method: {method}")
+
+
+class MarkdownFetcher:
+    """Reusable markdown fetcher backed by a pooled, persistent HTTP session.
+
+    Every thread gets its own ``requests.Session`` (sessions carry mutable
+    cookie and header state), but all of them mount the same transport
+    adapter, so TCP/TLS connections are pooled and reused across threads and
+    across fallback tiers. A single instance is safe to share between threads.
+
+    Example:
+        >>> with MarkdownFetcher(MarkdownFetcherConfig(method="ai")) as fetcher:
+        ...     first = fetcher.fetch("https://example.com/a")
+        ...     second = fetcher.fetch("https://example.com/b")
+    """
+
+    def __init__(
+        self,
+        config: MarkdownFetcherConfig | None = None,
+        pool: MarkdownPoolConfig | None = None,
+        cache: MarkdownDiskCache | None = None,
+        memory_cache: MarkdownMemoryCache | None = None,
+        tier_memory: MarkdownTierMemory | None = None,
+        rate_limiter: MarkdownRateLimiter | None = None,
+        circuit_breaker: MarkdownCircuitBreaker | None = None,
+        metrics: MarkdownMetrics | None = None,
+        transport: BaseAdapter | None = None,
+    ):
+        """Initialize the fetcher and its connection pool.
+
+        Args:
+            config: Default fetch configuration used when ``fetch`` is called
+                without one.
+            pool: Connection pool settings. Uses defaults if not provided.
+            cache: Optional on-disk cache consulted before any tier.
+            memory_cache: Optional in-memory cache consulted first. Concurrent
+                fetches of the same URL through this fetcher are coalesced
+                into one request.
+            tier_memory: Optional per-domain tier memory. Tiers known to fail
+                for a domain are skipped (the last tier is always tried), and
+                the memory is saved when the fetcher is closed.
+            rate_limiter: Optional rate limiter shared by every tier. It sees
+                the headers of every response, so it can throttle before the
+                server starts rejecting requests.
+            circuit_breaker: Optional circuit breaker around the markdown.new
+                tiers. While a tier's circuit is open, it fails fast with
+                ``MarkdownCircuitOpenError`` instead of retrying.
+            metrics: Optional metrics registry recording attempts, outcomes,
+                latency, bytes and tokens per tier. It also exports the
+                ``circuit_breaker``'s state, if there is one.
+            transport: Optional ``requests`` transport adapter mounted for
+                ``http://`` and ``https://`` in place of the one built from
+                ``pool``. The fetcher closes it on ``close``.
+        """
+        self.config = config or MarkdownFetcherConfig()
+        self.pool = pool or MarkdownPoolConfig()
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.tier_memory = tier_memory
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        if metrics is not None and circuit_breaker is not None:
+            metrics.track_circuit_breaker(circuit_breaker)
+        self._adapter = transport or self._build_adapter()
+        self._local = threading.local()
+        # Sessions live in thread-locals; a finished thread's session is
+        # dropped with it instead of piling up here.
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._hedge_executor: ThreadPoolExecutor | None = None
+
+    def _build_adapter(self) -> BaseAdapter:
+        """Build the transport adapter described by the pool settings."""
+        if self.pool.http2:
+            from vibe_coding.utils.markdown_transport import HTTP2Adapter
+
+            return HTTP2Adapter(
+                max_connections=(
+                    self.pool.pool_connections * self.pool.pool_maxsize
+                    if self.pool.pool_block
+                    else None
+                ),
+                max_keepalive_connections=(
+                    self.pool.pool_maxsize if self.pool.keep_alive else 0
+                ),
+            )
+        return HTTPAdapter(
+            pool_connections=self.pool.pool_connections,
+            pool_maxsize=self.pool.pool_maxsize,
+            pool_block=self.pool.pool_block,
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        if self._closed:
+            raise MarkdownFetchError("MarkdownFetcher has been closed")
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
+
+    def _new_session(self) -> requests.Session:
+        """Build a session that shares this fetcher's connection pool."""
+        with self._lock:
+            if self._closed:
+                raise MarkdownFetchError("MarkdownFetcher has been closed")
+            session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT})
+            if not self.pool.keep_alive:
+                session.headers["Connection"] = "close"
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            if self.rate_limiter is not None:
+                session.hooks["response"].append(self._observe_response)
+            self._sessions.add(session)
+        return session
+
+    def _observe_response(self, response: requests.Response, **kwargs: Any) -> None:
+        """Response hook feeding rate-limit headers to the rate limiter."""
+        host = urlsplit(response.url).netloc.lower()
+        self.rate_limiter.observe(host, response.headers)
+
+    def fetch(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig | None = None,
+        cache: MarkdownDiskCache | None = None,
+    ) -> MarkdownResult:
+        """Fetch URL and convert to Markdown using the pooled session.
+
+        The in-memory cache, if any, is checked first and coalesces concurrent
+        fetches of the same URL. When a disk cache is in use, fresh entries
+        are returned without a request and stale entries are revalidated with
+        a conditional request to the tier that produced them.
+
+        Args:
+            url: URL to fetch and convert.
+            config: Optional per-call configuration. Falls back to the
+                fetcher's default configuration.
+            cache: Optional cache for this call. Falls back to the fetcher's
+                cache.
+
+        Returns:
+            MarkdownResult with content and metadata.
+
+        Raises:
+            MarkdownValidationError: If URL or method is invalid.
+            MarkdownFetchError: If all fetch attempts fail.
+            MarkdownTimeoutError: If all attempts timeout.
+        """
+        if config is None:
+            config = self.config
+        if cache is None:
+            cache = self.cache
+
+        _validate_url(url)
+        tiers = _tier_chain(config.method, config.local_conversion)
+
+        if self.memory_cache is None:
+            return self._fetch_tiers(url, config, tiers, cache)
+
+        return self.memory_cache.get_or_fetch(
+            url, config, lambda: self._fetch_tiers(url, config, tiers, cache)
+        )
+
+    def _fetch_tiers(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        tiers: list[tuple[str, TierFunc]],
+        cache: MarkdownDiskCache | None,
+    ) -> MarkdownResult:
+        """Run the tier chain for a validated URL, using the disk cache."""
+        cached = cache.get(url, config) if cache is not None else None
+        if cached is not None and cached.is_fresh:
+            return cached.result
+
+        deadline_at = None
+        if config.deadline is not None:
+            deadline_at = time.monotonic() + config.deadline
+
+        host = urlsplit(url).netloc.lower()
+        plan = self._tier_plan(host, tiers, cached)
+
+        if config.hedge_after is not None and len(plan) > 1:
+            result = self._run_hedged(url, config, plan, host, deadline_at)
+        else:
+            result = None
+            for name, func, headers in plan:
+                result = self._run_tier(
+                    name, func, url, config, headers, host, deadline_at
+                )
+                if result is not None:
+                    break
+
+        if result is None:
+            raise MarkdownFetchError(f"No tier returned markdown for {url}")
+
+        if cache is not None:
+            if result.metadata.status_code == 304 and cached is not None:
+                return cache.revalidated(
+                    url, config, cached, result.metadata.response_time_ms
+                )
+            cache.put(url, config, result)
+        return result
+
+    def _tier_plan(
+        self,
+        host: str,
+        tiers: list[tuple[str, TierFunc]],
+        cached: CachedMarkdown | None = None,
+    ) -> list[tuple[str, TierFunc, dict[str, str] | None]]:
+        """Return the tiers to run with their conditional request headers.
+
+        Validators from a cached entry go only to the tier that produced it,
+        and tiers that tier memory knows fail for ``host`` are dropped (the
+        last tier is always kept).
+        """
+        plan: list[tuple[str, TierFunc, dict[str, str] | None]] = []
+        for position, (name, func) in enumerate(tiers, start=1):
+            headers = None
+            if cached is not None and cached.result.metadata.method_used == name:
+                headers = cached.validators or None
+
+            if (
+                self.tier_memory is not None
+                and headers is None
+                and position < len(tiers)
+                and self.tier_memory.should_skip(host, name)
+            ):
+                continue
+            plan.append((name, func, headers))
+        return plan
+
+    def _run_tier(
+        self,
+        name: str,
+        func: TierFunc,
+        url: str,
+        config: MarkdownFetcherConfig,
+        headers: dict[str, str] | None,
+        host: str,
+        deadline_at: float | None,
+        sink: BinaryIO | None = None,
+    ) -> MarkdownResult | None:
+        """Run one tier with retries and record the outcome in tier memory.
+
+        A tier that returns no markdown counts as a fallback in the metrics.
+        """
+        breaker = self.circuit_breaker if name in MARKDOWN_NEW_TIERS else None
+        result = _retry_with_backoff(
+            func,
+            url,
+            config,
+            self.session,
+            headers=headers,
+            rate_limiter=self.rate_limiter,
+            deadline_at=deadline_at,
+            circuit_breaker=breaker,
+            circuit_key=name,
+            sink=sink,
+            metrics=self.metrics,
+            tier=name,
+        )
+        if self.tier_memory is not None:
+            self.tier_memory.record(host, name, result is not None)
+        if result is None and self.metrics is not None:
+            self.metrics.increment("fallbacks", name)
+        return result
+
+    def _run_hedged(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        plan: list[tuple[str, TierFunc, dict[str, str] | None]],
+        host: str,
+        deadline_at: float | None,
+    ) -> MarkdownResult | None:
+        """Run tiers with hedging and return the first markdown result.
+
+        Each tier runs on a worker thread. If it has not finished within
+        ``config.hedge_after`` seconds, the next tier is started alongside it.
+        A tier that returns no markdown starts the next tier immediately.
+        Losing requests are not interrupted; their results are discarded.
+        """
+        executor = self._hedge_pool()
+        pending: dict[Future[MarkdownResult | None], str] = {}
+        launched = 0
+        last_error: MarkdownFetchError | None = None
+
+        def launch() -> None:
+            nonlocal launched
+            name, func, headers = plan[launched]
+            future = executor.submit(
+                self._run_tier, name, func, url, config, headers, host, deadline_at
+            )
+            pending[future] = name
+            launched += 1
+
+        launch()
+        while pending:
+            if launched < len(plan):
+                timeout = config.hedge_after
+            elif deadline_at is not None:
+                timeout = _remaining(deadline_at, last_error)
+            else:
+                timeout = None
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if launched < len(plan):
+                    launch()
+                    continue
+                raise MarkdownTimeoutError("Deadline exceeded") from last_error
+
+            for future in done:
+                del pending[future]
+                try:
+                    result = future.result()
+                except MarkdownFetchError as e:
+                    last_error = e
+                    continue
+                if result is not None:
+                    return result
+
+            if not pending and launched < len(plan):
+                if last_error is not None:
+                    raise last_error
+                launch()
+
+        if last_error is not None:
+            raise last_error
+        return None
+
+    def fetch_to_file(
+        self,
+        url: str,
+        path: Path | str,
+        config: MarkdownFetcherConfig | None = None,
+    ) -> MarkdownFileResult:
+        """Fetch URL and stream the markdown into a file.
+
+        The body is written incrementally, so memory use stays flat however
+        large the document is; combine with ``config.max_bytes`` to abort
+        oversized downloads early. The file is written atomically and
+        re-encoded as UTF-8. Caches and hedging are not used.
+
+        Args:
+            url: URL to fetch and convert.
+            path: Destination file. Parent directories are created.
+            config: Optional per-call configuration. Falls back to the
+                fetcher's default configuration.
+
+        Returns:
+            MarkdownFileResult pointing at the written file.
+
+        Raises:
+            MarkdownValidationError: If URL or method is invalid.
+            MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+            MarkdownFetchError: If all fetch attempts fail.
+            MarkdownTimeoutError: If all attempts timeout.
+
+        Example:
+            >>> with MarkdownFetcher(MarkdownFetcherConfig(max_bytes=50_000_000)) as f:
+            ...     saved = f.fetch_to_file("https://example.com", "data/raw/page.md")
+            >>> print(saved.size_bytes)
+        """
+        if config is None:
+            config = self.config
+
+        _validate_url(url)
+        tiers = _tier_chain(config.method, config.local_conversion)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w+b") as sink:
+                result = self._fetch_to_sink(url, config, tiers, sink)
+                size_bytes = sink.tell()
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return MarkdownFileResult(
+            path=path, metadata=result.metadata, size_bytes=size_bytes
+        )
+
+    def iter_markdown(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """Fetch URL and yield the markdown as text chunks.
+
+        The body is streamed into a spooled temporary file (kept in memory up
+        to ``SPOOL_MAX_SIZE`` bytes, then moved to disk) and yielded once the
+        fetch has succeeded, so a failed or retried tier never yields partial
+        content. The fetch starts on the first iteration.
+
+        Args:
+            url: URL to fetch and convert.
+            config: Optional per-call configuration. Falls back to the
+                fetcher's default configuration.
+            chunk_size: Approximate size of each yielded chunk in bytes.
+
+        Yields:
+            Consecutive pieces of the markdown content.
+
+        Raises:
+            MarkdownValidationError: If URL or method is invalid.
+            MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+            MarkdownFetchError: If all fetch attempts fail.
+            MarkdownTimeoutError: If all attempts timeout.
+        """
+        if config is None:
+            config = self.config
+
+        _validate_url(url)
+        tiers = _tier_chain(config.method, config.local_conversion)
+
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+            self._fetch_to_sink(url, config, tiers, spool)
+            spool.seek(0)
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            while chunk := spool.read(chunk_size):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
+    def _fetch_to_sink(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+        tiers: list[tuple[str, TierFunc]],
+        sink: BinaryIO,
+    ) -> MarkdownResult:
+        """Run the tier chain sequentially, streaming the body into ``sink``."""
+        deadline_at = None
+        if config.deadline is not None:
+            deadline_at = time.monotonic() + config.deadline
+
+        host = urlsplit(url).netloc.lower()
+        for name, func, _ in self._tier_plan(host, tiers):
+            result = self._run_tier(
+                name, func, url, config, None, host, deadline_at, sink=sink
+            )
+            if result is not None:
+                return result
+        raise MarkdownFetchError(f"No tier returned markdown for {url}")
+
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        """Return the executor used for hedged tiers, creating it lazily."""
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.pool.pool_maxsize,
+                    thread_name_prefix="markdown-hedge",
+                )
+            return self._hedge_executor
+
+    def close(self) -> None:
+        """Close every session and release pooled connections."""
+        with self._lock:
+            self._closed = True
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+        if self.tier_memory is not None:
+            self.tier_memory.save()
+
+    def __enter__(self) -> MarkdownFetcher:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# Shared fetcher used by fetch_markdown, created on first use
+_default_fetcher: MarkdownFetcher | None = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_default_fetcher() -> MarkdownFetcher:
+    """Get the process-wide fetcher used by ``fetch_markdown``.
+
+    Returns:
+        Shared MarkdownFetcher instance.
+    """
+    global _default_fetcher
+    if _default_fetcher is None:
+        with _default_fetcher_lock:
+            if _default_fetcher is None:
+                _default_fetcher = MarkdownFetcher()
+    return _default_fetcher
+
+
 def fetch_markdown(
     url: str,
     config: MarkdownFetcherConfig | None = None,
+    fetcher: MarkdownFetcher | None = None,
+    cache: MarkdownDiskCache | None = None,
 ) -> MarkdownResult:
     """Fetch URL and convert to Markdown using markdown.new.
 
@@ -361,9 +1627,16 @@ def fetch_markdown(
     2. Fallback to Workers AI conversion
     3. Final fallback to Browser Rendering (for JS-heavy pages)
 
+    It is a thin wrapper around ``MarkdownFetcher.fetch``. Connections are
+    pooled in a shared fetcher, so repeated calls skip the TCP/TLS handshake.
+
     Args:
         url: URL to fetch and convert.
-        config: Optional configuration. Uses defaults if not provided.
+        config: Optional configuration. Uses the fetcher's configuration if
+            not provided.
+        fetcher: Optional fetcher to use instead of the shared default.
+        cache: Optional on-disk cache (see ``markdown_cache.MarkdownDiskCache``).
+            Cache hits are flagged with ``metadata.cache_hit``.
 
     Returns:
         MarkdownResult with content and metadata.
@@ -378,39 +1651,135 @@ def fetch_markdown(
         >>> result = fetch_markdown("https://example.com", config)
         >>> print(result.content)
     """
-    if config is None:
-        config = MarkdownFetcherConfig()
-
-    _validate_url(url)
+    return (fetcher or get_default_fetcher()).fetch(url, config, cache=cache)
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (compatible; VibeCoding/1.0; +https://github.com/connorkitchings/Vibe-Coding)"
-        }
-    )
 
+def _fetch_batch_item(
+    fetcher: MarkdownFetcher,
+    index: int,
+    url: str,
+    config: MarkdownFetcherConfig,
+) -> MarkdownBatchItem:
+    """Fetch one URL for ``fetch_markdown_many``, capturing fetch errors."""
     try:
-        if config.method == "auto":
-            result = _retry_with_backoff(
-                _fetch_with_accept_header, url, config, session
-            )
-            if result is not None:
-                return result
+        return MarkdownBatchItem(index, url, result=fetcher.fetch(url, config))
+    except MarkdownFetchError as e:
+        return MarkdownBatchItem(index, url, error=e)
 
-            result = _retry_with_backoff(_fetch_with_workers_ai, url, config, session)
-            return result
 
-        elif config.method == "ai":
-            return _retry_with_backoff(_fetch_with_workers_ai, url, config, session)
+def fetch_markdown_many(
+    urls: Iterable[str],
+    config: MarkdownFetcherConfig | None = None,
+    max_workers: int = 8,
+    max_per_host: int = 2,
+    ordered: bool = False,
+    fetcher: MarkdownFetcher | None = None,
+) -> Iterator[MarkdownBatchItem]:
+    """Fetch many URLs concurrently and yield results as they finish.
+
+    URLs are scheduled onto a thread pool only when both a global slot and a
+    slot for the URL's host are free. URLs waiting on a busy host are parked
+    per host, so a slow host never holds up work for other hosts. Each URL
+    goes through ``MarkdownFetcher.fetch``, with the usual tier fallback and
+    retry rules.
 
-        elif config.method == "browser":
-            return _retry_with_backoff(
-                _fetch_with_browser_rendering, url, config, session
-            )
+    Args:
+        urls: URLs to fetch. Consumed lazily: reading stops while
+            ``max_workers`` URLs are parked behind busy hosts, so a long
+            iterable dominated by one host is not buffered in memory.
+        config: Optional configuration. Uses the fetcher's default if omitted.
+        max_workers: Maximum number of fetches in flight overall.
+        max_per_host: Maximum number of fetches in flight per host.
+        ordered: Yield results in input order instead of completion order.
+        fetcher: Optional fetcher to use instead of the shared default. Its
+            ``pool_maxsize`` should be at least ``max_workers``.
+
+    Yields:
+        MarkdownBatchItem per URL, holding either a result or the fetch error.
 
-        else:
-            raise MarkdownValidationError(f"Invalid method: {config.method}")
+    Raises:
+        MarkdownValidationError: If a concurrency limit is less than 1.
 
+    Example:
+        >>> for item in fetch_markdown_many(urls, max_workers=16):
+        ...     if item.ok:
+        ...         print(item.url, item.result.metadata.token_count)
+    """
+    if max_workers < 1 or max_per_host < 1:
+        raise MarkdownValidationError("Concurrency limits must be at least 1")
+
+    fetcher = fetcher or get_default_fetcher()
+    if config is None:
+        config = fetcher.config
+
+    source = iter(enumerate(urls))
+    exhausted = False
+    parked: defaultdict[str, deque[tuple[int, str]]] = defaultdict(deque)
+    parked_count = 0
+    runnable: deque[str] = deque()
+    runnable_hosts: set[str] = set()
+    active: defaultdict[str, int] = defaultdict(int)
+    in_flight: dict[Future[MarkdownBatchItem], str] = {}
+    completed: dict[int, MarkdownBatchItem] = {}
+    next_index = 0
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="markdown-fetch"
+    )
+
+    def submit(index: int, url: str, host: str) -> None:
+        active[host] += 1
+        future = executor.submit(_fetch_batch_item, fetcher, index, url, config)
+        in_flight[future] = host
+
+    def fill() -> None:
+        nonlocal exhausted, parked_count
+        while len(in_flight) < max_workers:
+            if runnable:
+                host = runnable.popleft()
+                submit(*parked[host].popleft(), host)
+                parked_count -= 1
+                if parked[host] and active[host] < max_per_host:
+                    runnable.append(host)
+                else:
+                    runnable_hosts.discard(host)
+                continue
+
+            if exhausted or parked_count >= max_workers:
+                return
+            try:
+                index, url = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+
+            host = urlsplit(url).netloc.lower() if isinstance(url, str) else ""
+            if active[host] < max_per_host and not parked[host]:
+                submit(index, url, host)
+            else:
+                parked[host].append((index, url))
+                parked_count += 1
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                host = in_flight.pop(future)
+                active[host] -= 1
+                if parked[host] and host not in runnable_hosts:
+                    runnable.append(host)
+                    runnable_hosts.add(host)
+
+                item = future.result()
+                if not ordered:
+                    yield item
+                    continue
+
+                completed[item.index] = item
+                while next_index in completed:
+                    yield completed.pop(next_index)
+                    next_index += 1
+            fill()
     finally:
-        session.close()
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,608 @@
+"""Asyncio variant of the markdown.new fetcher.
+
+This module mirrors ``vibe_coding.utils.markdown_fetcher`` for code running on
+an event loop, such as the FastAPI service. It uses ``httpx.AsyncClient`` for
+non-blocking I/O and ``asyncio.sleep`` for backoff, so many conversions can be
+in flight without a thread each.
+
+The 3-tier fallback, configuration, result types and exception hierarchy are
+shared with the synchronous fetcher, and so can a ``MarkdownRateLimiter``: its
+buckets and Retry-After pauses apply to sync and async callers alike.
+
+Requires the optional ``httpx`` dependency (``uv sync --extra async``).
+
+Example:
+    >>> from vibe_coding.utils.markdown_fetcher_async import AsyncMarkdownFetcher
+    >>> async with AsyncMarkdownFetcher() as fetcher:
+    ...     result = await fetcher.fetch("https://example.com")
+    >>> print(result.content)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "markdown_fetcher_async requires httpx. Install it with: uv sync --extra async"
+    ) from e
+
+from vibe_coding.utils.html_to_markdown import convert_html
+from vibe_coding.utils.markdown_fetcher import (
+    LOCAL_ACCEPT,
+    USER_AGENT,
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownMetadata,
+    MarkdownPoolConfig,
+    MarkdownRateLimitError,
+    MarkdownResult,
+    MarkdownTimeoutError,
+    MarkdownTooLargeError,
+    MarkdownValidationError,
+    _backoff_delay,
+    _extract_token_count,
+    _parse_retry_after,
+    _validate_url,
+)
+
+if TYPE_CHECKING:
+    from vibe_coding.utils.markdown_policies import MarkdownRateLimiter
+
+AsyncTierFunc = Callable[
+    [str, MarkdownFetcherConfig, "httpx.AsyncClient"],
+    Awaitable["MarkdownResult | None"],
+]
+
+
+async def _asend(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    config: MarkdownFetcherConfig,
+) -> tuple[httpx.Response, str]:
+    """Send a request and read its body, honoring ``config.max_bytes``.
+
+    Without a cap the body is read in one go. With a cap it is streamed and
+    the download is aborted as soon as the cap is passed.
+
+    Args:
+        client: Async HTTP client to use.
+        request: Request to send.
+        config: Fetcher configuration.
+
+    Returns:
+        The response and its decoded body.
+
+    Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+    """
+    max_bytes = config.max_bytes
+    if max_bytes is None:
+        response = await client.send(request)
+        return response, response.text
+
+    response = await client.send(request, stream=True)
+    try:
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > max_bytes:
+            raise MarkdownTooLargeError(
+                f"Response of {declared} bytes exceeds max_bytes={max_bytes}",
+                max_bytes=max_bytes,
+            )
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > max_bytes:
+                raise MarkdownTooLargeError(
+                    f"Response exceeds max_bytes={max_bytes}", max_bytes=max_bytes
+                )
+        return response, body.decode(response.encoding or "utf-8", errors="replace")
+    finally:
+        await response.aclose()
+
+
+async def _afetch_with_accept_header(
+    url: str,
+    config: MarkdownFetcherConfig,
+    client: httpx.AsyncClient,
+) -> MarkdownResult | None:
+    """Attempt fetch using native Accept: text/markdown header.
+
+    Args:
+        url: URL to fetch.
+        config: Fetcher configuration.
+        client: Async HTTP client to use.
+
+    Returns:
+        MarkdownResult if successful, None if markdown not available.
+
+    Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+        MarkdownFetchError: For HTTP errors or other fetch issues.
+    """
+    try:
+        start_time = time.perf_counter()
+        request = client.build_request(
+            "GET",
+            url,
+            headers={"Accept": "text/markdown"},
+            timeout=config.timeout,
+        )
+        response, text = await _asend(client, request, config)
+        response_time_ms = (time.perf_counter() - start_time) * 1000
+
+        if response.status_code == 429:
+            raise MarkdownRateLimitError(
+                "Rate limit exceeded on native fetch",
+                retry_after=_parse_retry_after(response.headers),
+            )
+
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "")
+        if "text/markdown" not in content_type.lower():
+            return None
+
+        return MarkdownResult(
+            content=text,
+            metadata=MarkdownMetadata(
+                token_count=_extract_token_count(response.headers),
+                method_used="native",
+                status_code=response.status_code,
+                response_time_ms=response_time_ms,
+            ),
+        )
+    except httpx.TimeoutException as e:
+        raise MarkdownTimeoutError(f"Native fetch timeout: {e}") from e
+    except httpx.HTTPError as e:
+        raise MarkdownFetchError(f"Native fetch failed: {e}") from e
+
+
+async def _afetch_with_local_conversion(
+    url: str,
+    config: MarkdownFetcherConfig,
+    client: httpx.AsyncClient,
+) -> MarkdownResult | None:
+    """Fetch the page once and convert HTML to markdown in-process.
+
+    Mirrors the synchronous ``_fetch_with_local_conversion``: markdown
+    responses are used as-is, HTML is converted locally, and an inadequate
+    conversion returns None unless ``config.method`` is ``"local"``.
+
+    Args:
+        url: URL to fetch.
+        config: Fetcher configuration.
+        client: Async HTTP client to use.
+
+    Returns:
+        MarkdownResult if markdown was served or converted, None otherwise.
+
+    Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+        MarkdownFetchError: For HTTP errors or other fetch issues.
+    """
+    try:
+        start_time = time.perf_counter()
+        request = client.build_request(
+            "GET",
+            url,
+            headers={"Accept": LOCAL_ACCEPT},
+            timeout=config.timeout,
+        )
+        response, text = await _asend(client, request, config)
+
+        if response.status_code == 429:
+            raise MarkdownRateLimitError(
+                "Rate limit exceeded on local fetch",
+                retry_after=_parse_retry_after(response.headers),
+            )
+
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "").lower()
+        if "text/markdown" not in content_type:
+            if "html" not in content_type:
+                return None
+            conversion = convert_html(
+                text, base_url=url, retain_images=config.retain_images
+            )
+            if config.method != "local" and not conversion.is_adequate():
+                return None
+            text = conversion.markdown
+
+        return MarkdownResult(
+            content=text,
+            metadata=MarkdownMetadata(
+                token_count=_extract_token_count(response.headers),
+                method_used="local",
+                status_code=response.status_code,
+                response_time_ms=(time.perf_counter() - start_time) * 1000,
+            ),
+        )
+    except httpx.TimeoutException as e:
+        raise MarkdownTimeoutError(f"Local fetch timeout: {e}") from e
+    except httpx.HTTPError as e:
+        raise MarkdownFetchError(f"Local fetch failed: {e}") from e
+
+
+async def _afetch_with_markdown_new(
+    url: str,
+    config: MarkdownFetcherConfig,
+    client: httpx.AsyncClient,
+    method: str,
+    label: str,
+    timeout: float,
+) -> MarkdownResult:
+    """POST a URL to markdown.new for server-side conversion.
+
+    Args:
+        url: URL to fetch and convert.
+        config: Fetcher configuration.
+        client: Async HTTP client to use.
+        method: markdown.new conversion method ("ai" or "browser").
+        label: Human-readable tier name used in error messages.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        MarkdownResult with converted content.
+
+    Raises:
+        MarkdownTooLargeError: If the body exceeds ``config.max_bytes``.
+        MarkdownFetchError: For HTTP errors or other fetch issues.
+    """
+    title = label[0].upper() + label[1:]
+    try:
+        start_time = time.perf_counter()
+        request = client.build_request(
+            "POST",
+            config.endpoint,
+            json={
+                "url": url,
+                "method": method,
+                "retain_images": config.retain_images,
+            },
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
+        response, text = await _asend(client, request, config)
+        response_time_ms = (time.perf_counter() - start_time) * 1000
+
+        if response.status_code == 429:
+            raise MarkdownRateLimitError(
+                f"Rate limit exceeded on {label}",
+                retry_after=_parse_retry_after(response.headers),
+            )
+
+        response.raise_for_status()
+
+        return MarkdownResult(
+            content=text,
+            metadata=MarkdownMetadata(
+                token_count=_extract_token_count(response.headers),
+                method_used=method,  # type: ignore[arg-type]
+                status_code=response.status_code,
+                response_time_ms=response_time_ms,
+            ),
+        )
+    except httpx.TimeoutException as e:
+        raise MarkdownTimeoutError(f"{title} timeout: {e}") from e
+    except httpx.HTTPError as e:
+        raise MarkdownFetchError(f"{title} failed: {e}") from e
+
+
+async def _afetch_with_workers_ai(
+    url: str,
+    config: MarkdownFetcherConfig,
+    client: httpx.AsyncClient,
+) -> MarkdownResult:
+    """Fetch using markdown.new Workers AI conversion.
+
+    Args:
+        url: URL to fetch and convert.
+        config: Fetcher configuration.
+        client: Async HTTP client to use.
+
+    Returns:
+        MarkdownResult with converted content.
+
+    Raises:
+        MarkdownFetchError: For HTTP errors or other fetch issues.
+    """
+    return await _afetch_with_markdown_new(
+        url, config, client, "ai", "Workers AI", config.timeout
+    )
+
+
+async def _afetch_with_browser_rendering(
+    url: str,
+    config: MarkdownFetcherConfig,
+    client: httpx.AsyncClient,
+) -> MarkdownResult:
+    """Fetch using markdown.new browser rendering.
+
+    Args:
+        url: URL to fetch and convert.
+        config: Fetcher configuration.
+        client: Async HTTP client to use.
+
+    Returns:
+        MarkdownResult with rendered and converted content.
+
+    Raises:
+        MarkdownFetchError: For HTTP errors or other fetch issues.
+    """
+    return await _afetch_with_markdown_new(
+        url,
+        config,
+        client,
+        "browser",
+        "browser rendering",
+        max(config.timeout, 60),
+    )
+
+
+def _arequest_host(func: AsyncTierFunc, url: str, config: MarkdownFetcherConfig) -> str:
+    """Return the host an async tier function sends its request to."""
+    if func is _afetch_with_accept_header or func is _afetch_with_local_conversion:
+        return urlsplit(url).netloc.lower()
+    return urlsplit(config.endpoint).netloc.lower()
+
+
+async def _aretry_with_backoff(
+    func: AsyncTierFunc,
+    url: str,
+    config: MarkdownFetcherConfig,
+    client: httpx.AsyncClient,
+    rate_limiter: MarkdownRateLimiter | None = None,
+) -> MarkdownResult | None:
+    """Await a fetch function with retry and exponential backoff.
+
+    Follows the same rules as the synchronous ``_retry_with_backoff`` but
+    sleeps with ``asyncio.sleep`` so the event loop stays responsive. With a
+    shared rate limiter, every attempt first awaits a token for the target
+    host, and a 429 pauses that host for all callers, sync and async.
+
+    Args:
+        func: Async fetch function to execute.
+        url: URL to fetch.
+        config: Fetcher configuration.
+        client: Async HTTP client to use.
+        rate_limiter: Optional shared rate limiter.
+
+    Returns:
+        MarkdownResult from successful fetch.
+
+    Raises:
+        MarkdownFetchError: If all retries are exhausted.
+    """
+    last_exception = None
+    host = _arequest_host(func, url, config) if rate_limiter is not None else ""
+
+    for attempt in range(config.max_retries):
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(host)
+        try:
+            return await func(url, config, client)
+        except MarkdownTooLargeError:
+            raise
+        except MarkdownRateLimitError as e:
+            last_exception = e
+            delay = _backoff_delay(config, attempt, e.retry_after)
+            if rate_limiter is not None:
+                rate_limiter.penalize(host, delay)
+            else:
+                await asyncio.sleep(delay)
+        except (MarkdownTimeoutError, MarkdownFetchError):
+            if attempt == config.max_retries - 1:
+                raise
+            await asyncio.sleep(_backoff_delay(config, attempt))
+
+    raise MarkdownFetchError(
+        f"All {config.max_retries} retries exhausted. Last error: {last_exception}"
+    ) from last_exception
+
+
+class AsyncMarkdownFetcher:
+    """Reusable async markdown fetcher backed by a pooled ``httpx.AsyncClient``.
+
+    The client is bound to the event loop it is first used on, so create one
+    fetcher per loop (for example in a FastAPI lifespan handler).
+
+    Example:
+        >>> async with AsyncMarkdownFetcher() as fetcher:
+        ...     results = await asyncio.gather(
+        ...         *(fetcher.fetch(url) for url in urls)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        config: MarkdownFetcherConfig | None = None,
+        pool: MarkdownPoolConfig | None = None,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: MarkdownRateLimiter | None = None,
+    ):
+        """Initialize the fetcher and its HTTP client.
+
+        Args:
+            config: Default fetch configuration used when ``fetch`` is called
+                without one.
+            pool: Connection pool settings. ``pool_maxsize`` bounds idle
+                keep-alive connections; with ``pool_block`` set,
+                ``pool_connections * pool_maxsize`` bounds open connections.
+                ``http2`` enables HTTP/2 on the client (requires the ``http2``
+                extra).
+            client: Optional pre-built client. The fetcher does not close a
+                client it did not create.
+            rate_limiter: Optional rate limiter shared by every tier, and with
+                any synchronous ``MarkdownFetcher`` given the same instance.
+                It sees the headers of every response on ``client``.
+        """
+        self.config = config or MarkdownFetcherConfig()
+        self.pool = pool or MarkdownPoolConfig()
+        self.rate_limiter = rate_limiter
+        self._owns_client = client is None
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=(
+                    self.pool.pool_connections * self.pool.pool_maxsize
+                    if self.pool.pool_block
+                    else None
+                ),
+                max_keepalive_connections=(
+                    self.pool.pool_maxsize if self.pool.keep_alive else 0
+                ),
+            )
+            client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                limits=limits,
+                http2=self.pool.http2,
+                follow_redirects=True,
+            )
+        self.client = client
+        if rate_limiter is not None:
+            client.event_hooks["response"].append(self._observe_response)
+
+    async def _observe_response(self, response: httpx.Response) -> None:
+        """Response hook feeding rate-limit headers to the rate limiter."""
+        host = urlsplit(str(response.url)).netloc.lower()
+        self.rate_limiter.observe(host, response.headers)
+
+    async def fetch(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig | None = None,
+    ) -> MarkdownResult:
+        """Fetch URL and convert to Markdown without blocking the event loop.
+
+        Args:
+            url: URL to fetch and convert.
+            config: Optional per-call configuration. Falls back to the
+                fetcher's default configuration.
+
+        Returns:
+            MarkdownResult with content and metadata.
+
+        Raises:
+            MarkdownValidationError: If URL or method is invalid.
+            MarkdownFetchError: If all fetch attempts fail.
+            MarkdownTimeoutError: If all attempts timeout or ``config.deadline``
+                is exceeded.
+        """
+        if config is None:
+            config = self.config
+
+        _validate_url(url)
+
+        if config.deadline is None:
+            return await self._fetch_tiers(url, config)
+        try:
+            return await asyncio.wait_for(
+                self._fetch_tiers(url, config), timeout=config.deadline
+            )
+        except asyncio.TimeoutError as e:
+            raise MarkdownTimeoutError(
+                f"Deadline of {config.deadline}s exceeded for {url}"
+            ) from e
+
+    async def _fetch_tiers(
+        self,
+        url: str,
+        config: MarkdownFetcherConfig,
+    ) -> MarkdownResult:
+        """Run the tier chain for a validated URL."""
+        if config.method == "auto":
+            first_tier = (
+                _afetch_with_local_conversion
+                if config.local_conversion
+                else _afetch_with_accept_header
+            )
+            result = await _aretry_with_backoff(
+                first_tier, url, config, self.client, self.rate_limiter
+            )
+            if result is not None:
+                return result
+
+            return await _aretry_with_backoff(
+                _afetch_with_workers_ai, url, config, self.client, self.rate_limiter
+            )
+
+        elif config.method == "local":
+            result = await _aretry_with_backoff(
+                _afetch_with_local_conversion,
+                url,
+                config,
+                self.client,
+                self.rate_limiter,
+            )
+            if result is None:
+                raise MarkdownFetchError(f"No tier returned markdown for {url}")
+            return result
+
+        elif config.method == "ai":
+            return await _aretry_with_backoff(
+                _afetch_with_workers_ai, url, config, self.client, self.rate_limiter
+            )
+
+        elif config.method == "browser":
+            return await _aretry_with_backoff(
+                _afetch_with_browser_rendering,
+                url,
+                config,
+                self.client,
+                self.rate_limiter,
+            )
+
+        else:
+            raise MarkdownValidationError(f"Invalid method: {config.method}")
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this fetcher created it."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncMarkdownFetcher:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+async def fetch_markdown_async(
+    url: str,
+    config: MarkdownFetcherConfig | None = None,
+    fetcher: AsyncMarkdownFetcher | None = None,
+) -> MarkdownResult:
+    """Fetch URL and convert to Markdown using markdown.new, asynchronously.
+
+    Without a ``fetcher`` a short-lived client is created for this call only.
+    Pass a long-lived ``AsyncMarkdownFetcher`` to pool connections.
+
+    Args:
+        url: URL to fetch and convert.
+        config: Optional configuration. Uses the fetcher's configuration if
+            not provided, or the defaults without a fetcher.
+        fetcher: Optional fetcher whose client should be reused.
+
+    Returns:
+        MarkdownResult with content and metadata.
+
+    Raises:
+        MarkdownValidationError: If URL is invalid.
+        MarkdownFetchError: If all fetch attempts fail.
+        MarkdownTimeoutError: If all attempts timeout.
+
+    Example:
+        >>> result = await fetch_markdown_async("https://example.com")
+    """
+    if fetcher is not None:
+        return await fetcher.fetch(url, config)
+
+    async with AsyncMarkdownFetcher(config) as short_lived:
+        return await short_lived.fetch(url)
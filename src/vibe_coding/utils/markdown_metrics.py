@@ -0,0 +1,248 @@
+"""Per-tier metrics for the markdown fetcher.
+
+``MarkdownMetrics`` aggregates what ``MarkdownResult.metadata`` reports one
+call at a time: attempts, successes, fallbacks, retries, 429s, errors, bytes,
+tokens, backoff time and rate limiter waits as counters, and attempt latency as
+a histogram, all labelled by tier. Pass an instance to ``MarkdownFetcher`` to
+enable it; without one the fetcher skips all bookkeeping. A fetcher with a
+circuit breaker also exports each circuit's state, trips and rejected calls
+through the registry.
+
+Example:
+    >>> from vibe_coding.utils.markdown_fetcher import MarkdownFetcher
+    >>> from vibe_coding.utils.markdown_metrics import MarkdownMetrics
+    >>> metrics = MarkdownMetrics()
+    >>> with MarkdownFetcher(metrics=metrics) as fetcher:
+    ...     fetcher.fetch("https://example.com")
+    >>> metrics.snapshot()["counters"]["attempts"]
+    {'native': 1}
+    >>> print(metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vibe_coding.utils.markdown_policies import MarkdownCircuitBreaker
+
+LATENCY_BUCKETS_MS = (
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+)
+
+COUNTERS = {
+    "attempts": "Tier attempts, including retries.",
+    "successes": "Attempts that returned markdown.",
+    "fallbacks": "Tier runs that returned no markdown and handed off.",
+    "retries": "Attempts that failed and were retried.",
+    "rate_limited": "Attempts rejected with HTTP 429.",
+    "errors": "Attempts that failed with a fetch error other than 429.",
+    "bytes": "UTF-8 bytes of markdown returned.",
+    "tokens": "Markdown tokens reported by the server.",
+    "backoff_seconds": "Seconds spent waiting in retry backoff.",
+    "ratelimit_wait_seconds": "Seconds spent waiting for the client rate limiter.",
+}
+
+CIRCUIT_STATES = ("closed", "open", "half_open")
+
+
+class _Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds values <= ``buckets[i]``."""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self, size: int):
+        self.counts = [0] * (size + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class MarkdownMetrics:
+    """Thread-safe registry of per-tier counters and latency histograms.
+
+    Counters are keyed by one of ``COUNTERS`` and a tier name. Latency is
+    recorded per attempt in milliseconds into fixed buckets, from which
+    ``snapshot`` estimates percentiles.
+
+    Attributes:
+        buckets: Upper bounds of the latency buckets in milliseconds.
+        prefix: Metric name prefix used by ``to_prometheus``.
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS_MS,
+        prefix: str = "markdown_fetcher",
+    ):
+        """Initialize an empty registry.
+
+        Args:
+            buckets: Increasing latency bucket bounds in milliseconds.
+            prefix: Metric name prefix for Prometheus export.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._counters: dict[str, dict[str, float]] = {}
+        self._latency: dict[str, _Histogram] = {}
+        self._circuit_breaker: MarkdownCircuitBreaker | None = None
+        self._lock = threading.Lock()
+
+    def track_circuit_breaker(self, breaker: MarkdownCircuitBreaker) -> None:
+        """Export ``breaker``'s circuits alongside the recorded metrics.
+
+        The breaker already counts trips and rejected calls, so it is read at
+        ``snapshot`` time rather than mirrored on every request. ``reset``
+        leaves the breaker's own counters alone.
+
+        Args:
+            breaker: Circuit breaker keyed by tier name.
+        """
+        self._circuit_breaker = breaker
+
+    def increment(self, name: str, tier: str, value: float = 1) -> None:
+        """Add ``value`` to counter ``name`` for ``tier``.
+
+        Raises:
+            KeyError: If ``name`` is not one of ``COUNTERS``.
+        """
+        if name not in COUNTERS:
+            raise KeyError(f"Unknown markdown metric: {name}")
+        with self._lock:
+            tiers = self._counters.setdefault(name, {})
+            tiers[tier] = tiers.get(tier, 0) + value
+
+    def observe_latency(self, tier: str, latency_ms: float) -> None:
+        """Record the latency of one attempt for ``tier``."""
+        index = bisect_left(self.buckets, latency_ms)
+        with self._lock:
+            histogram = self._latency.get(tier)
+            if histogram is None:
+                histogram = self._latency[tier] = _Histogram(len(self.buckets))
+            histogram.counts[index] += 1
+            histogram.count += 1
+            histogram.sum += latency_ms
+
+    def counter(self, name: str, tier: str) -> float:
+        """Return the current value of counter ``name`` for ``tier``."""
+        with self._lock:
+            return self._counters.get(name, {}).get(tier, 0)
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._latency.clear()
+
+    def _percentile(self, histogram: _Histogram, pct: float) -> float:
+        """Estimate a percentile as the upper bound of its bucket."""
+        rank = pct / 100 * histogram.count
+        seen = 0
+        for bound, count in zip(self.buckets, histogram.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of every metric.
+
+        Returns:
+            Dict with ``counters`` (``{name: {tier: value}}``) and
+            ``latency_ms`` (``{tier: {count, sum, mean, p50, p95, p99,
+            buckets}}``), where ``buckets`` maps each upper bound, and
+            ``"+Inf"``, to the cumulative number of attempts. With a tracked
+            circuit breaker it also has ``circuits``, the breaker's
+            ``snapshot``.
+        """
+        circuits = self._circuit_breaker.snapshot() if self._circuit_breaker else None
+        with self._lock:
+            latency = {}
+            for tier, histogram in self._latency.items():
+                cumulative = {}
+                total = 0
+                for bound, count in zip(
+                    (*self.buckets, "+Inf"), histogram.counts, strict=True
+                ):
+                    total += count
+                    cumulative[str(bound)] = total
+                latency[tier] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count,
+                    "p50": self._percentile(histogram, 50),
+                    "p95": self._percentile(histogram, 95),
+                    "p99": self._percentile(histogram, 99),
+                    "buckets": cumulative,
+                }
+            snapshot = {
+                "counters": {
+                    name: dict(tiers) for name, tiers in self._counters.items()
+                },
+                "latency_ms": latency,
+            }
+        if circuits is not None:
+            snapshot["circuits"] = circuits
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, tiers in snapshot["counters"].items():
+            metric = f"{self.prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {COUNTERS[name]}")
+            lines.append(f"# TYPE {metric} counter")
+            for tier, value in sorted(tiers.items()):
+                lines.append(f'{metric}{{tier="{tier}"}} {_format(value)}')
+
+        if snapshot["latency_ms"]:
+            metric = f"{self.prefix}_attempt_latency_ms"
+            lines.append(f"# HELP {metric} Latency of one tier attempt.")
+            lines.append(f"# TYPE {metric} histogram")
+            for tier, histogram in sorted(snapshot["latency_ms"].items()):
+                for bound, count in histogram["buckets"].items():
+                    le = bound if bound == "+Inf" else _format(float(bound))
+                    lines.append(f'{metric}_bucket{{tier="{tier}",le="{le}"}} {count}')
+                lines.append(
+                    f'{metric}_sum{{tier="{tier}"}} {_format(histogram["sum"])}'
+                )
+                lines.append(f'{metric}_count{{tier="{tier}"}} {histogram["count"]}')
+
+        circuits = snapshot.get("circuits")
+        if circuits:
+            metric = f"{self.prefix}_circuit_state"
+            lines.append(f"# HELP {metric} Circuit breaker state; 1 for the current.")
+            lines.append(f"# TYPE {metric} gauge")
+            for tier, circuit in sorted(circuits.items()):
+                for state in CIRCUIT_STATES:
+                    value = int(circuit["state"] == state)
+                    lines.append(f'{metric}{{tier="{tier}",state="{state}"}} {value}')
+            for name, help_text in (
+                ("trips", "Times the circuit opened."),
+                ("rejected", "Calls failed fast while the circuit was open."),
+            ):
+                metric = f"{self.prefix}_circuit_{name}_total"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for tier, circuit in sorted(circuits.items()):
+                    lines.append(f'{metric}{{tier="{tier}"}} {circuit[name]}')
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format(value: float) -> str:
+    """Format a sample value, dropping the fraction of whole numbers."""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
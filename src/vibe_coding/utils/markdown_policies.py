@@ -0,0 +1,493 @@
+"""Adaptive policies for the markdown fetcher.
+
+This module holds the stateful policies that shape how ``MarkdownFetcher``
+calls its tiers:
+
+- ``MarkdownTierMemory``: remembers which tiers work per domain so ``auto``
+  mode can skip tiers that are known to fail.
+- ``MarkdownRateLimiter``: token bucket per host, shared across threads, that
+  throttles before the server rejects requests and honors Retry-After.
+- ``MarkdownCircuitBreaker``: stops calling a tier that keeps failing and
+  lets a single probe through after a cool-down.
+
+Example:
+    >>> from vibe_coding.utils.markdown_fetcher import MarkdownFetcher
+    >>> from vibe_coding.utils.markdown_policies import MarkdownTierMemory
+    >>> memory = MarkdownTierMemory(path="data/raw/tier_memory.json")
+    >>> with MarkdownFetcher(tier_memory=memory) as fetcher:
+    ...     result = fetcher.fetch("https://example.com")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from vibe_coding.utils.markdown_cache import _atomic_write
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownCircuitOpenError,
+    MarkdownTimeoutError,
+    _parse_rate_limit_reset,
+    _parse_retry_after,
+)
+
+
+class MarkdownTierMemory:
+    """Per-domain memory of which fetch tiers succeed.
+
+    Each (host, tier) pair keeps exponentially decaying success and failure
+    scores. A tier is skipped for a host while its decayed failure score is at
+    least ``skip_threshold`` and outweighs its successes. With the default
+    threshold of 0.5, a single miss skips the tier for one ``half_life``, after
+    which it is tried again; repeated misses extend the skip.
+
+    Attributes:
+        half_life: Seconds for a recorded outcome to lose half its weight.
+        skip_threshold: Decayed failure score at which a tier is skipped.
+        path: Optional JSON file used to persist the memory.
+    """
+
+    def __init__(
+        self,
+        half_life: float = 24 * 60 * 60,
+        skip_threshold: float = 0.5,
+        path: Path | str | None = None,
+    ):
+        """Initialize the memory, loading persisted state if available.
+
+        Args:
+            half_life: Seconds for a recorded outcome to lose half its weight.
+            skip_threshold: Decayed failure score at which a tier is skipped.
+            path: Optional JSON file to load from and ``save`` to.
+        """
+        self.half_life = half_life
+        self.skip_threshold = skip_threshold
+        self.path = Path(path) if path is not None else None
+        self._scores: dict[str, dict[str, list[float]]] = {}
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.load()
+
+    def _decayed(self, entry: list[float], now: float) -> tuple[float, float]:
+        """Return the (successes, failures) scores decayed to ``now``."""
+        successes, failures, updated_at = entry
+        factor = 0.5 ** (max(now - updated_at, 0.0) / self.half_life)
+        return successes * factor, failures * factor
+
+    def record(self, host: str, tier: str, success: bool) -> None:
+        """Record the outcome of a tier for a host.
+
+        Args:
+            host: Host (netloc) of the fetched URL.
+            tier: Tier name, such as "native" or "ai".
+            success: Whether the tier produced markdown.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._scores.setdefault(host, {}).get(tier, [0.0, 0.0, now])
+            successes, failures = self._decayed(entry, now)
+            if success:
+                successes += 1.0
+            else:
+                failures += 1.0
+            self._scores[host][tier] = [successes, failures, now]
+
+    def should_skip(self, host: str, tier: str) -> bool:
+        """Whether a tier is currently known to fail for a host.
+
+        Args:
+            host: Host (netloc) of the URL about to be fetched.
+            tier: Tier name, such as "native" or "ai".
+
+        Returns:
+            True if the tier should be skipped.
+        """
+        with self._lock:
+            entry = self._scores.get(host, {}).get(tier)
+            if entry is None:
+                return False
+            successes, failures = self._decayed(entry, time.time())
+        return failures >= self.skip_threshold and failures > successes
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Return the current decayed scores keyed by host and tier."""
+        now = time.time()
+        with self._lock:
+            return {
+                host: {
+                    tier: dict(
+                        zip(("successes", "failures"), self._decayed(entry, now))
+                    )
+                    for tier, entry in tiers.items()
+                }
+                for host, tiers in self._scores.items()
+            }
+
+    def load(self) -> None:
+        """Load persisted state from ``path``, ignoring missing or bad files."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            scores = {
+                host: {tier: [float(v) for v in entry] for tier, entry in tiers.items()}
+                for host, tiers in data.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self._scores = scores
+
+    def save(self) -> None:
+        """Persist the memory to ``path`` atomically, if a path is set."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps(self._scores)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.path, data)
+
+
+class MarkdownRateLimiter:
+    """Thread-safe token-bucket rate limiter keyed by host.
+
+    Each host gets a bucket holding up to ``burst`` tokens, refilled at
+    ``rate`` tokens per second. ``acquire`` blocks until a token is free;
+    ``acquire_async`` waits with ``asyncio.sleep`` instead, drawing from the
+    same buckets.
+    Server feedback (a 429 with Retry-After, or exhausted ``RateLimit-*``
+    quota headers) pauses the host for every caller until the given time.
+
+    Attributes:
+        rate: Default sustained requests per second per host.
+        burst: Default bucket capacity per host.
+        host_limits: Per-host ``(rate, burst)`` overrides.
+        jitter: Maximum random fraction added to waits so that blocked
+            callers do not wake up in lockstep.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 10,
+        host_limits: dict[str, tuple[float, int]] | None = None,
+        jitter: float = 0.1,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Default sustained requests per second per host.
+            burst: Default bucket capacity per host.
+            host_limits: Per-host ``(rate, burst)`` overrides, such as a
+                tighter limit for ``markdown.new``.
+            jitter: Maximum random fraction added to waits.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.host_limits = dict(host_limits or {})
+        self.jitter = jitter
+        # host -> [tokens, last_refill, blocked_until]
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _limits(self, host: str) -> tuple[float, int]:
+        """Return the (rate, burst) for a host."""
+        return self.host_limits.get(host, (self.rate, self.burst))
+
+    def _bucket_locked(self, host: str, now: float) -> list[float]:
+        """Return the refilled bucket for a host. Caller holds the lock."""
+        rate, burst = self._limits(host)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = [float(burst), now, 0.0]
+        else:
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+        return bucket
+
+    def _reserve(self, host: str) -> float | None:
+        """Take a token for ``host``, or return how long to wait for one.
+
+        Args:
+            host: Host the request is about to be sent to.
+
+        Returns:
+            None if a token was taken, otherwise seconds to wait (with
+            jitter) before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket_locked(host, now)
+            if now < bucket[2]:
+                wait = bucket[2] - now
+            elif bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return None
+            else:
+                wait = (1.0 - bucket[0]) / self._limits(host)[0]
+
+        if self.jitter > 0:
+            wait *= 1 + random.uniform(0, self.jitter)
+        return wait
+
+    def _check_deadline(
+        self, host: str, wait: float, deadline_at: float | None
+    ) -> None:
+        """Raise if waiting ``wait`` seconds would overrun ``deadline_at``."""
+        if deadline_at is not None and time.monotonic() + wait >= deadline_at:
+            raise MarkdownTimeoutError(f"Rate limit wait for {host} exceeds deadline")
+
+    def acquire(self, host: str, deadline_at: float | None = None) -> float:
+        """Block until a request to ``host`` is allowed.
+
+        Args:
+            host: Host the request is about to be sent to.
+            deadline_at: Optional ``time.monotonic()`` deadline. Instead of
+                waiting past it, the call fails immediately.
+
+        Returns:
+            Total seconds spent waiting.
+
+        Raises:
+            MarkdownTimeoutError: If the wait would overrun ``deadline_at``.
+        """
+        waited = 0.0
+        while (wait := self._reserve(host)) is not None:
+            self._check_deadline(host, wait, deadline_at)
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+    async def acquire_async(self, host: str, deadline_at: float | None = None) -> float:
+        """Wait without blocking the event loop until ``host`` is allowed.
+
+        Shares buckets and Retry-After pauses with ``acquire``, so sync and
+        async callers are limited together.
+
+        Args:
+            host: Host the request is about to be sent to.
+            deadline_at: Optional ``time.monotonic()`` deadline. Instead of
+                waiting past it, the call fails immediately.
+
+        Returns:
+            Total seconds spent waiting.
+
+        Raises:
+            MarkdownTimeoutError: If the wait would overrun ``deadline_at``.
+        """
+        waited = 0.0
+        while (wait := self._reserve(host)) is not None:
+            self._check_deadline(host, wait, deadline_at)
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    def penalize(self, host: str, delay: float) -> None:
+        """Pause all requests to ``host`` for ``delay`` seconds.
+
+        Args:
+            host: Host that asked us to slow down.
+            delay: Seconds before the next request may be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket_locked(host, now)
+            bucket[2] = max(bucket[2], now + delay)
+
+    def observe(self, host: str, headers: Any) -> None:
+        """Update a host's state from response headers.
+
+        Honors ``Retry-After`` and exhausted ``RateLimit-Remaining`` /
+        ``RateLimit-Reset`` quotas (including ``X-RateLimit-`` variants).
+
+        Args:
+            host: Host the response came from.
+            headers: Response headers.
+        """
+        delay = _parse_retry_after(headers)
+        if delay is None:
+            delay = _parse_rate_limit_reset(headers)
+        if delay is not None and delay > 0:
+            self.penalize(host, delay)
+
+
+class MarkdownCircuitBreaker:
+    """Thread-safe circuit breaker keyed by tier.
+
+    A circuit starts ``closed``. After ``failure_threshold`` failures within
+    ``window`` seconds it opens, and calls fail fast with
+    ``MarkdownCircuitOpenError`` for ``reset_timeout`` seconds. It then turns
+    ``half_open``: one probe call is let through while others keep failing
+    fast (another probe is allowed if the first never reports back within
+    ``reset_timeout``). A successful probe closes the circuit; a failed one reopens it.
+
+    Only timeouts, connection errors and 5xx responses count as failures.
+    Rate-limit and other 4xx responses count as successes: the service
+    answered, so a batch of bad URLs cannot open the circuit, and backoff is
+    left to the retry loop and rate limiter.
+
+    Attributes:
+        failure_threshold: Failures within ``window`` that open the circuit.
+        window: Seconds over which failures are counted.
+        reset_timeout: Seconds an open circuit waits before a probe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: float = 60.0,
+        reset_timeout: float = 30.0,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Failures within ``window`` that open the circuit.
+            window: Seconds over which failures are counted.
+            reset_timeout: Seconds an open circuit waits before a probe.
+        """
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self._circuits: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _circuit_locked(self, key: str) -> dict[str, Any]:
+        """Return the state for a key. Caller holds the lock."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = {
+                "state": self.CLOSED,
+                "failures": deque(),
+                "opened_at": 0.0,
+                "probing": False,
+                "probe_started": 0.0,
+                "trips": 0,
+                "rejected": 0,
+            }
+        return circuit
+
+    def _trip_locked(self, circuit: dict[str, Any], now: float) -> None:
+        """Open a circuit. Caller holds the lock."""
+        circuit["state"] = self.OPEN
+        circuit["opened_at"] = now
+        circuit["probing"] = False
+        circuit["trips"] += 1
+
+    def allow(self, key: str) -> None:
+        """Check whether a call for ``key`` may proceed.
+
+        Args:
+            key: Circuit key, such as the tier name.
+
+        Raises:
+            MarkdownCircuitOpenError: If the circuit is open, or half-open
+                with a probe already in flight.
+        """
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuit_locked(key)
+            if circuit["state"] == self.OPEN:
+                retry_after = circuit["opened_at"] + self.reset_timeout - now
+                if retry_after <= 0:
+                    circuit["state"] = self.HALF_OPEN
+            if circuit["state"] == self.CLOSED:
+                return
+            if circuit["state"] == self.HALF_OPEN and (
+                not circuit["probing"]
+                or now - circuit["probe_started"] >= self.reset_timeout
+            ):
+                circuit["probing"] = True
+                circuit["probe_started"] = now
+                return
+            circuit["rejected"] += 1
+            retry_after = max(circuit["opened_at"] + self.reset_timeout - now, 0.0)
+        raise MarkdownCircuitOpenError(
+            f"Circuit open for {key} tier; retry in {retry_after:.1f}s",
+            retry_after=retry_after,
+        )
+
+    def record_success(self, key: str) -> None:
+        """Record a successful call, closing a half-open circuit.
+
+        Args:
+            key: Circuit key, such as the tier name.
+        """
+        with self._lock:
+            circuit = self._circuit_locked(key)
+            if circuit["state"] == self.HALF_OPEN:
+                circuit["state"] = self.CLOSED
+                circuit["probing"] = False
+                circuit["failures"].clear()
+
+    def record_failure(self, key: str) -> None:
+        """Record a failed call, opening the circuit if the threshold is hit.
+
+        Args:
+            key: Circuit key, such as the tier name.
+        """
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuit_locked(key)
+            if circuit["state"] == self.HALF_OPEN:
+                self._trip_locked(circuit, now)
+                return
+            failures = circuit["failures"]
+            failures.append(now)
+            while failures and failures[0] <= now - self.window:
+                failures.popleft()
+            if circuit["state"] == self.CLOSED and (
+                len(failures) >= self.failure_threshold
+            ):
+                self._trip_locked(circuit, now)
+
+    def state(self, key: str) -> str:
+        """Return the current state of a circuit.
+
+        Args:
+            key: Circuit key, such as the tier name.
+
+        Returns:
+            ``"closed"``, ``"open"`` or ``"half_open"``. An open circuit whose
+            cool-down has elapsed reports ``"half_open"``.
+        """
+        with self._lock:
+            return self._state_locked(self._circuit_locked(key), time.monotonic())
+
+    def _state_locked(self, circuit: dict[str, Any], now: float) -> str:
+        """Return the effective state of a circuit. Caller holds the lock."""
+        if (
+            circuit["state"] == self.OPEN
+            and now >= circuit["opened_at"] + self.reset_timeout
+        ):
+            return self.HALF_OPEN
+        return circuit["state"]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return state and counters for every circuit, keyed by circuit key.
+
+        Each entry has ``state``, ``recent_failures`` (within ``window``),
+        ``trips`` (times opened) and ``rejected`` (calls failed fast).
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                key: {
+                    "state": self._state_locked(circuit, now),
+                    "recent_failures": sum(
+                        1 for t in circuit["failures"] if t > now - self.window
+                    ),
+                    "trips": circuit["trips"],
+                    "rejected": circuit["rejected"],
+                }
+                for key, circuit in self._circuits.items()
+            }
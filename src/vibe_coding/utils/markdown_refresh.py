@@ -0,0 +1,161 @@
+"""Incremental refresh of a markdown manifest.
+
+``refresh_manifest`` re-fetches a fixed set of URLs with ``fetch_markdown_many``
+and compares each page's markdown hash with the one recorded in the manifest.
+Only new or changed pages are written, so an unchanged site costs no disk
+writes and downstream processing can be limited to ``RefreshReport.written``.
+
+The manifest and page layout are the ones ``MarkdownCrawler`` produces, so a
+crawl directory can be refreshed in place. After a refresh the manifest is
+compacted to one line per URL.
+
+Example:
+    >>> from vibe_coding.utils.markdown_refresh import refresh_manifest
+    >>> report = refresh_manifest("data/raw/crawl/docs", urls=nightly_urls)
+    >>> print(report.counts)
+    {'added': 0, 'changed': 3, 'unchanged': 4211, 'failed': 2}
+    >>> for path in report.written:
+    ...     process(path)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from vibe_coding.utils.markdown_crawler import (
+    DEFAULT_CRAWL_DIR,
+    MANIFEST_FILE,
+    CrawlPage,
+    content_hash,
+    load_manifest,
+    normalize_url,
+    save_manifest,
+    utc_now,
+    write_page,
+)
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    fetch_markdown_many,
+)
+
+
+@dataclass
+class RefreshReport:
+    """Outcome of a manifest refresh.
+
+    Attributes:
+        added: URLs that were not in the manifest before.
+        changed: URLs whose markdown changed.
+        unchanged: URLs whose markdown is identical to the stored copy.
+        failed: URLs whose fetch failed; their previous files are kept.
+        written: Files written this run, for added and changed URLs.
+        manifest_path: Path of the manifest file.
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    written: list[Path] = field(default_factory=list)
+    manifest_path: Path | None = None
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of URLs per outcome."""
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "unchanged": len(self.unchanged),
+            "failed": len(self.failed),
+        }
+
+
+def refresh_manifest(
+    out_dir: Path | str = DEFAULT_CRAWL_DIR,
+    urls: Iterable[str] | None = None,
+    config: MarkdownFetcherConfig | None = None,
+    fetcher: MarkdownFetcher | None = None,
+    max_workers: int = 8,
+    max_per_host: int = 2,
+) -> RefreshReport:
+    """Re-fetch URLs and write only pages whose markdown changed.
+
+    Each successful fetch records its content hash, ETag, Last-Modified and
+    fetch time. ``changed_at`` moves only when the hash changes. A failed
+    fetch keeps the previous file and hash and records the error.
+
+    Args:
+        out_dir: Directory holding ``manifest.jsonl`` and the pages.
+        urls: URLs to refresh. Defaults to every URL in the manifest. URLs
+            in the manifest but not in ``urls`` are left untouched.
+        config: Optional fetch configuration.
+        fetcher: Optional fetcher, for example one with a
+            ``MarkdownDiskCache(ttl=0)`` so unchanged pages revalidate with a
+            conditional request.
+        max_workers: Maximum number of fetches in flight overall.
+        max_per_host: Maximum number of fetches in flight per host.
+
+    Returns:
+        RefreshReport with the URLs per outcome and the files written.
+
+    Raises:
+        MarkdownValidationError: If a concurrency limit is less than 1.
+    """
+    out_dir = Path(out_dir)
+    manifest_path = out_dir / MANIFEST_FILE
+    pages = load_manifest(manifest_path)
+    targets = (
+        list(pages) if urls is None else list(dict.fromkeys(map(normalize_url, urls)))
+    )
+    report = RefreshReport(manifest_path=manifest_path)
+
+    items = fetch_markdown_many(
+        targets,
+        config,
+        max_workers=max_workers,
+        max_per_host=max_per_host,
+        fetcher=fetcher,
+    )
+    for item in items:
+        previous = pages.get(item.url)
+        now = utc_now()
+        if not item.ok:
+            page = previous or CrawlPage(url=item.url, depth=0)
+            page.error = str(item.error)
+            page.fetched_at = now
+            pages[item.url] = page
+            report.failed.append(item.url)
+            continue
+
+        metadata = item.result.metadata
+        if (
+            previous is not None
+            and previous.path is not None
+            and previous.sha256 == content_hash(item.result.content)
+            and (out_dir / previous.path).exists()
+        ):
+            previous.fetched_at = now
+            previous.etag = metadata.etag or previous.etag
+            previous.last_modified = metadata.last_modified or previous.last_modified
+            previous.error = None
+            report.unchanged.append(item.url)
+            continue
+
+        page = CrawlPage(
+            url=item.url,
+            depth=previous.depth if previous is not None else 0,
+            fetched_at=now,
+        )
+        write_page(out_dir, page, item.result)
+        pages[item.url] = page
+        report.written.append(out_dir / page.path)
+        if previous is None or previous.sha256 is None:
+            report.added.append(item.url)
+        else:
+            report.changed.append(item.url)
+
+    save_manifest(manifest_path, pages.values())
+    return report
@@ -0,0 +1,561 @@
+"""BM25 full-text search over converted markdown.
+
+``MarkdownSearchIndex`` keeps an inverted index in a SQLite file: one posting
+per (term, document) with the term frequency and token positions. Documents
+are added one at a time as they are fetched, or streamed in bulk with
+``add_many``, which commits in batches and never holds more than one document
+in memory. Re-adding a URL replaces its postings; unchanged content is
+detected by hash and skipped.
+
+Queries are ranked with Okapi BM25. Double-quoted parts of a query are
+phrases: a document must contain each phrase's words consecutively to match.
+Other words are optional and only affect the ranking.
+
+Example:
+    >>> from vibe_coding.utils.markdown_search import (
+    ...     MarkdownSearchIndex,
+    ...     iter_crawl_documents,
+    ... )
+    >>> with MarkdownSearchIndex("data/raw/search/docs.sqlite3") as index:
+    ...     index.add_many(iter_crawl_documents("data/raw/crawl/docs"))
+    ...     results = index.search('retry "rate limit"', limit=5)
+    >>> for hit in results.hits:
+    ...     print(f"{hit.score:.2f} {hit.url} {hit.title}")
+    >>> results.took_ms
+    3.1
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import re
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from vibe_coding.utils.markdown_crawler import MANIFEST_FILE, load_manifest
+from vibe_coding.utils.markdown_fetcher import MarkdownResult, MarkdownValidationError
+
+DEFAULT_INDEX_PATH = (
+    Path(__file__).parent.parent.parent.parent / "data/raw/search/index.sqlite3"
+)
+
+_TOKEN = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+_TITLE = re.compile(r"^ {0,3}#{1,6}[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    sha256 TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (term, block)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats VALUES ('blocks', 0);
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def parse_query(query: str) -> tuple[list[str], list[list[str]]]:
+    """Split a query into free terms and double-quoted phrases.
+
+    Args:
+        query: Query string, such as ``'retry "rate limit"'``.
+
+    Returns:
+        Tuple of (terms, phrases), where each phrase is a list of tokens.
+        A quoted part with a single token counts as a term.
+    """
+    terms: list[str] = []
+    phrases: list[list[str]] = []
+    for quoted, word in _QUERY.findall(query):
+        tokens = tokenize(quoted if quoted else word)
+        if quoted and len(tokens) > 1:
+            phrases.append(tokens)
+        else:
+            terms.extend(tokens)
+    return terms, phrases
+
+
+@dataclass
+class SearchHit:
+    """A ranked search result.
+
+    Attributes:
+        url: URL of the matching document.
+        score: BM25 score; higher is better.
+        title: First heading of the document, or an empty string.
+    """
+
+    url: str
+    score: float
+    title: str
+
+
+@dataclass
+class SearchResults:
+    """Results of one query.
+
+    Attributes:
+        query: Query string as given.
+        hits: Best-scoring documents, best first.
+        total: Number of documents that matched.
+        took_ms: Query latency in milliseconds.
+    """
+
+    query: str
+    hits: list[SearchHit] = field(default_factory=list)
+    total: int = 0
+    took_ms: float = 0.0
+
+
+@dataclass
+class IndexReport:
+    """Outcome of adding documents to the index.
+
+    Attributes:
+        added: Documents indexed for the first time.
+        updated: Documents whose content changed and were re-indexed.
+        unchanged: Documents skipped because their content was unchanged.
+        took_ms: Time spent indexing, in milliseconds.
+    """
+
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    took_ms: float = 0.0
+
+
+class MarkdownSearchIndex:
+    """On-disk inverted index with BM25 ranking and phrase queries.
+
+    Postings are written in blocks: each flush (one ``add`` call, or one
+    ``add_many`` batch) stores one row per term with the document ids, term
+    frequencies and token positions of that batch. Replacing or removing a
+    document leaves its old postings in place and drops the document from
+    the live set; ``optimize`` merges each term's blocks into one and
+    discards postings of removed documents.
+
+    Only one process should write to an index at a time. Other processes
+    see new documents after reopening it.
+
+    Attributes:
+        path: SQLite file holding the index.
+        k1: BM25 term-frequency saturation.
+        b: BM25 document-length normalization.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_INDEX_PATH,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """Open an index, creating it if needed.
+
+        Args:
+            path: SQLite file (default: data/raw/search/index.sqlite3 in the
+                project root).
+            k1: BM25 term-frequency saturation.
+            b: BM25 document-length normalization, between 0 and 1.
+        """
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+        # Lengths of live documents; postings of other ids are ignored.
+        self._lengths: dict[int, int] = dict(
+            self._db.execute("SELECT id, length FROM docs")
+        )
+        self._tokens = sum(self._lengths.values())
+        self._pending: dict[str, _Postings] = {}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> MarkdownSearchIndex:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._lengths)
+
+    def __contains__(self, url: object) -> bool:
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM docs WHERE url = ?", (url,))
+            return row.fetchone() is not None
+
+    def add(self, url: str, content: str | MarkdownResult) -> str:
+        """Index one document, replacing any previous version of ``url``.
+
+        Args:
+            url: URL identifying the document.
+            content: Markdown text or a fetch result.
+
+        Returns:
+            ``"added"``, ``"updated"`` or ``"unchanged"``.
+        """
+        with self._lock:
+            outcome = self._add_locked(url, content)
+            self._flush_locked()
+        return outcome
+
+    def add_many(
+        self,
+        documents: Iterable[tuple[str, str | MarkdownResult]],
+        batch_size: int = 1000,
+    ) -> IndexReport:
+        """Index a stream of ``(url, content)`` pairs.
+
+        Documents are consumed one at a time; postings are buffered for at
+        most ``batch_size`` documents and then written and committed, so the
+        corpus never has to fit in memory and an interrupted build keeps
+        every completed batch.
+
+        Args:
+            documents: Iterable of (url, markdown text or fetch result).
+            batch_size: Documents per posting block and transaction.
+
+        Returns:
+            IndexReport with per-outcome counts.
+
+        Raises:
+            MarkdownValidationError: If ``batch_size`` is less than 1.
+        """
+        if batch_size < 1:
+            raise MarkdownValidationError("batch_size must be at least 1")
+        report = IndexReport()
+        started = time.perf_counter()
+        pending = 0
+        for url, content in documents:
+            with self._lock:
+                outcome = self._add_locked(url, content)
+                pending += 1
+                if pending >= batch_size:
+                    self._flush_locked()
+                    pending = 0
+            setattr(report, outcome, getattr(report, outcome) + 1)
+        with self._lock:
+            self._flush_locked()
+        report.took_ms = (time.perf_counter() - started) * 1000
+        return report
+
+    def remove(self, url: str) -> bool:
+        """Remove a document from the index.
+
+        Returns:
+            True if the URL was indexed.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT id FROM docs WHERE url = ?", (url,))
+            row = row.fetchone()
+            if row is None:
+                return False
+            self._delete_locked(row[0])
+            self._db.commit()
+        return True
+
+    def optimize(self) -> None:
+        """Merge each term's posting blocks and drop removed documents.
+
+        Queries read every block of a term, so an index built from many
+        small ``add`` calls gets faster after optimizing. The merge runs one
+        term at a time.
+        """
+        with self._lock:
+            self._flush_locked()
+            terms = [row[0] for row in self._db.execute("SELECT term FROM postings")]
+            for term in dict.fromkeys(terms):
+                rows = self._db.execute(
+                    "SELECT block, data FROM postings WHERE term = ? ORDER BY block",
+                    (term,),
+                ).fetchall()
+                merged = _Postings()
+                stored = 0
+                for _, data in rows:
+                    postings = _Postings.decode(data)
+                    stored += len(postings.doc_ids)
+                    for doc_id, positions in postings:
+                        if doc_id in self._lengths:
+                            merged.add(doc_id, positions)
+                if len(rows) == 1 and len(merged.doc_ids) == stored:
+                    continue
+                self._db.execute("DELETE FROM postings WHERE term = ?", (term,))
+                if merged.doc_ids:
+                    self._db.execute(
+                        "INSERT INTO postings VALUES (?, ?, ?)",
+                        (term, rows[-1][0], merged.encode()),
+                    )
+            self._db.commit()
+            self._db.execute("VACUUM")
+
+    def search(self, query: str, limit: int = 10) -> SearchResults:
+        """Rank indexed documents against a query with BM25.
+
+        Args:
+            query: Words and double-quoted phrases. Every phrase must occur
+                in a matching document; free words only affect the score.
+            limit: Maximum number of hits to return.
+
+        Returns:
+            SearchResults with the best hits and the query latency.
+        """
+        started = time.perf_counter()
+        terms, phrases = parse_query(query)
+        with self._lock:
+            scores = self._score_locked(terms, phrases)
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            documents = self._documents_locked([doc_id for doc_id, _ in best])
+        hits = []
+        for doc_id, score in best:
+            url, title = documents[doc_id]
+            hits.append(SearchHit(url=url, score=score, title=title))
+        return SearchResults(
+            query=query,
+            hits=hits,
+            total=len(scores),
+            took_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def _score_locked(
+        self, terms: list[str], phrases: list[list[str]]
+    ) -> dict[int, float]:
+        """Return the BM25 score of every matching document."""
+        lengths = self._lengths
+        if not lengths or not (terms or phrases):
+            return {}
+        average = self._tokens / len(lengths)
+
+        required: set[int] | None = None
+        for phrase in phrases:
+            matches = self._phrase_docs_locked(phrase)
+            required = matches if required is None else required & matches
+            if not required:
+                return {}
+
+        scores: dict[int, float] = defaultdict(float)
+        query_terms = dict.fromkeys(terms + [t for phrase in phrases for t in phrase])
+        for term in query_terms:
+            postings = [
+                (doc_id, tf)
+                for block in self._blocks_locked(term)
+                for doc_id, tf in zip(block.doc_ids, block.frequencies)
+                if doc_id in lengths
+            ]
+            frequency = len(postings)
+            idf = math.log(1 + (len(lengths) - frequency + 0.5) / (frequency + 0.5))
+            for doc_id, tf in postings:
+                if required is not None and doc_id not in required:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * lengths[doc_id] / average)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def _phrase_docs_locked(self, phrase: list[str]) -> set[int]:
+        """Return the ids of documents containing ``phrase`` verbatim."""
+        blocks = {term: self._blocks_locked(term) for term in phrase}
+        # Start from the rarest word so later words only check a few documents.
+        order = sorted(
+            enumerate(phrase),
+            key=lambda item: sum(len(block.doc_ids) for block in blocks[item[1]]),
+        )
+        candidates: dict[int, set[int]] | None = None
+        for offset, term in order:
+            current: dict[int, set[int]] = {}
+            for block in blocks[term]:
+                for doc_id, positions in block:
+                    if doc_id not in self._lengths or (
+                        candidates is not None and doc_id not in candidates
+                    ):
+                        continue
+                    starts = {position - offset for position in positions}
+                    if candidates is not None:
+                        starts &= candidates[doc_id]
+                    if starts:
+                        current[doc_id] = starts
+            candidates = current
+            if not candidates:
+                break
+        return set(candidates or ())
+
+    def _blocks_locked(self, term: str) -> list[_Postings]:
+        """Return every posting block of a term."""
+        rows = self._db.execute("SELECT data FROM postings WHERE term = ?", (term,))
+        return [_Postings.decode(data) for (data,) in rows]
+
+    def _documents_locked(self, doc_ids: list[int]) -> dict[int, tuple[str, str]]:
+        """Return ``{doc_id: (url, title)}`` for the given documents."""
+        if not doc_ids:
+            return {}
+        marks = ",".join("?" * len(doc_ids))
+        rows = self._db.execute(
+            f"SELECT id, url, title FROM docs WHERE id IN ({marks})", doc_ids
+        )
+        return {doc_id: (url, title) for doc_id, url, title in rows}
+
+    def _add_locked(self, url: str, content: str | MarkdownResult) -> str:
+        """Index one document into the pending batch. Caller holds the lock."""
+        if isinstance(content, MarkdownResult):
+            content = content.content
+        sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        row = self._db.execute(
+            "SELECT id, sha256 FROM docs WHERE url = ?", (url,)
+        ).fetchone()
+        if row is not None and row[1] == sha256:
+            return "unchanged"
+        if row is not None:
+            self._delete_locked(row[0])
+
+        tokens = _TOKEN.findall(content.lower())
+        length = len(tokens)
+        positions: dict[str, list[int]] = {}
+        for position, token in enumerate(tokens):
+            if token in positions:
+                positions[token].append(position)
+            else:
+                positions[token] = [position]
+        title = _TITLE.search(content)
+
+        doc_id = self._db.execute(
+            "INSERT INTO docs (url, sha256, length, title) VALUES (?, ?, ?, ?)",
+            (url, sha256, length, title.group(1) if title else ""),
+        ).lastrowid
+        pending = self._pending
+        for term, offsets in positions.items():
+            postings = pending.get(term)
+            if postings is None:
+                postings = pending[term] = _Postings()
+            postings.doc_ids.append(doc_id)
+            postings.frequencies.append(len(offsets))
+            postings.positions.extend(offsets)
+        self._lengths[doc_id] = length
+        self._tokens += length
+        return "added" if row is None else "updated"
+
+    def _flush_locked(self) -> None:
+        """Write the pending batch as one block per term and commit."""
+        if self._pending:
+            self._db.execute("UPDATE stats SET value = value + 1 WHERE key = 'blocks'")
+            block = self._db.execute(
+                "SELECT value FROM stats WHERE key = 'blocks'"
+            ).fetchone()[0]
+            self._db.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?)",
+                (
+                    (term, block, postings.encode())
+                    for term, postings in self._pending.items()
+                ),
+            )
+            self._pending.clear()
+        self._db.commit()
+
+    def _delete_locked(self, doc_id: int) -> None:
+        """Drop a document from the live set. Caller holds the lock."""
+        self._db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+        self._tokens -= self._lengths.pop(doc_id, 0)
+
+
+def iter_crawl_documents(out_dir: Path | str) -> Iterator[tuple[str, str]]:
+    """Yield ``(url, markdown)`` for every page in a crawl directory.
+
+    Pages are read one at a time, in manifest order. Entries without a file
+    (failed fetches) are skipped.
+
+    Args:
+        out_dir: Directory written by ``MarkdownCrawler`` or
+            ``refresh_manifest``.
+
+    Yields:
+        Tuples of URL and markdown content.
+    """
+    out_dir = Path(out_dir)
+    for url, page in load_manifest(out_dir / MANIFEST_FILE).items():
+        if page.path is None:
+            continue
+        try:
+            yield url, (out_dir / page.path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue
+
+
+class _Postings:
+    """Postings of one term: document ids, frequencies and positions.
+
+    Encoded as native unsigned 32-bit integers: entry count, document ids,
+    term frequencies, then every entry's positions back to back. Arrays keep
+    a large pending batch out of the garbage collector's way.
+    """
+
+    __slots__ = ("doc_ids", "frequencies", "positions")
+
+    def __init__(self) -> None:
+        self.doc_ids = array("I")
+        self.frequencies = array("I")
+        self.positions = array("I")
+
+    def add(self, doc_id: int, positions: Iterable[int]) -> None:
+        """Append a document's positions for this term."""
+        start = len(self.positions)
+        self.positions.extend(positions)
+        self.doc_ids.append(doc_id)
+        self.frequencies.append(len(self.positions) - start)
+
+    def __iter__(self) -> Iterator[tuple[int, array]]:
+        """Yield ``(doc_id, positions)`` for every entry."""
+        start = 0
+        for doc_id, frequency in zip(self.doc_ids, self.frequencies):
+            yield doc_id, self.positions[start : start + frequency]
+            start += frequency
+
+    def encode(self) -> bytes:
+        """Serialize to a posting block."""
+        count = array("I", [len(self.doc_ids)])
+        return b"".join(
+            values.tobytes()
+            for values in (count, self.doc_ids, self.frequencies, self.positions)
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> _Postings:
+        """Deserialize a posting block."""
+        view = memoryview(data)
+        count = int.from_bytes(view[:4], sys.byteorder)
+        postings = cls()
+        postings.doc_ids.frombytes(view[4 : 4 + 4 * count])
+        postings.frequencies.frombytes(view[4 + 4 * count : 4 + 8 * count])
+        postings.positions.frombytes(view[4 + 8 * count :])
+        return postings
@@ -0,0 +1,455 @@
+"""Content-addressed, compressed storage for converted markdown.
+
+``MarkdownStore`` keeps each distinct document once, as a compressed blob
+named after the SHA-256 of its content, and maps URLs to blobs through an
+append-only ``index.jsonl``. Pages that convert to identical markdown (mirrors,
+redirects, the same page under different query strings) share one blob, and
+a URL lookup is a dictionary hit on the index loaded at startup.
+
+Blobs are compressed with zstd when ``zstandard`` is installed and with gzip
+otherwise. The codec is recorded per blob, so a store written with one codec
+stays readable after switching to the other. Content can be read whole with
+``get`` or streamed, decompressing as it goes, with ``open``/``iter_text``.
+
+Layout::
+
+    <directory>/
+        index.jsonl              # one JSON entry per put, last one wins
+        blobs/ab/ab12...ef.zst   # or .gz
+
+The store is safe to share between threads of one process. Concurrent writers
+in separate processes are not supported.
+
+Example:
+    >>> from vibe_coding.utils.markdown_store import MarkdownStore
+    >>> store = MarkdownStore("data/raw/store")
+    >>> store.put(url, fetch_markdown(url))
+    >>> with store.open(url) as f:
+    ...     for line in f:
+    ...         process(line)
+    >>> store.stats().saved_bytes
+    182736451
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from vibe_coding.utils.markdown_cache import _atomic_write
+from vibe_coding.utils.markdown_fetcher import (
+    STREAM_CHUNK_SIZE,
+    MarkdownFileResult,
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownValidationError,
+)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is missing
+    zstandard = None
+
+DEFAULT_STORE_DIR = Path(__file__).parent.parent.parent.parent / "data/raw/store"
+
+INDEX_FILE = "index.jsonl"
+BLOB_DIR = "blobs"
+
+CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+DEFAULT_LEVELS = {"zstd": 3, "gzip": 6}
+
+
+def default_codec() -> str:
+    """Return ``"zstd"`` if ``zstandard`` is installed, else ``"gzip"``."""
+    return "zstd" if zstandard is not None else "gzip"
+
+
+@dataclass
+class StoredDocument:
+    """Index entry mapping a URL to its content blob.
+
+    Attributes:
+        url: URL the document was fetched from.
+        sha256: SHA-256 hex digest of the UTF-8 content; names the blob.
+        size_bytes: Uncompressed size of the content in bytes.
+        codec: Compression codec of the blob, ``"zstd"`` or ``"gzip"``.
+        stored_at: Unix time when the entry was written.
+        metadata: Fetch metadata, as a ``MarkdownMetadata`` field dictionary.
+    """
+
+    url: str
+    sha256: str
+    size_bytes: int
+    codec: str
+    stored_at: float
+    metadata: dict
+
+
+@dataclass
+class StoreStats:
+    """Space usage of a store.
+
+    Attributes:
+        documents: Number of URLs in the index.
+        blobs: Number of distinct blobs referenced by the index.
+        raw_bytes: Uncompressed size of every URL's content, as if each were
+            stored as its own plain file.
+        stored_bytes: On-disk size of the referenced blobs.
+    """
+
+    documents: int
+    blobs: int
+    raw_bytes: int
+    stored_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved by deduplication and compression."""
+        return self.raw_bytes - self.stored_bytes
+
+    @property
+    def ratio(self) -> float:
+        """``raw_bytes / stored_bytes``, or 0.0 for an empty store."""
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 0.0
+
+
+class MarkdownStore:
+    """Deduplicating, compressed document store keyed by content hash.
+
+    Attributes:
+        directory: Root directory of the store.
+        codec: Codec used for new blobs.
+        level: Compression level used for new blobs.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_STORE_DIR,
+        codec: str | None = None,
+        level: int | None = None,
+    ):
+        """Open a store, loading its index if it exists.
+
+        Args:
+            directory: Root directory (default: data/raw/store in the project
+                root). Created on first write.
+            codec: ``"zstd"`` or ``"gzip"``. Defaults to zstd when
+                ``zstandard`` is installed, gzip otherwise.
+            level: Compression level. Defaults to 3 for zstd and 6 for gzip.
+
+        Raises:
+            MarkdownValidationError: If ``codec`` is unknown.
+            ImportError: If ``codec`` is ``"zstd"`` and ``zstandard`` is not
+                installed.
+        """
+        codec = codec or default_codec()
+        if codec not in CODEC_SUFFIXES:
+            raise MarkdownValidationError(
+                f"Unknown codec {codec!r}; expected one of {sorted(CODEC_SUFFIXES)}"
+            )
+        if codec == "zstd":
+            _require_zstandard()
+        self.directory = Path(directory)
+        self.codec = codec
+        self.level = DEFAULT_LEVELS[codec] if level is None else level
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the URL index file."""
+        return self.directory / INDEX_FILE
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def __contains__(self, url: object) -> bool:
+        with self._lock:
+            return url in self._index
+
+    def urls(self) -> list[str]:
+        """Return every URL in the index, in insertion order."""
+        with self._lock:
+            return list(self._index)
+
+    def lookup(self, url: str) -> StoredDocument | None:
+        """Return the index entry for a URL, or None if it is not stored."""
+        with self._lock:
+            return self._index.get(url)
+
+    def put(
+        self,
+        url: str,
+        result: MarkdownResult | MarkdownFileResult,
+    ) -> StoredDocument:
+        """Store a fetch result under ``url``.
+
+        Content already in the store is not written again; only the index
+        entry is added. A ``MarkdownFileResult`` from ``fetch_to_file`` is
+        compressed straight from its file.
+
+        Args:
+            url: URL the result was fetched from.
+            result: Result from ``fetch_markdown`` or ``fetch_to_file``.
+
+        Returns:
+            The new index entry.
+        """
+        if isinstance(result, MarkdownFileResult):
+            return self.put_stream(url, _read_file(result.path), result.metadata)
+
+        data = result.content.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        codec = self._existing_codec(sha256)
+        if codec is None:
+            codec = self.codec
+            path = self._blob_path(sha256, codec)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write_bytes(path, _compress(data, codec, self.level))
+        return self._record(url, sha256, len(data), codec, result.metadata)
+
+    def put_stream(
+        self,
+        url: str,
+        pieces: Iterable[str],
+        metadata: MarkdownMetadata,
+    ) -> StoredDocument:
+        """Store content given as text pieces, compressing as they arrive.
+
+        The content is hashed and compressed into a temporary file in one
+        pass, so it never has to fit in memory. The file is discarded if an
+        identical blob already exists.
+
+        Args:
+            url: URL the content was fetched from.
+            pieces: Consecutive pieces of the content, such as the output of
+                ``MarkdownFetcher.iter_markdown``.
+            metadata: Fetch metadata to record with the entry.
+
+        Returns:
+            The new index entry.
+        """
+        blob_dir = self.directory / BLOB_DIR
+        blob_dir.mkdir(parents=True, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=blob_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with _compressor(raw, self.codec, self.level) as writer:
+                    for piece in pieces:
+                        data = piece.encode("utf-8")
+                        hasher.update(data)
+                        size += len(data)
+                        writer.write(data)
+            sha256 = hasher.hexdigest()
+            codec = self._existing_codec(sha256)
+            if codec is None:
+                codec = self.codec
+                path = self._blob_path(sha256, codec)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_name, path)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+        return self._record(url, sha256, size, codec, metadata)
+
+    def get(self, url: str) -> MarkdownResult | None:
+        """Return the stored result for a URL, or None if it is not stored."""
+        document = self.lookup(url)
+        if document is None:
+            return None
+        with self._open_blob(document) as f:
+            content = f.read()
+        return MarkdownResult(
+            content=content, metadata=MarkdownMetadata(**document.metadata)
+        )
+
+    def open(self, url: str) -> TextIO:
+        """Open a URL's content as a text stream that decompresses on read.
+
+        Args:
+            url: Stored URL.
+
+        Returns:
+            Text file object; close it, or use it as a context manager.
+
+        Raises:
+            KeyError: If the URL is not stored.
+        """
+        document = self.lookup(url)
+        if document is None:
+            raise KeyError(url)
+        return self._open_blob(document)
+
+    def iter_text(self, url: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+        """Yield a URL's content in pieces of about ``chunk_size`` characters.
+
+        Args:
+            url: Stored URL.
+            chunk_size: Characters per yielded piece.
+
+        Yields:
+            Consecutive pieces of the content.
+
+        Raises:
+            KeyError: If the URL is not stored.
+        """
+        with self.open(url) as f:
+            while piece := f.read(chunk_size):
+                yield piece
+
+    def stats(self) -> StoreStats:
+        """Compute space usage for the URLs in the index."""
+        with self._lock:
+            documents = list(self._index.values())
+        blobs = {(doc.sha256, doc.codec) for doc in documents}
+        stored = 0
+        for sha256, codec in blobs:
+            try:
+                stored += self._blob_path(sha256, codec).stat().st_size
+            except OSError:
+                pass
+        return StoreStats(
+            documents=len(documents),
+            blobs=len(blobs),
+            raw_bytes=sum(doc.size_bytes for doc in documents),
+            stored_bytes=stored,
+        )
+
+    def compact(self) -> int:
+        """Rewrite the index with one entry per URL and delete orphan blobs.
+
+        Blobs become orphans when every URL pointing at them is re-stored with
+        different content. Run this while no other thread is writing.
+
+        Returns:
+            Number of blob files removed.
+        """
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _atomic_write(
+                self.index_path,
+                "".join(json.dumps(vars(doc)) + "\n" for doc in self._index.values()),
+            )
+            referenced = {
+                self._blob_path(doc.sha256, doc.codec) for doc in self._index.values()
+            }
+            removed = 0
+            for path in (self.directory / BLOB_DIR).glob("*/*"):
+                if path not in referenced:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+            return removed
+
+    def _blob_path(self, sha256: str, codec: str) -> Path:
+        """Return the blob path for a content hash and codec."""
+        return self.directory / BLOB_DIR / sha256[:2] / (sha256 + CODEC_SUFFIXES[codec])
+
+    def _existing_codec(self, sha256: str) -> str | None:
+        """Return the codec of an existing blob for ``sha256``, if any."""
+        for codec in (self.codec, *CODEC_SUFFIXES):
+            if self._blob_path(sha256, codec).exists():
+                return codec
+        return None
+
+    def _open_blob(self, document: StoredDocument) -> TextIO:
+        """Open a document's blob as decompressed UTF-8 text."""
+        path = self._blob_path(document.sha256, document.codec)
+        if document.codec == "gzip":
+            return gzip.open(path, "rt", encoding="utf-8")
+        _require_zstandard()
+        raw = path.open("rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+
+    def _record(
+        self,
+        url: str,
+        sha256: str,
+        size: int,
+        codec: str,
+        metadata: MarkdownMetadata,
+    ) -> StoredDocument:
+        """Add an index entry in memory and append it to the index file."""
+        document = StoredDocument(
+            url=url,
+            sha256=sha256,
+            size_bytes=size,
+            codec=codec,
+            stored_at=time.time(),
+            metadata=asdict(metadata),
+        )
+        line = json.dumps(vars(document)) + "\n"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self.index_path.open("a", encoding="utf-8") as f:
+                f.write(line)
+            self._index.pop(url, None)
+            self._index[url] = document
+        return document
+
+    def _load_index(self) -> dict[str, StoredDocument]:
+        """Read the index file, keeping the last entry for each URL."""
+        index: dict[str, StoredDocument] = {}
+        try:
+            with self.index_path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        document = StoredDocument(**json.loads(line))
+                        index.pop(document.url, None)
+                        index[document.url] = document
+        except FileNotFoundError:
+            pass
+        return index
+
+
+def _require_zstandard() -> None:
+    """Raise ImportError if the zstd codec is unavailable."""
+    if zstandard is None:
+        raise ImportError(
+            "The zstd codec requires zstandard. Install it with: uv sync --extra store"
+        )
+
+
+def _compress(data: bytes, codec: str, level: int) -> bytes:
+    """Compress a whole document with ``codec``."""
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _compressor(raw: BinaryIO, codec: str, level: int) -> BinaryIO:
+    """Wrap ``raw`` in a streaming compressor that leaves it open on close."""
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=level, mtime=0)
+    return zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=False)
+
+
+def _read_file(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Yield a UTF-8 file's text in pieces."""
+    with path.open(encoding="utf-8") as f:
+        while piece := f.read(chunk_size):
+            yield piece
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file atomically via a temporary file and rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
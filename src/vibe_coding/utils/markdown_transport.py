@@ -0,0 +1,253 @@
+"""Pluggable HTTP transports for the markdown fetcher.
+
+``MarkdownFetcher`` sends every request through a ``requests`` transport
+adapter mounted for ``http://`` and ``https://``. By default that is requests'
+own pooled ``HTTPAdapter``, which speaks HTTP/1.1 and therefore needs one
+connection per in-flight request. ``HTTP2Adapter`` sends requests through an
+``httpx`` client with HTTP/2 enabled instead, so concurrent conversions sent
+to markdown.new share a few multiplexed connections.
+
+The adapter returns ordinary ``requests.Response`` objects and re-raises
+``httpx`` errors as the matching ``requests`` exceptions, so the fetch tiers
+and their error mapping work unchanged.
+
+Requires the optional HTTP/2 dependencies (``uv sync --extra http2``).
+
+Example:
+    >>> from vibe_coding.utils.markdown_fetcher import (
+    ...     MarkdownFetcher,
+    ...     MarkdownPoolConfig,
+    ... )
+    >>> with MarkdownFetcher(pool=MarkdownPoolConfig(http2=True)) as fetcher:
+    ...     result = fetcher.fetch("https://example.com")
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError as e:  # pragma: no cover - exercised without the extra
+    raise ImportError(
+        "markdown_transport requires httpx with HTTP/2 support. "
+        "Install it with: uv sync --extra http2"
+    ) from e
+
+# Connection-specific headers are forbidden in HTTP/2 (RFC 9113, section
+# 8.2.2); requests adds some of them by default.
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-connection",
+        "transfer-encoding",
+        "upgrade",
+        "host",
+    }
+)
+
+
+def _httpx_timeout(timeout: Any) -> httpx.Timeout:
+    """Convert a requests ``timeout`` argument into an ``httpx.Timeout``."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _request_error(
+    error: httpx.HTTPError, request: requests.PreparedRequest
+) -> requests.RequestException:
+    """Map an ``httpx`` error raised while sending to a requests exception."""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(str(error), request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.ReadTimeout(str(error), request=request)
+    return requests.ConnectionError(str(error), request=request)
+
+
+def _body_error(
+    error: httpx.HTTPError, request: requests.PreparedRequest
+) -> requests.RequestException:
+    """Map an ``httpx`` error raised while reading a body to a requests exception.
+
+    Mirrors ``requests.Response.iter_content``, which reports read timeouts
+    during the body as connection errors.
+    """
+    if isinstance(error, httpx.DecodingError):
+        return requests.exceptions.ContentDecodingError(str(error), request=request)
+    if isinstance(error, httpx.RemoteProtocolError):
+        return requests.exceptions.ChunkedEncodingError(str(error), request=request)
+    return requests.ConnectionError(str(error), request=request)
+
+
+class _HttpxRaw:
+    """File-like ``Response.raw`` stand-in over a streamed ``httpx.Response``.
+
+    ``requests.Response`` reads bodies through ``raw.stream()`` and releases
+    connections through ``raw.close()``. ``read(amt)`` is also supported for
+    callers that pull a bounded number of bytes from ``response.raw``.
+    """
+
+    def __init__(self, response: httpx.Response, request: requests.PreparedRequest):
+        self._response = response
+        self._request = request
+        self.http_version = response.http_version
+        self._chunks: Iterator[bytes] | None = None
+        self._buffer = bytearray()
+
+    def stream(
+        self, chunk_size: int | None = None, decode_content: bool = True
+    ) -> Iterator[bytes]:
+        """Yield body chunks, decompressed as ``requests`` would."""
+        chunks = (
+            self._response.iter_bytes(chunk_size)
+            if decode_content
+            else self._response.iter_raw(chunk_size)
+        )
+        try:
+            yield from chunks
+        except httpx.HTTPError as e:
+            raise _body_error(e, self._request) from e
+
+    def read(self, amt: int | None = None) -> bytes:
+        """Read up to ``amt`` bytes of the decoded body, or all that is left.
+
+        Successive calls continue where the previous one stopped; bytes of a
+        chunk beyond ``amt`` are buffered for the next call.
+        """
+        if self._chunks is None:
+            self._chunks = self.stream()
+        if amt is None:
+            data = bytes(self._buffer) + b"".join(self._chunks)
+            self._buffer.clear()
+            return data
+        while len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data = bytes(self._buffer[:amt])
+        del self._buffer[:amt]
+        return data
+
+    def close(self) -> None:
+        """Close the stream, returning its connection to the pool."""
+        self._response.close()
+
+    def release_conn(self) -> None:
+        """Alias of ``close`` for parity with urllib3 responses."""
+        self._response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """``requests`` transport adapter that multiplexes requests over HTTP/2.
+
+    Mount it on a session like any other adapter. Connections are pooled per
+    origin by a shared ``httpx.Client``; requests to an HTTP/2 origin share a
+    single connection (up to the server's concurrent stream limit), while
+    origins that only speak HTTP/1.1 fall back to one connection per request.
+
+    Cookies set by responses are not stored in the session's cookie jar, and
+    the per-request ``verify``, ``cert`` and ``proxies`` arguments are ignored
+    in favor of the settings given to the adapter.
+
+    Example:
+        >>> session = requests.Session()
+        >>> session.mount("https://", HTTP2Adapter())
+        >>> session.get("https://example.com").raw.http_version
+        'HTTP/2'
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = 20,
+        http1: bool = True,
+        verify: bool | str = True,
+    ):
+        """Initialize the adapter and its HTTP/2 client.
+
+        Args:
+            max_connections: Maximum number of open connections across all
+                origins. ``None`` means unlimited; when the limit is reached,
+                requests wait for a free connection up to their timeout.
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse.
+            http1: Allow falling back to HTTP/1.1. With ``False``, plain
+                ``http://`` origins are spoken to with HTTP/2 prior knowledge
+                (h2c), which is useful against local test servers.
+            verify: TLS verification: ``True``, ``False`` or a CA bundle path.
+        """
+        super().__init__()
+        self._client = httpx.Client(
+            http1=http1,
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            follow_redirects=False,
+            trust_env=False,
+        )
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        """Send a prepared request and return a ``requests.Response``.
+
+        Raises:
+            requests.ConnectTimeout: If connecting timed out.
+            requests.ReadTimeout: If the response did not arrive in time.
+            requests.ConnectionError: On any other transport failure.
+        """
+        headers = [
+            (key, value)
+            for key, value in request.headers.items()
+            if key.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        outgoing = self._client.build_request(
+            request.method or "GET",
+            request.url or "",
+            headers=headers,
+            content=request.body,
+            timeout=_httpx_timeout(timeout),
+        )
+        try:
+            response = self._client.send(outgoing, stream=True)
+        except httpx.HTTPError as e:
+            raise _request_error(e, request) from e
+        return self._build_response(request, response)
+
+    def _build_response(
+        self, request: requests.PreparedRequest, response: httpx.Response
+    ) -> requests.Response:
+        built = requests.Response()
+        built.status_code = response.status_code
+        built.headers = CaseInsensitiveDict(response.headers.items())
+        built.encoding = get_encoding_from_headers(built.headers)
+        built.reason = response.reason_phrase
+        built.url = request.url or ""
+        built.request = request
+        built.raw = _HttpxRaw(response, request)
+        built.connection = self
+        return built
+
+    def close(self) -> None:
+        """Close the client and every pooled connection."""
+        self._client.close()
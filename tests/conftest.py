@@ -48,7 +48,7 @@ def clean_config():
     # Clear any cached config
     import vibe_coding.config
 
-    vibe_coding.config._config_instance = None
+    vibe_coding.config._registry.clear()
     yield
     # Clean up after test
-    vibe_coding.config._config_instance = None
+    vibe_coding.config._registry.clear()
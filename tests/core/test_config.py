@@ -2,8 +2,37 @@
 Test cases for the core configuration.
 """
 
-from vibe_coding.core.config import settings
+from vibe_coding.config import LayeredConfig
+from vibe_coding.core.config import LayeredSettingsSource, Settings, settings
 
 
 def test_project_name():
     assert settings.PROJECT_NAME == "Vibe Coding Data Science Template"
+
+
+class LayeredSettings(Settings):
+    PORT: int = 8000
+    TAGS: list[str] = []
+    model_config = {"env_prefix": "APP_"}
+
+    @classmethod
+    def settings_customise_sources(cls, settings_cls, init_settings, **kwargs):
+        table = LayeredConfig(
+            {"APP_PROJECT_NAME": "Layered", "app_port": "9000", "APP_TAGS": '["a"]'}
+        )
+        return (init_settings, LayeredSettingsSource(settings_cls, table))
+
+
+def test_settings_from_layered_config():
+    loaded = LayeredSettings()
+
+    assert loaded.PROJECT_NAME == "Layered"
+    assert loaded.PORT == 9000
+    assert loaded.TAGS == ["a"]
+    assert LayeredSettings(PORT=1).PORT == 1
+
+
+def test_default_settings_share_the_layered_table(clean_config, monkeypatch):
+    monkeypatch.setenv("PROJECT_NAME", "From Environment")
+
+    assert Settings().PROJECT_NAME == "From Environment"
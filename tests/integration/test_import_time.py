@@ -0,0 +1,123 @@
+"""Integration tests for lazy package imports and the import-time budget.
+
+These tests start fresh interpreters, so imports are measured cold, the way
+CLI and pipeline invocations pay for them. The wall-clock budget check only
+runs when ``IMPORT_TIME_BUDGET=1`` is set (``make import-budget``, and its own CI
+job), on the Python minor version the baseline was recorded with; the
+lazy-import checks always run.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import pytest
+
+from scripts.import_time import (
+    BASELINE_PATH,
+    PROJECT_ROOT,
+    compare,
+    measure,
+    parse_importtime,
+)
+
+HEAVY_MODULES = ("fastapi", "pydantic", "pydantic_settings", "requests", "httpx")
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | site
+-- import_time start --
+import time:       300 |        300 |     json.decoder
+import time:       200 |        500 |   json
+import time:       100 |        600 | vibe_coding.config
+import time:        50 |         50 | other
+"""
+
+
+def _loaded_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys; print(' '.join(sys.modules))"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestParseImporttime:
+    """Tests for parse_importtime and ImportProfile."""
+
+    def test_parses_records_after_marker(self):
+        """Test that startup imports before the marker are skipped."""
+        records = parse_importtime(SAMPLE)
+
+        assert [r.module for r in records] == [
+            "json.decoder",
+            "json",
+            "vibe_coding.config",
+            "other",
+        ]
+        assert [r.depth for r in records] == [2, 1, 0, 0]
+        assert records[1].self_us == 200
+        assert records[1].cumulative_us == 500
+
+    def test_compare_applies_tolerance_and_slack(self):
+        """Test budget comparison."""
+        budgets = {"a": 10.0, "b": 100.0}
+
+        assert compare({"a": 16.0, "b": 150.0}, budgets, 0.5, slack_ms=1.0) == []
+        regressions = compare({"a": 17.0, "b": 152.0}, budgets, 0.5, slack_ms=1.0)
+        assert [line.split(":")[0] for line in regressions] == ["a", "b"]
+
+
+class TestLazyImports:
+    """Tests that packages load their contents on first access."""
+
+    def test_package_import_loads_no_heavy_dependencies(self):
+        """Test that importing vibe_coding and its subpackages stays cheap."""
+        loaded = _loaded_modules(
+            "import vibe_coding, vibe_coding.api, vibe_coding.core, vibe_coding.utils"
+        )
+
+        assert not loaded.intersection(HEAVY_MODULES)
+        assert "vibe_coding.config" not in loaded
+
+    def test_attributes_load_on_access(self):
+        """Test that lazy names resolve to the real objects."""
+        import vibe_coding
+        import vibe_coding.utils
+        from vibe_coding.config import Config
+        from vibe_coding.utils import markdown_chunker
+
+        assert vibe_coding.Config is Config
+        assert vibe_coding.utils.markdown_chunker is markdown_chunker
+        assert "get_logger" in dir(vibe_coding)
+        with pytest.raises(AttributeError):
+            vibe_coding.missing  # noqa: B018
+
+
+BASELINE = json.loads(BASELINE_PATH.read_text())
+BASELINE_MINOR = ".".join(BASELINE["python"].split(".")[:2])
+
+
+@pytest.mark.skipif(
+    os.environ.get("IMPORT_TIME_BUDGET") != "1",
+    reason="wall-clock check; set IMPORT_TIME_BUDGET=1 to run",
+)
+@pytest.mark.skipif(
+    ".".join(platform.python_version_tuple()[:2]) != BASELINE_MINOR,
+    reason=f"baseline was recorded on Python {BASELINE_MINOR}",
+)
+class TestImportTimeBudget:
+    """Tests that cold-start import time stays within the recorded budget."""
+
+    def test_entry_points_within_budget(self):
+        """Test every budgeted entry point against scripts/baselines."""
+        budgets = BASELINE["budgets_ms"]
+
+        results = {name: measure(name, runs=3).total_ms for name in budgets}
+
+        assert compare(results, budgets, tolerance=1.0) == []
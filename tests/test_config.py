@@ -3,7 +3,21 @@
 This module tests the configuration management functionality.
 """
 
-from vibe_coding.config import Config, load_env_file
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from vibe_coding.config import (
+    Config,
+    ConfigRegistry,
+    LayeredConfig,
+    get_config,
+    get_layered_config,
+    load_config_file,
+    load_env_file,
+)
 
 
 class TestLoadEnvFile:
@@ -142,6 +156,332 @@ class TestConfig:
         assert config.get("ANY_KEY", "default") == "default"
 
 
+class TestConfigSnapshot:
+    """Tests for snapshot mode of Config."""
+
+    def test_snapshot_matches_dynamic_lookups(
+        self, sample_env_file, clean_config, monkeypatch
+    ):
+        """Test that snapshot lookups follow the dynamic precedence."""
+        monkeypatch.setenv("PORT", "9000")
+        monkeypatch.setenv("APP_API_KEY", "prefixed")
+        monkeypatch.setenv("DEBUG", "")
+
+        dynamic = Config(sample_env_file, prefix="APP_")
+        frozen = Config(sample_env_file, prefix="APP_", snapshot=True)
+
+        for key in ("DATABASE_URL", "API_KEY", "DEBUG", "PORT", "MISSING"):
+            assert frozen.get(key, "default") == dynamic.get(key, "default")
+        assert frozen.get_int("PORT") == 9000
+        assert frozen.get_bool("DEBUG") is True
+
+    def test_snapshot_ignores_changes_until_refresh(
+        self, temp_dir, clean_config, monkeypatch
+    ):
+        """Test that a snapshot is frozen until refresh is called."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("PORT=8080\nDEBUG=false")
+        config = Config(env_path, snapshot=True)
+        assert config.get_int("PORT") == 8080
+        assert config.get_bool("DEBUG") is False
+
+        monkeypatch.setenv("PORT", "9090")
+        env_path.write_text("PORT=8080\nDEBUG=true")
+
+        assert config.get_int("PORT") == 8080
+        assert config.get_bool("DEBUG") is False
+
+        config.refresh()
+
+        assert config.get_int("PORT") == 9090
+        assert config.get_bool("DEBUG") is True
+
+    def test_snapshot_typed_defaults(self, temp_dir, clean_config):
+        """Test typed defaults for missing and invalid snapshot values."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("PORT=not_a_number")
+        config = Config(env_path, snapshot=True)
+
+        assert config.get_int("PORT", default=3000) == 3000
+        assert config.get_int("PORT", default=4000) == 4000
+        assert config.get_int("MISSING", default=5) == 5
+        assert config.get_bool("MISSING", default=True) is True
+
+    def test_refresh_rereads_file_in_dynamic_mode(self, temp_dir, clean_config):
+        """Test that refresh picks up .env edits without snapshot mode."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=old")
+        config = Config(env_path)
+
+        env_path.write_text("KEY=new")
+        config.refresh()
+
+        assert config.get("KEY") == "new"
+
+
+class TestConfigHotReload:
+    """Tests for reload_interval and change callbacks."""
+
+    @staticmethod
+    def _rewrite(env_path, text):
+        """Atomically replace the file, with an mtime past the old one."""
+        stat = env_path.stat()
+        tmp_path = env_path.with_suffix(".tmp")
+        tmp_path.write_text(text)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        os.replace(tmp_path, env_path)
+
+    def test_lookup_reloads_changed_file(self, temp_dir, clean_config):
+        """Test that lookups pick up .env edits after the interval."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("PORT=8080")
+        config = Config(env_path, snapshot=True, reload_interval=0)
+
+        self._rewrite(env_path, "PORT=9090")
+
+        assert config.get_int("PORT") == 9090
+
+    def test_checks_are_rate_limited(self, temp_dir, clean_config):
+        """Test that the file is not checked again within the interval."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=old")
+        config = Config(env_path, reload_interval=3600)
+        assert config.get("KEY") == "old"
+
+        self._rewrite(env_path, "KEY=new")
+
+        with patch.object(config._env, "_stat", wraps=config._env._stat) as stat:
+            assert config.get("KEY") == "old"
+            assert stat.call_count == 0
+        assert config.reload_if_changed() is True
+        assert config.get("KEY") == "new"
+
+    def test_unchanged_file_is_not_reparsed(self, temp_dir, clean_config):
+        """Test that an unchanged signature skips parsing."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=value")
+        config = Config(env_path, reload_interval=0)
+
+        with patch("vibe_coding.config.load_env_file") as load:
+            assert config.get("KEY") == "value"
+            assert config.reload_if_changed() is False
+            load.assert_not_called()
+
+    def test_change_callbacks(self, temp_dir, clean_config):
+        """Test that callbacks receive the changed keys, and errors are contained."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("A=1\nB=2\nC=3")
+        config = Config(env_path, snapshot=True)
+        calls = []
+
+        @config.on_change
+        def failing(cfg, changed):
+            raise RuntimeError("boom")
+
+        config.on_change(lambda cfg, changed: calls.append((cfg.get("A"), changed)))
+
+        self._rewrite(env_path, "A=10\nB=2\nD=4")
+        assert config.reload_if_changed() is True
+        assert config.refresh() == set()
+
+        assert calls == [("10", {"A", "C", "D"})]
+
+    def test_readers_see_complete_configurations(self, temp_dir, clean_config):
+        """Test that concurrent readers never observe a partial reload."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("A=0\nB=0")
+        config = Config(env_path, snapshot=True, reload_interval=0)
+        mismatches = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                snapshot = config._snapshot
+                if snapshot.values["A"] != snapshot.values["B"]:
+                    mismatches.append(snapshot.values)
+                config.get("A")
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(1, 30):
+            self._rewrite(env_path, f"A={i}\nB={i}")
+            config.reload_if_changed()
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert mismatches == []
+        assert config.get("A") == "29"
+
+
+class TestConfigRegistry:
+    """Tests for ConfigRegistry and get_config."""
+
+    def test_get_config_is_keyed_by_file_and_prefix(self, temp_dir, clean_config):
+        """Test that get_config honors its arguments on every call."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=value")
+        other_path = temp_dir / "other.env"
+        other_path.write_text("KEY=other")
+
+        default = get_config(env_path)
+        prefixed = get_config(env_path, prefix="APP_")
+
+        assert get_config(str(temp_dir / "." / ".env")) is default
+        assert prefixed is not default
+        assert prefixed.prefix == "APP_"
+        assert get_config(other_path).get("KEY") == "other"
+
+    def test_views_share_one_parse(self, temp_dir, clean_config):
+        """Test that each file is parsed once for all prefixes and modes."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=value")
+
+        with patch("vibe_coding.config.load_env_file", wraps=load_env_file) as load:
+            views = [
+                get_config(env_path),
+                get_config(env_path, prefix="DB_"),
+                get_config(env_path, prefix="API_", snapshot=True),
+            ]
+
+        assert load.call_count == 1
+        assert views[0]._config is views[1]._config
+        assert all(view.get("KEY") == "value" for view in views)
+
+    def test_reload_through_one_view_updates_the_others(self, temp_dir, clean_config):
+        """Test that views notice a reload of their shared file."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=old")
+        first = get_config(env_path)
+        second = get_config(env_path, prefix="APP_", snapshot=True)
+
+        env_path.write_text("KEY=newer")
+        first.refresh()
+
+        assert second.reload_if_changed() is True
+        assert second.get("KEY") == "newer"
+
+    def test_concurrent_first_use_creates_one_instance(self, temp_dir, clean_config):
+        """Test that racing threads all receive the same Config."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=value")
+        registry = ConfigRegistry()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(registry.get(env_path, prefix="APP_"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(config) for config in results}) == 1
+
+    def test_after_fork_replaces_held_locks(self, temp_dir, clean_config):
+        """Test that a child can use configs whose locks were held at fork."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("KEY=value")
+        registry = ConfigRegistry()
+        config = registry.get(env_path, reload_interval=0)
+        registry._lock.acquire()
+        config._env._lock.acquire()
+
+        registry._after_fork()
+
+        assert registry.get(env_path, reload_interval=0) is config
+        assert config.refresh() == set()
+
+
+class TestLayeredConfig:
+    """Tests for load_config_file and LayeredConfig."""
+
+    def test_load_config_file_flattens_toml_and_json(self, temp_dir):
+        """Test that nested TOML and JSON tables become prefixed keys."""
+        toml_path = temp_dir / "config.toml"
+        toml_path.write_text('debug = true\n[db]\nhost = "toml"\nport = 5432\n')
+        json_path = temp_dir / "config.json"
+        json_path.write_text('{"db": {"host": "json", "replica": {"port": 6432}}}')
+
+        assert load_config_file(toml_path) == {
+            "DEBUG": True,
+            "DB_HOST": "toml",
+            "DB_PORT": 5432,
+        }
+        assert load_config_file(json_path) == {
+            "DB_HOST": "json",
+            "DB_REPLICA_PORT": 6432,
+        }
+        assert load_config_file(temp_dir / "missing.toml") == {}
+
+    def test_json_must_hold_an_object(self, temp_dir):
+        """Test that a JSON list is rejected."""
+        json_path = temp_dir / "config.json"
+        json_path.write_text("[1, 2]")
+
+        with pytest.raises(ValueError):
+            load_config_file(json_path)
+
+    def test_later_sources_take_precedence(self, temp_dir, monkeypatch):
+        """Test explicit precedence across .env, TOML and the environment."""
+        (temp_dir / "config.toml").write_text(
+            '[db]\nhost = "toml"\nport = 5432\nname = "app"\n'
+        )
+        (temp_dir / ".env").write_text("DB_HOST=dotenv\nDB_PORT=6000")
+        (temp_dir / ".env.local").write_text("DB_PORT=7000")
+        monkeypatch.setenv("DB_PORT", "8000")
+        monkeypatch.setenv("DB_NAME", "")
+
+        config = LayeredConfig(
+            temp_dir / "config.toml",
+            temp_dir / ".env",
+            temp_dir / ".env.local",
+            temp_dir / "missing.json",
+            os.environ,
+        )
+
+        assert config.get("DB_HOST") == "dotenv"
+        assert config.get_int("DB_PORT") == 8000
+        assert config.get("DB_NAME") == "app"
+
+    def test_sections_are_typed_and_nested(self):
+        """Test namespaced views over the resolution table."""
+        config = LayeredConfig(
+            {"DB_HOST": "db", "DB_RO_PORT": "6432", "DB_SSL": True, "API_X": "1"}
+        )
+        db = config.section("DB_")
+
+        assert db.get("HOST") == "db"
+        assert db.section("RO_").get_int("PORT") == 6432
+        assert db.get_bool("SSL") is True
+        assert db.get_int("HOST", default=5) == 5
+        assert "HOST" in db and "X" not in db
+        assert db.as_dict() == {"HOST": "db", "RO_PORT": "6432", "SSL": True}
+        with pytest.raises(KeyError):
+            db["MISSING"]
+
+    def test_reload_is_seen_by_sections(self, temp_dir):
+        """Test that reload swaps the table under existing sections."""
+        env_path = temp_dir / ".env"
+        env_path.write_text("DB_PORT=1")
+        config = LayeredConfig(env_path)
+        db = config.section("DB_")
+        assert db.get_int("PORT") == 1
+
+        env_path.write_text("DB_PORT=2")
+        config.reload()
+
+        assert db.get_int("PORT") == 2
+
+    def test_get_layered_config_is_shared(self, clean_config):
+        """Test that the default layered config is created once."""
+        assert get_layered_config() is get_layered_config()
+
+
 class TestConfigIntegration:
     """Integration tests for configuration."""
 
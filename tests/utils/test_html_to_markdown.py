@@ -0,0 +1,133 @@
+"""Tests for html_to_markdown module."""
+
+from vibe_coding.utils.html_to_markdown import (
+    MarkdownConverter,
+    convert_html,
+    html_to_markdown,
+)
+
+
+class TestHtmlToMarkdown:
+    """Tests for html_to_markdown conversion rules."""
+
+    def test_headings_and_paragraphs(self):
+        html = "<h1>Title</h1><p>First</p><h3>Sub</h3><p>Second</p>"
+        assert html_to_markdown(html) == "# Title\n\nFirst\n\n### Sub\n\nSecond\n"
+
+    def test_inline_formatting(self):
+        html = "<p>A <strong>bold</strong>, <em>soft</em> and <code>x = 1</code></p>"
+        assert html_to_markdown(html) == "A **bold**, *soft* and `x = 1`\n"
+
+    def test_whitespace_is_collapsed_and_br_kept(self):
+        html = "<p>one\n   two<br>three</p>"
+        assert html_to_markdown(html) == "one two\\\nthree\n"
+
+    def test_br_is_a_hard_break_inside_quotes_and_lists(self):
+        html = (
+            "<blockquote><p>a<br>b<br></p></blockquote>"
+            "<ul><li>c<br>d</li></ul><h2>e<br>f</h2>"
+        )
+        assert html_to_markdown(html) == "> a\\\n> b\n\n- c\\\n  d\n\n## e f\n"
+
+    def test_inline_code_with_backticks_uses_longer_delimiter(self):
+        html = "<p><code>a ` b</code> and <code>`x``</code></p>"
+        assert html_to_markdown(html) == "``a ` b`` and ``` `x`` ```\n"
+
+    def test_links_resolve_against_base_url(self):
+        html = '<p><a href="/docs">Docs</a> <a href="javascript:go()">Go</a></p>'
+        assert html_to_markdown(html, "https://example.com/a/") == (
+            "[Docs](https://example.com/docs) Go\n"
+        )
+
+    def test_images_only_with_retain_images(self):
+        html = '<p><img src="a.png" alt="Logo"> text</p>'
+        assert html_to_markdown(html) == "text\n"
+        assert html_to_markdown(html, "https://example.com/", retain_images=True) == (
+            "![Logo](https://example.com/a.png) text\n"
+        )
+
+    def test_nested_lists(self):
+        html = (
+            "<ul><li>one</li><li>two<ul><li>inner</li></ul></li><li>three</li></ul>"
+            '<ol start="3"><li>c</li><li>d</li></ol>'
+        )
+        assert html_to_markdown(html) == (
+            "- one\n- two\n  - inner\n- three\n\n3. c\n4. d\n"
+        )
+
+    def test_code_block_keeps_whitespace_and_language(self):
+        html = (
+            '<pre><code class="language-python">def f():\n'
+            "    return &lt;1&gt;\n</code></pre>"
+        )
+        assert html_to_markdown(html) == "```python\ndef f():\n    return <1>\n```\n"
+
+    def test_code_block_with_fences_uses_longer_fence(self):
+        html = "<pre>```python\nprint(1)\n```</pre>"
+        assert html_to_markdown(html) == "````\n```python\nprint(1)\n```\n````\n"
+
+    def test_blockquote(self):
+        html = "<blockquote><p>one</p><p>two</p></blockquote>"
+        assert html_to_markdown(html) == "> one\n>\n> two\n"
+
+    def test_table(self):
+        html = (
+            "<table><tr><th>Name</th><th>Value</th></tr>"
+            "<tr><td>a|b</td><td><b>1</b></td></tr><tr><td>c</td></tr></table>"
+        )
+        assert html_to_markdown(html) == (
+            "| Name | Value |\n| --- | --- |\n| a\\|b | **1** |\n| c |  |\n"
+        )
+
+    def test_non_content_elements_are_dropped(self):
+        html = (
+            "<html><head><title>T</title><style>p {}</style></head>"
+            "<body><script>var x;</script><p>Body</p><svg><text>x</text></svg>"
+            "</body></html>"
+        )
+        assert html_to_markdown(html) == "Body\n"
+
+    def test_unclosed_head_ends_at_body(self):
+        html = "<html><head><title>T</title><body><p>Body</p>"
+        assert html_to_markdown(html) == "Body\n"
+
+
+class TestConvertHtml:
+    """Tests for convert_html and adequacy detection."""
+
+    def test_chunked_input_matches_whole_input(self):
+        html = "<h2>Title</h2><p>Some <a href='/x'>linked</a> text</p>"
+        chunks = [html[i : i + 5] for i in range(0, len(html), 5)]
+
+        assert convert_html(chunks).markdown == convert_html(html).markdown
+
+    def test_reports_title_and_counts(self):
+        conversion = convert_html(
+            "<title>Page</title><script></script><p>Hello there</p>"
+        )
+
+        assert conversion.title == "Page"
+        assert conversion.script_count == 1
+        assert conversion.text_chars == len("Hello there")
+
+    def test_static_page_is_adequate(self):
+        conversion = convert_html("<article><p>" + "word " * 100 + "</p></article>")
+        assert conversion.is_adequate()
+
+    def test_js_shell_is_not_adequate(self):
+        html = (
+            '<body><div id="root"></div>'
+            "<noscript>You need to enable JavaScript to run this app.</noscript>"
+            '<script src="/bundle.js"></script></body>'
+        )
+        conversion = convert_html(html)
+
+        assert conversion.js_notice is True
+        assert not conversion.is_adequate()
+
+    def test_converter_is_incremental(self):
+        converter = MarkdownConverter()
+        converter.feed("<p>Hel")
+        converter.feed("lo</p>")
+
+        assert converter.finish().markdown == "Hello\n"
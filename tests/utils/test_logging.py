@@ -2,7 +2,21 @@
 Test cases for the logging utility.
 """
 
-from vibe_coding.utils.logging import logger
+import logging
+import queue
+import threading
+import time
+
+import pytest
+
+import vibe_coding.utils.logging as logging_module
+from vibe_coding.utils.log_queue import BoundedQueueHandler, LogQueueStats
+from vibe_coding.utils.logging import (
+    get_log_queue_stats,
+    logger,
+    setup_logging,
+    shutdown_logging,
+)
 
 
 def test_logger_name():
@@ -11,3 +25,126 @@ def test_logger_name():
 
 def test_logger_level():
     assert logger.level == 20  # INFO level
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def _drain(log_queue):
+    items = []
+    while not log_queue.empty():
+        items.append(log_queue.get_nowait().getMessage())
+    return items
+
+
+def test_async_mode_writes_through_listener(tmp_path, restore_root_logger):
+    log_file = tmp_path / "app.log"
+    setup_logging(
+        log_file=log_file, async_mode=True, format_string="%(levelname)s %(message)s"
+    )
+
+    assert isinstance(restore_root_logger.handlers[0], BoundedQueueHandler)
+    logging.getLogger("test").info("hello %s", "world")
+    assert get_log_queue_stats().enqueued == 1
+
+    shutdown_logging()
+
+    assert log_file.read_text() == "INFO hello world\n"
+    assert get_log_queue_stats() is None
+    assert not any(
+        isinstance(h, BoundedQueueHandler) for h in restore_root_logger.handlers
+    )
+
+
+def test_drop_new_keeps_queued_records():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, overflow="drop_new")
+
+    for i in range(5):
+        handler.emit(_record(f"m{i}"))
+
+    assert _drain(log_queue) == ["m0", "m1"]
+    assert handler.stats == LogQueueStats(
+        enqueued=2, blocked=0, dropped_new=3, dropped_oldest=0
+    )
+
+
+def test_drop_oldest_keeps_recent_records():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, overflow="drop_oldest")
+
+    for i in range(5):
+        handler.emit(_record(f"m{i}"))
+
+    assert _drain(log_queue) == ["m3", "m4"]
+    assert handler.stats.dropped_oldest == 3
+    assert handler.stats.enqueued == 5
+
+
+def test_block_waits_for_room():
+    log_queue = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(log_queue, overflow="block")
+    handler.emit(_record("first"))
+    timer = threading.Timer(0.1, log_queue.get)
+    timer.start()
+
+    started = time.perf_counter()
+    handler.emit(_record("second"))
+
+    assert time.perf_counter() - started >= 0.05
+    assert _drain(log_queue) == ["second"]
+    assert handler.stats.blocked == 1
+    timer.join()
+
+
+def test_slow_handler_does_not_block_callers(restore_root_logger):
+    class SlowHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            time.sleep(0.01)
+            self.messages.append(record.getMessage())
+
+    setup_logging(async_mode=True, queue_size=100)
+    slow = SlowHandler()
+    logging_module._listener.handlers = (slow,)
+
+    started = time.perf_counter()
+    for i in range(20):
+        logging.getLogger("test").info("m%d", i)
+    elapsed = time.perf_counter() - started
+    shutdown_logging()
+
+    assert elapsed < 0.1
+    assert slow.messages == [f"m{i}" for i in range(20)]
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError, match="overflow"):
+        BoundedQueueHandler(queue.Queue(maxsize=1), overflow="spill")
+
+
+def test_invalid_overflow_keeps_previous_setup(tmp_path, restore_root_logger):
+    setup_logging(async_mode=True)
+    previous = restore_root_logger.handlers[:]
+    log_file = tmp_path / "app.log"
+
+    with pytest.raises(ValueError, match="overflow"):
+        setup_logging(log_file=log_file, async_mode=True, overflow="spill")
+
+    assert restore_root_logger.handlers == previous
+    assert get_log_queue_stats() is not None
+    assert not log_file.exists()
@@ -0,0 +1,341 @@
+"""Tests for markdown_cache module."""
+
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vibe_coding.utils.markdown_cache import (
+    CachedMarkdown,
+    MarkdownDiskCache,
+    MarkdownMemoryCache,
+    cache_key,
+)
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownTimeoutError,
+    _fetch_with_accept_header,
+    fetch_markdown,
+)
+
+
+def _result(content="# Cached", method="ai", status_code=200, etag=None):
+    return MarkdownResult(
+        content=content,
+        metadata=MarkdownMetadata(
+            token_count=10,
+            method_used=method,
+            status_code=status_code,
+            response_time_ms=5.0,
+            etag=etag,
+            last_modified="Wed, 21 Oct 2026 07:28:00 GMT" if etag else None,
+        ),
+    )
+
+
+class TestCacheKey:
+    """Tests for cache_key function."""
+
+    def test_key_depends_on_method_and_images(self):
+        base = cache_key("https://example.com", MarkdownFetcherConfig())
+        assert base == cache_key("https://example.com", MarkdownFetcherConfig())
+        assert base != cache_key(
+            "https://example.com", MarkdownFetcherConfig(method="ai")
+        )
+        assert base != cache_key(
+            "https://example.com", MarkdownFetcherConfig(retain_images=True)
+        )
+
+    def test_key_depends_on_conversion_path(self):
+        base = cache_key("https://example.com", MarkdownFetcherConfig())
+        assert base != cache_key(
+            "https://example.com", MarkdownFetcherConfig(local_conversion=True)
+        )
+        assert base != cache_key(
+            "https://example.com",
+            MarkdownFetcherConfig(endpoint="https://md.internal.example/"),
+        )
+        assert base == cache_key(
+            "https://example.com", MarkdownFetcherConfig(timeout=5, max_retries=0)
+        )
+
+
+class TestMarkdownDiskCache:
+    """Tests for MarkdownDiskCache."""
+
+    def test_put_then_get_round_trips(self, tmp_path):
+        cache = MarkdownDiskCache(tmp_path)
+        config = MarkdownFetcherConfig()
+
+        cache.put("https://example.com", config, _result(etag='"abc"'))
+        entry = cache.get("https://example.com", config)
+
+        assert entry.is_fresh
+        assert entry.result.content == "# Cached"
+        assert entry.result.metadata.cache_hit is True
+        assert entry.result.metadata.etag == '"abc"'
+
+    def test_missing_entry_returns_none(self, tmp_path):
+        cache = MarkdownDiskCache(tmp_path)
+        assert cache.get("https://example.com", MarkdownFetcherConfig()) is None
+
+    def test_corrupt_metadata_returns_none(self, tmp_path):
+        cache = MarkdownDiskCache(tmp_path)
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com", config, _result())
+        next(tmp_path.glob("*/*.json")).write_text("{not json")
+
+        assert cache.get("https://example.com", config) is None
+
+    def test_expired_entry_is_stale(self, tmp_path):
+        cache = MarkdownDiskCache(tmp_path, ttl=0)
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com", config, _result())
+
+        assert not cache.get("https://example.com", config).is_fresh
+
+    def test_validators_from_metadata(self):
+        entry = CachedMarkdown(_result(etag='"v1"'), stored_at=0, ttl=0)
+        assert entry.validators == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+        }
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = MarkdownDiskCache(tmp_path, max_bytes=1500)
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com/old", config, _result("a" * 400))
+        cache.put("https://example.com/new", config, _result("b" * 400))
+
+        old_meta = next(
+            path for path in tmp_path.glob("*/*.json") if "/old" in path.read_text()
+        )
+        os.utime(old_meta, (time.time() - 100, time.time() - 100))
+
+        cache.put("https://example.com/third", config, _result("c" * 400))
+
+        assert cache.get("https://example.com/old", config) is None
+        assert cache.get("https://example.com/third", config) is not None
+        assert cache.total_bytes <= 1500
+
+    def test_clear_removes_entries(self, tmp_path):
+        cache = MarkdownDiskCache(tmp_path)
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com", config, _result())
+
+        cache.clear()
+
+        assert cache.get("https://example.com", config) is None
+        assert cache.total_bytes == 0
+
+
+class TestFetcherWithCache:
+    """Tests for cache integration in MarkdownFetcher."""
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_fresh_hit_skips_network(self, mock_workers_ai, tmp_path):
+        mock_workers_ai.return_value = _result("# Fresh")
+        cache = MarkdownDiskCache(tmp_path)
+        config = MarkdownFetcherConfig(method="ai")
+
+        first = fetch_markdown("https://example.com", config, cache=cache)
+        second = fetch_markdown("https://example.com", config, cache=cache)
+
+        assert first.metadata.cache_hit is False
+        assert second.metadata.cache_hit is True
+        assert second.content == "# Fresh"
+        mock_workers_ai.assert_called_once()
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_stale_entry_revalidates_with_304(self, mock_workers_ai, tmp_path):
+        cache = MarkdownDiskCache(tmp_path, ttl=0)
+        config = MarkdownFetcherConfig(method="ai")
+        cache.put("https://example.com", config, _result("# Old", etag='"v1"'))
+        mock_workers_ai.return_value = _result("", status_code=304)
+
+        with MarkdownFetcher(config, cache=cache) as fetcher:
+            result = fetcher.fetch("https://example.com")
+
+        assert result.content == "# Old"
+        assert result.metadata.cache_hit is True
+        headers = mock_workers_ai.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_stale_entry_replaced_on_change(self, mock_workers_ai, tmp_path):
+        cache = MarkdownDiskCache(tmp_path, ttl=0)
+        config = MarkdownFetcherConfig(method="ai")
+        cache.put("https://example.com", config, _result("# Old", etag='"v1"'))
+        mock_workers_ai.return_value = _result("# New", etag='"v2"')
+
+        result = fetch_markdown("https://example.com", config, cache=cache)
+
+        assert result.content == "# New"
+        assert result.metadata.cache_hit is False
+        assert cache.get("https://example.com", config).result.content == "# New"
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_validators_only_sent_to_originating_tier(
+        self, mock_workers_ai, mock_native, tmp_path
+    ):
+        cache = MarkdownDiskCache(tmp_path, ttl=0)
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com", config, _result("# Old", etag='"v1"'))
+        mock_native.return_value = None
+        mock_workers_ai.return_value = _result("", status_code=304)
+
+        fetch_markdown("https://example.com", config, cache=cache)
+
+        assert mock_native.call_args.kwargs["headers"] is None
+        assert mock_workers_ai.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+class TestConditionalTierRequests:
+    """Tests for conditional requests in the tier functions."""
+
+    def test_native_304_returns_empty_result(self):
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_response.headers = {"etag": '"v1"'}
+
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+
+        result = _fetch_with_accept_header(
+            "https://example.com",
+            MarkdownFetcherConfig(),
+            mock_session,
+            headers={"If-None-Match": '"v1"'},
+        )
+
+        assert result.metadata.status_code == 304
+        assert result.content == ""
+        mock_session.get.assert_called_once_with(
+            "https://example.com",
+            headers={"Accept": "text/markdown", "If-None-Match": '"v1"'},
+            timeout=30,
+        )
+
+
+class TestMarkdownMemoryCache:
+    """Tests for MarkdownMemoryCache."""
+
+    def test_put_then_get_marks_cache_hit(self):
+        cache = MarkdownMemoryCache()
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com", config, _result())
+
+        hit = cache.get("https://example.com", config)
+
+        assert hit.content == "# Cached"
+        assert hit.metadata.cache_hit is True
+        assert cache.get("https://other.example", config) is None
+
+    def test_expired_entries_are_dropped(self):
+        cache = MarkdownMemoryCache(ttl=0)
+        config = MarkdownFetcherConfig()
+        cache.put("https://example.com", config, _result())
+
+        assert cache.get("https://example.com", config) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = MarkdownMemoryCache(max_entries=2)
+        config = MarkdownFetcherConfig()
+        cache.put("https://a.example", config, _result())
+        cache.put("https://b.example", config, _result())
+        cache.get("https://a.example", config)
+        cache.put("https://c.example", config, _result())
+
+        assert cache.get("https://a.example", config) is not None
+        assert cache.get("https://b.example", config) is None
+
+    def test_concurrent_callers_share_one_fetch(self):
+        cache = MarkdownMemoryCache()
+        config = MarkdownFetcherConfig()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return _result("# Shared")
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cache.get_or_fetch("https://example.com", config, fetch)
+                )
+            )
+            for _ in range(8)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert [r.content for r in results] == ["# Shared"] * 8
+
+    def test_errors_are_shared_but_not_cached(self):
+        cache = MarkdownMemoryCache()
+        config = MarkdownFetcherConfig()
+        fetch = Mock(side_effect=[MarkdownFetchError("down"), _result("# Up")])
+
+        with pytest.raises(MarkdownFetchError, match="down"):
+            cache.get_or_fetch("https://example.com", config, fetch)
+        result = cache.get_or_fetch("https://example.com", config, fetch)
+
+        assert result.content == "# Up"
+        assert fetch.call_count == 2
+
+    def test_waiter_gives_up_at_deadline(self):
+        cache = MarkdownMemoryCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            return _result("# Slow")
+
+        leader = threading.Thread(
+            target=cache.get_or_fetch,
+            args=("https://example.com", MarkdownFetcherConfig(), fetch),
+        )
+        leader.start()
+        started.wait(5)
+
+        with pytest.raises(MarkdownTimeoutError, match="Deadline exceeded"):
+            cache.get_or_fetch(
+                "https://example.com", MarkdownFetcherConfig(deadline=0.05), fetch
+            )
+        release.set()
+        leader.join()
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_fetcher_uses_memory_cache(self, mock_workers_ai):
+        mock_workers_ai.return_value = _result("# AI")
+        config = MarkdownFetcherConfig(method="ai")
+
+        with MarkdownFetcher(config, memory_cache=MarkdownMemoryCache()) as fetcher:
+            first = fetcher.fetch("https://example.com")
+            second = fetcher.fetch("https://example.com")
+
+        assert first.metadata.cache_hit is False
+        assert second.metadata.cache_hit is True
+        mock_workers_ai.assert_called_once()
@@ -0,0 +1,173 @@
+"""Tests for markdown_chunker module."""
+
+import pytest
+
+from vibe_coding.utils.markdown_chunker import (
+    TokenEstimator,
+    chunk_markdown,
+    chunk_result,
+)
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownValidationError,
+)
+
+ESTIMATOR = TokenEstimator(chars_per_token=1)
+
+
+def _paragraph(char, size):
+    return char * size
+
+
+class TestTokenEstimator:
+    """Tests for TokenEstimator."""
+
+    def test_count_rounds_up(self):
+        assert TokenEstimator().count("abcde") == 2
+        assert TokenEstimator().count("") == 0
+
+    def test_calibrated_from_reported_tokens(self):
+        assert TokenEstimator.calibrated(3000, 1000).chars_per_token == 3.0
+
+    def test_calibration_falls_back_without_tokens(self):
+        assert TokenEstimator.calibrated(3000, None) == TokenEstimator()
+        assert TokenEstimator.calibrated(0, 10) == TokenEstimator()
+
+
+class TestChunkMarkdown:
+    """Tests for chunk_markdown."""
+
+    def test_small_document_is_one_chunk(self):
+        chunks = list(chunk_markdown("# Title\n\nBody text.\n"))
+
+        assert len(chunks) == 1
+        assert chunks[0].text == "# Title\n\nBody text."
+        assert chunks[0].headings == ("Title",)
+
+    def test_chunks_respect_target(self):
+        text = "\n\n".join(_paragraph(c, 30) for c in "abcdefgh")
+
+        chunks = list(chunk_markdown(text, 70, 0, ESTIMATOR))
+
+        assert [chunk.tokens for chunk in chunks] == [62, 62, 62, 62]
+        assert all(chunk.tokens <= 70 for chunk in chunks)
+        assert chunks[1].text == f"{'c' * 30}\n\n{'d' * 30}"
+
+    def test_token_counts_include_separators(self):
+        text = "\n\n".join(["abcdefgh"] * 200)
+        estimator = TokenEstimator()
+
+        chunks = list(chunk_markdown(text, 20, 5, estimator))
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.tokens == estimator.count(chunk.text)
+            assert chunk.tokens <= 20
+
+    def test_overlap_repeats_trailing_blocks(self):
+        text = "\n\n".join(_paragraph(c, 30) for c in "abcd")
+
+        chunks = list(chunk_markdown(text, 70, 30, ESTIMATOR))
+
+        assert [chunk.text.split("\n\n") for chunk in chunks] == [
+            ["a" * 30, "b" * 30],
+            ["b" * 30, "c" * 30],
+            ["c" * 30, "d" * 30],
+        ]
+
+    def test_code_fence_is_not_split_on_blank_lines(self):
+        code = "```python\ndef f():\n\n    return 1\n```"
+        text = f"{_paragraph('a', 30)}\n\n{code}\n\n{_paragraph('b', 30)}"
+
+        chunks = list(chunk_markdown(text, 40, 0, ESTIMATOR))
+
+        assert [chunk.text for chunk in chunks] == ["a" * 30, code, "b" * 30]
+
+    def test_oversized_code_block_is_rewrapped_in_fences(self):
+        code = "~~~sh\n" + "\n".join(f"echo {i:02}" for i in range(10)) + "\n~~~"
+
+        chunks = list(chunk_markdown(code, 40, 0, ESTIMATOR))
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.text.startswith("~~~sh\n")
+            assert chunk.text.endswith("\n~~~")
+            assert chunk.tokens <= 40
+        body = [line for chunk in chunks for line in chunk.text.splitlines()[1:-1]]
+        assert body == [f"echo {i:02}" for i in range(10)]
+
+    def test_long_line_is_cut_by_length(self):
+        chunks = list(chunk_markdown("x" * 250, 100, 0, ESTIMATOR))
+
+        assert [len(chunk.text) for chunk in chunks] == [100, 100, 50]
+
+    def test_heading_starts_new_chunk_when_half_full(self):
+        text = f"# A\n\n{_paragraph('a', 60)}\n\n## B\n\nshort"
+
+        chunks = list(chunk_markdown(text, 100, 0, ESTIMATOR))
+
+        assert [chunk.text.splitlines()[0] for chunk in chunks] == ["# A", "## B"]
+        assert chunks[1].headings == ("A", "B")
+
+    def test_heading_moves_with_its_section_on_overflow(self):
+        text = f"# A\n\n{_paragraph('a', 30)}\n\n## B\n\n{_paragraph('b', 80)}"
+
+        chunks = list(chunk_markdown(text, 100, 0, ESTIMATOR))
+
+        assert [chunk.text for chunk in chunks] == [
+            f"# A\n\n{'a' * 30}",
+            f"## B\n\n{'b' * 80}",
+        ]
+        assert [chunk.tokens for chunk in chunks] == [35, 86]
+        assert chunks[1].headings == ("A", "B")
+
+    def test_heading_path_tracks_levels(self):
+        text = (
+            f"# Guide\n\n## Install\n\n{_paragraph('a', 60)}\n\n"
+            f"## Usage\n\n{_paragraph('b', 60)}\n\n# Reference\n\n{_paragraph('c', 60)}"
+        )
+
+        chunks = list(chunk_markdown(text, 90, 0, ESTIMATOR))
+
+        assert [chunk.headings for chunk in chunks] == [
+            ("Guide",),
+            ("Guide", "Usage"),
+            ("Reference",),
+        ]
+
+    def test_streamed_pieces_match_whole_text(self):
+        text = "\n\n".join(
+            f"## Section {i}\n\nParagraph {i} " + "word " * 40 for i in range(20)
+        )
+        pieces = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+        assert list(chunk_markdown(pieces, 60, 10)) == list(
+            chunk_markdown(text, 60, 10)
+        )
+
+    def test_invalid_sizes_are_rejected(self):
+        with pytest.raises(MarkdownValidationError):
+            list(chunk_markdown("text", 0))
+        with pytest.raises(MarkdownValidationError):
+            list(chunk_markdown("text", 10, 10))
+
+
+class TestChunkResult:
+    """Tests for chunk_result."""
+
+    def test_uses_reported_token_count(self):
+        content = "\n\n".join(_paragraph(c, 40) for c in "abcd")
+        result = MarkdownResult(
+            content=content,
+            metadata=MarkdownMetadata(
+                token_count=len(content) // 2,
+                method_used="native",
+                status_code=200,
+                response_time_ms=1,
+            ),
+        )
+
+        chunks = list(chunk_result(result, target_tokens=45, overlap_tokens=0))
+
+        assert [chunk.tokens for chunk in chunks] == [41, 41]
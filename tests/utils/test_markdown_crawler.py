@@ -0,0 +1,350 @@
+"""Tests for markdown_crawler module."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from vibe_coding.utils.markdown_crawler import (
+    CrawlConfig,
+    CrawlFrontier,
+    MarkdownCrawler,
+    RobotsPolicy,
+    extract_links,
+    load_manifest,
+    normalize_url,
+    page_path,
+    parse_sitemap,
+)
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownValidationError,
+)
+
+SITE = {
+    "https://docs.example.com/": (
+        "# Home\n[Guide](/guide) [API](api/) [Out](https://other.example/)"
+    ),
+    "https://docs.example.com/guide": "# Guide\n[Deep](/guide/deep) [Home](/#top)",
+    "https://docs.example.com/api/": "# API\n![Logo](/logo.png)",
+    "https://docs.example.com/guide/deep": "# Deep\n[Deeper](/guide/deep/er)",
+}
+
+
+def _response(status_code=200, text=""):
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.raise_for_status = Mock()
+    return response
+
+
+class _SiteFetcher:
+    """Fetcher stand-in that serves ``SITE`` and records fetched URLs."""
+
+    def __init__(self, pages=None, robots="", fail=()):
+        self.config = MarkdownFetcherConfig()
+        self.pages = pages if pages is not None else SITE
+        self.fail = set(fail)
+        self.fetched: list[str] = []
+        self.session = Mock()
+        self.session.get.return_value = _response(200, robots)
+
+    def fetch(self, url, config=None):
+        self.fetched.append(url)
+        if url in self.fail or url not in self.pages:
+            raise MarkdownFetchError(f"404 for {url}")
+        return MarkdownResult(
+            content=self.pages[url],
+            metadata=MarkdownMetadata(
+                token_count=7, method_used="ai", status_code=200, response_time_ms=1
+            ),
+        )
+
+
+def _crawler(tmp_path, fetcher, **options):
+    options.setdefault("politeness_delay", 0)
+    return MarkdownCrawler(tmp_path / "crawl", CrawlConfig(**options), fetcher=fetcher)
+
+
+class TestUrlHelpers:
+    """Tests for URL normalization, link extraction and sitemap parsing."""
+
+    def test_normalize_url(self):
+        assert normalize_url("HTTPS://Example.COM:443#top") == "https://example.com/"
+        assert normalize_url("http://example.com:8080/a?q=1#x") == (
+            "http://example.com:8080/a?q=1"
+        )
+
+    def test_extract_links_resolves_and_dedupes(self):
+        markdown = (
+            "[a](/a) [b](b 'title') <https://example.com/c> [a again](/a#part) "
+            "[mail](mailto:x@example.com)"
+        )
+
+        assert extract_links(markdown, "https://example.com/docs/") == [
+            "https://example.com/a",
+            "https://example.com/docs/b",
+            "https://example.com/c",
+        ]
+
+    def test_parse_sitemap_and_index(self):
+        ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        urlset = f"<urlset {ns}><url><loc> https://e.com/a </loc></url></urlset>"
+        index = (
+            f"<sitemapindex {ns}><sitemap><loc>https://e.com/s.xml</loc></sitemap>"
+            "</sitemapindex>"
+        )
+
+        assert parse_sitemap(urlset) == (["https://e.com/a"], [])
+        assert parse_sitemap(index) == ([], ["https://e.com/s.xml"])
+        with pytest.raises(MarkdownValidationError):
+            parse_sitemap("<urlset")
+
+    def test_page_path_is_stable_and_unique(self):
+        first = page_path("https://docs.example.com/guide/intro")
+        second = page_path("https://docs.example.com/guide/intro?v=2")
+
+        assert first.parts[:2] == ("pages", "docs.example.com")
+        assert first.name.startswith("guide-intro-")
+        assert first != second
+        assert page_path("https://docs.example.com/").name.startswith("index-")
+
+
+class TestCrawlFrontier:
+    """Tests for CrawlFrontier."""
+
+    def test_deduplicates_normalized_urls(self):
+        frontier = CrawlFrontier()
+
+        assert frontier.add("https://example.com/a", 0)
+        assert not frontier.add("https://EXAMPLE.com/a#frag", 1)
+        assert len(frontier) == 1
+        assert "https://example.com/a" in frontier
+
+    def test_pop_batch_is_fifo(self):
+        frontier = CrawlFrontier()
+        for i in range(5):
+            frontier.add(f"https://example.com/{i}", i)
+
+        assert frontier.pop_batch(2) == [
+            ("https://example.com/0", 0),
+            ("https://example.com/1", 1),
+        ]
+        assert len(frontier.pop_batch(10)) == 3
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        frontier = CrawlFrontier(tmp_path / "frontier.json")
+        frontier.add("https://example.com/a", 0)
+        frontier.add("https://example.com/b", 1)
+        frontier.pop_batch(1)
+        frontier.save()
+
+        loaded = CrawlFrontier(tmp_path / "frontier.json")
+        assert loaded.load()
+        assert list(loaded) == [("https://example.com/b", 1)]
+        assert not loaded.add("https://example.com/a", 0)
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        path = tmp_path / "frontier.json"
+        path.write_text("{not json")
+
+        assert not CrawlFrontier(path).load()
+
+
+class TestRobotsPolicy:
+    """Tests for RobotsPolicy."""
+
+    def test_rules_and_crawl_delay(self):
+        session = Mock()
+        session.get.return_value = _response(
+            200, "User-agent: *\nDisallow: /private\nCrawl-delay: 3\n"
+        )
+        robots = RobotsPolicy(session)
+
+        assert robots.can_fetch("https://example.com/public")
+        assert not robots.can_fetch("https://example.com/private/x")
+        assert robots.crawl_delay("https://example.com/") == 3
+        session.get.assert_called_once_with(
+            "https://example.com/robots.txt", timeout=10.0
+        )
+
+    def test_missing_robots_allows_all(self):
+        session = Mock()
+        session.get.return_value = _response(404)
+
+        assert RobotsPolicy(session).can_fetch("https://example.com/x")
+
+    def test_forbidden_robots_disallows_all(self):
+        session = Mock()
+        session.get.return_value = _response(403)
+
+        assert not RobotsPolicy(session).can_fetch("https://example.com/x")
+
+    def test_unreachable_robots_disallows_all(self):
+        session = Mock()
+        session.get.side_effect = requests.ConnectionError("down")
+
+        assert not RobotsPolicy(session).can_fetch("https://example.com/x")
+
+    def test_server_error_disallows_until_retried(self):
+        session = Mock()
+        session.get.return_value = _response(503)
+        robots = RobotsPolicy(session, error_ttl=30.0)
+
+        with patch("vibe_coding.utils.markdown_crawler.time.monotonic") as clock:
+            clock.return_value = 100.0
+            assert not robots.can_fetch("https://example.com/x")
+            assert not robots.can_fetch("https://example.com/y")
+            assert session.get.call_count == 1
+
+            session.get.return_value = _response(200, "User-agent: *\nAllow: /\n")
+            clock.return_value = 131.0
+            assert robots.can_fetch("https://example.com/x")
+            assert robots.can_fetch("https://example.com/y")
+
+        assert session.get.call_count == 2
+
+
+class TestMarkdownCrawler:
+    """Tests for MarkdownCrawler."""
+
+    def test_follows_same_site_links_to_max_depth(self, tmp_path):
+        fetcher = _SiteFetcher()
+        crawler = _crawler(tmp_path, fetcher, max_depth=1)
+
+        report = crawler.crawl(["https://docs.example.com"])
+
+        assert sorted(fetcher.fetched) == [
+            "https://docs.example.com/",
+            "https://docs.example.com/api/",
+            "https://docs.example.com/guide",
+        ]
+        assert report.pages_written == 3
+        assert report.remaining == 0
+
+    def test_writes_pages_and_manifest(self, tmp_path):
+        fetcher = _SiteFetcher(fail={"https://docs.example.com/api/"})
+        crawler = _crawler(tmp_path, fetcher, max_depth=1)
+
+        report = crawler.crawl(["https://docs.example.com/"])
+        manifest = load_manifest(report.manifest_path)
+
+        home = manifest["https://docs.example.com/"]
+        assert home.depth == 0
+        assert home.method_used == "ai"
+        assert home.token_count == 7
+        assert (crawler.out_dir / home.path).read_text() == SITE[home.url]
+        assert manifest["https://docs.example.com/api/"].error is not None
+        assert report.failed == 1
+
+    def test_robots_disallowed_urls_are_skipped(self, tmp_path):
+        fetcher = _SiteFetcher(robots="User-agent: *\nDisallow: /guide\n")
+        crawler = _crawler(tmp_path, fetcher, max_depth=2)
+
+        report = crawler.crawl(["https://docs.example.com/"])
+
+        assert "https://docs.example.com/guide" not in fetcher.fetched
+        assert report.robots_skipped == 1
+
+    def test_allowed_prefixes_limit_links(self, tmp_path):
+        fetcher = _SiteFetcher()
+        crawler = _crawler(
+            tmp_path,
+            fetcher,
+            max_depth=3,
+            allowed_prefixes=("https://docs.example.com/guide",),
+        )
+
+        crawler.crawl(["https://docs.example.com/"])
+
+        assert "https://docs.example.com/api/" not in fetcher.fetched
+        assert "https://docs.example.com/guide/deep" in fetcher.fetched
+
+    def test_resumes_from_saved_frontier(self, tmp_path):
+        fetcher = _SiteFetcher()
+        crawler = _crawler(tmp_path, fetcher, max_depth=2, max_pages=2, batch_size=1)
+
+        first = crawler.crawl(["https://docs.example.com/"])
+        assert first.pages_written == 2
+        assert first.remaining > 0
+
+        resumed_fetcher = _SiteFetcher()
+        resumed = _crawler(tmp_path, resumed_fetcher, max_depth=2)
+        second = resumed.crawl()
+
+        assert set(resumed_fetcher.fetched).isdisjoint(fetcher.fetched)
+        assert len(load_manifest(second.manifest_path)) == 4
+        assert second.remaining == 0
+
+    def test_sitemap_urls_are_seeds(self, tmp_path):
+        ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        sitemap = (
+            f"<urlset {ns}><url><loc>https://docs.example.com/api/</loc></url>"
+            "<url><loc>https://docs.example.com/guide/deep</loc></url></urlset>"
+        )
+        fetcher = _SiteFetcher()
+        fetcher.session.get.side_effect = lambda url, timeout: _response(
+            200, sitemap if url.endswith("sitemap.xml") else ""
+        )
+        crawler = _crawler(tmp_path, fetcher, max_depth=0)
+
+        report = crawler.crawl(sitemap="https://docs.example.com/sitemap.xml")
+
+        assert sorted(fetcher.fetched) == [
+            "https://docs.example.com/api/",
+            "https://docs.example.com/guide/deep",
+        ]
+        assert report.pages_written == 2
+
+    def test_requires_seeds(self, tmp_path):
+        with pytest.raises(MarkdownValidationError):
+            _crawler(tmp_path, _SiteFetcher()).crawl()
+
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    @patch("vibe_coding.utils.markdown_policies.time.sleep")
+    def test_politeness_delay_spaces_requests(
+        self, mock_sleep, mock_monotonic, tmp_path
+    ):
+        clock = [100.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.append(clock.pop() + seconds)
+        fetcher = _SiteFetcher(robots="User-agent: *\nCrawl-delay: 5\n")
+        crawler = _crawler(tmp_path, fetcher, max_depth=0, politeness_delay=1.0)
+
+        crawler.crawl(["https://docs.example.com/", "https://docs.example.com/guide"])
+
+        assert crawler.politeness.host_limits["docs.example.com"] == (0.2, 1)
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args[0][0] == pytest.approx(5, rel=0.01)
+
+    def test_politeness_delay_does_not_stall_other_hosts(self, tmp_path):
+        pages = {
+            "https://a.example/1": "# A1",
+            "https://a.example/2": "# A2",
+            "https://b.example/1": "# B1",
+        }
+        fetcher = _SiteFetcher(pages=pages)
+        crawler = _crawler(
+            tmp_path, fetcher, max_depth=0, politeness_delay=0.3, same_site=False
+        )
+
+        crawler.crawl(list(pages))
+
+        assert sorted(fetcher.fetched) == sorted(pages)
+        assert fetcher.fetched.index("https://b.example/1") < (
+            fetcher.fetched.index("https://a.example/2")
+        )
+
+    def test_manifest_is_json_lines(self, tmp_path):
+        crawler = _crawler(tmp_path, _SiteFetcher(), max_depth=0)
+        crawler.crawl(["https://docs.example.com/"])
+
+        lines = crawler.manifest_path.read_text().splitlines()
+        assert [json.loads(line)["url"] for line in lines] == [
+            "https://docs.example.com/"
+        ]
@@ -1,25 +1,36 @@
 """Tests for markdown_fetcher module."""
 
+import gc
+import io
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
 from vibe_coding.utils.markdown_fetcher import (
+    MarkdownBatchItem,
+    MarkdownFetcher,
     MarkdownFetcherConfig,
     MarkdownFetchError,
     MarkdownMetadata,
+    MarkdownPoolConfig,
     MarkdownRateLimitError,
     MarkdownResult,
     MarkdownTimeoutError,
+    MarkdownTooLargeError,
     MarkdownValidationError,
     _extract_token_count,
     _fetch_with_accept_header,
     _fetch_with_browser_rendering,
+    _fetch_with_local_conversion,
     _fetch_with_workers_ai,
     _retry_with_backoff,
     _validate_url,
     fetch_markdown,
+    fetch_markdown_many,
+    get_default_fetcher,
 )
 
 
@@ -165,7 +176,7 @@ class TestExtractTokenCount:
 class TestFetchWithAcceptHeader:
     """Tests for _fetch_with_accept_header function."""
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_successful_native_fetch(self, mock_time):
         mock_time.side_effect = [0.0, 0.1]
 
@@ -197,7 +208,7 @@ class TestFetchWithAcceptHeader:
             timeout=30,
         )
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_returns_none_when_not_markdown(self, mock_time):
         mock_time.side_effect = [0.0, 0.1]
 
@@ -233,7 +244,7 @@ class TestFetchWithAcceptHeader:
         with pytest.raises(MarkdownFetchError, match="Native fetch failed"):
             _fetch_with_accept_header("https://example.com", config, mock_session)
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_rate_limit_error(self, mock_time):
         mock_time.side_effect = [0.0, 0.1]
 
@@ -251,7 +262,7 @@ class TestFetchWithAcceptHeader:
 class TestFetchWithWorkersAI:
     """Tests for _fetch_with_workers_ai function."""
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_successful_workers_ai_fetch(self, mock_time):
         mock_time.side_effect = [0.0, 0.2]
 
@@ -287,7 +298,7 @@ class TestFetchWithWorkersAI:
             timeout=30,
         )
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_workers_ai_with_retain_images(self, mock_time):
         mock_time.side_effect = [0.0, 0.2]
 
@@ -318,7 +329,7 @@ class TestFetchWithWorkersAI:
         with pytest.raises(MarkdownTimeoutError, match="Workers AI timeout"):
             _fetch_with_workers_ai("https://example.com", config, mock_session)
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_workers_ai_rate_limit_error(self, mock_time):
         mock_time.side_effect = [0.0, 0.2]
 
@@ -336,7 +347,7 @@ class TestFetchWithWorkersAI:
 class TestFetchWithBrowserRendering:
     """Tests for _fetch_with_browser_rendering function."""
 
-    @patch("vibe_coding.utils.markdown_fetcher.time.time")
+    @patch("vibe_coding.utils.markdown_fetcher.time.perf_counter")
     def test_successful_browser_rendering_fetch(self, mock_time):
         mock_time.side_effect = [0.0, 1.5]
 
@@ -475,6 +486,22 @@ class TestRetryWithBackoff:
 class TestFetchMarkdown:
     """Tests for fetch_markdown function (integration tests)."""
 
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_uses_fetcher_config_when_omitted(self, mock_workers_ai, mock_native):
+        mock_workers_ai.return_value = MarkdownResult(
+            content="# AI",
+            metadata=MarkdownMetadata(
+                token_count=None, method_used="ai", status_code=200, response_time_ms=1
+            ),
+        )
+        fetcher = MarkdownFetcher(MarkdownFetcherConfig(method="ai"))
+
+        result = fetch_markdown("https://example.com", fetcher=fetcher)
+
+        assert result.metadata.method_used == "ai"
+        mock_native.assert_not_called()
+
     @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
     @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
     def test_auto_method_successful_native(self, mock_workers_ai, mock_native):
@@ -579,7 +606,7 @@ class TestFetchMarkdown:
 
     @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
     @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
-    def test_session_cleanup(self, mock_workers_ai, mock_accept):
+    def test_reuses_default_fetcher_session(self, mock_workers_ai, mock_accept):
         mock_result = MarkdownResult(
             content="# Test",
             metadata=MarkdownMetadata(
@@ -589,22 +616,569 @@ class TestFetchMarkdown:
         mock_accept.return_value = None
         mock_workers_ai.return_value = mock_result
 
-        result = fetch_markdown("https://example.com")
+        fetch_markdown("https://example.com/a")
+        fetch_markdown("https://example.com/b")
 
-        assert result is not None
-        assert result.content == "# Test"
+        first_session = mock_accept.call_args_list[0][0][2]
+        second_session = mock_accept.call_args_list[1][0][2]
+        assert first_session is second_session
+        assert first_session is get_default_fetcher().session
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_uses_explicit_fetcher(self, mock_workers_ai):
+        mock_workers_ai.return_value = Mock()
+
+        with MarkdownFetcher() as fetcher:
+            fetch_markdown(
+                "https://example.com", MarkdownFetcherConfig(method="ai"), fetcher
+            )
+            assert mock_workers_ai.call_args[0][2] is fetcher.session
+
+
+class TestMarkdownFetcher:
+    """Tests for the pooled MarkdownFetcher client."""
+
+    def test_sessions_share_one_adapter(self):
+        with MarkdownFetcher(pool=MarkdownPoolConfig(pool_maxsize=4)) as fetcher:
+            sessions = [fetcher.session]
+            thread = threading.Thread(target=lambda: sessions.append(fetcher.session))
+            thread.start()
+            thread.join()
+
+            assert sessions[0] is not sessions[1]
+            assert sessions[0].get_adapter("https://a.example") is (
+                sessions[1].get_adapter("https://b.example")
+            )
+            assert fetcher._adapter._pool_maxsize == 4
+
+    # A plain function, not a Mock: recorded call args would keep sessions alive.
+    @patch(
+        "vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai",
+        lambda url, *args, **kwargs: _make_result(url),
+    )
+    def test_finished_threads_release_sessions(self):
+        config = MarkdownFetcherConfig(method="ai")
+        urls = [f"https://h{i}.example/" for i in range(8)]
+
+        with MarkdownFetcher(config) as fetcher:
+            for _ in range(5):
+                list(fetch_markdown_many(urls, max_workers=4, fetcher=fetcher))
+            for thread in threading.enumerate():
+                if thread.name.startswith("markdown-fetch"):
+                    thread.join(5)
+            gc.collect()
+
+            assert len(fetcher._sessions) == 0
+
+    def test_session_is_reused_within_thread(self):
+        with MarkdownFetcher() as fetcher:
+            assert fetcher.session is fetcher.session
+            assert "VibeCoding" in fetcher.session.headers["User-Agent"]
+
+    def test_keep_alive_disabled_sends_connection_close(self):
+        pool = MarkdownPoolConfig(keep_alive=False)
+        with MarkdownFetcher(pool=pool) as fetcher:
+            assert fetcher.session.headers["Connection"] == "close"
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_uses_default_config(self, mock_workers_ai):
+        mock_workers_ai.return_value = Mock()
+        config = MarkdownFetcherConfig(method="ai", timeout=5)
+
+        with MarkdownFetcher(config) as fetcher:
+            fetcher.fetch("https://example.com")
+
+        assert mock_workers_ai.call_args[0][1] is config
+
+    def test_invalid_method_raises_error(self):
+        config = MarkdownFetcherConfig(method="bogus")  # type: ignore[arg-type]
+        with MarkdownFetcher() as fetcher:
+            with pytest.raises(MarkdownValidationError, match="Invalid method"):
+                fetcher.fetch("https://example.com", config)
+
+    def test_closed_fetcher_raises_error(self):
+        fetcher = MarkdownFetcher()
+        session = fetcher.session
+        session.close = Mock()
+
+        fetcher.close()
 
+        session.close.assert_called_once()
+        with pytest.raises(MarkdownFetchError, match="closed"):
+            fetcher.fetch("https://example.com")
+
+
+class TestDeadlineAndHedging:
+    """Tests for the total deadline budget and hedged tiers."""
+
+    def test_attempt_timeout_is_capped_by_deadline(self):
+        func = Mock(return_value="done")
+        config = MarkdownFetcherConfig(timeout=30, deadline=2.0)
+
+        _retry_with_backoff(
+            func,
+            "https://example.com",
+            config,
+            Mock(),
+            deadline_at=time.monotonic() + 2.0,
+        )
+
+        attempt_config = func.call_args[0][1]
+        assert attempt_config.timeout <= 2.0
+        assert attempt_config.deadline <= 2.0
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    def test_backoff_past_deadline_fails_fast(self, mock_sleep):
+        func = Mock(side_effect=MarkdownRateLimitError("limited", retry_after=60))
+        config = MarkdownFetcherConfig(jitter=0.0)
+
+        with pytest.raises(MarkdownTimeoutError, match="Deadline exceeded"):
+            _retry_with_backoff(
+                func,
+                "https://example.com",
+                config,
+                Mock(),
+                deadline_at=time.monotonic() + 5.0,
+            )
+
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_expired_deadline_raises_before_attempt(self):
+        func = Mock()
+
+        with pytest.raises(MarkdownTimeoutError, match="Deadline exceeded"):
+            _retry_with_backoff(
+                func,
+                "https://example.com",
+                MarkdownFetcherConfig(),
+                Mock(),
+                deadline_at=time.monotonic() - 1,
+            )
+
+        func.assert_not_called()
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
     @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    def test_hedge_starts_next_tier_when_slow(self, mock_native, mock_workers_ai):
+        release = threading.Event()
+
+        def slow_native(*args, **kwargs):
+            release.wait(5)
+            return _make_result("# Native")
+
+        mock_native.side_effect = slow_native
+        mock_workers_ai.return_value = _make_result("# AI")
+        config = MarkdownFetcherConfig(hedge_after=0.01)
+
+        with MarkdownFetcher(config) as fetcher:
+            result = fetcher.fetch("https://example.com")
+            release.set()
+
+        assert result.content == "# AI"
+        mock_workers_ai.assert_called_once()
+
     @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
-    def test_session_closed_on_error(self, mock_workers_ai, mock_accept):
-        mock_session = Mock()
-        mock_session.close = Mock()
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    def test_hedge_not_used_when_first_tier_is_fast(self, mock_native, mock_workers_ai):
+        mock_native.return_value = _make_result("# Native")
+        config = MarkdownFetcherConfig(hedge_after=5.0)
 
-        mock_accept.return_value = None
-        mock_workers_ai.side_effect = MarkdownFetchError("Test error")
+        with MarkdownFetcher(config) as fetcher:
+            result = fetcher.fetch("https://example.com")
+
+        assert result.content == "# Native"
+        mock_workers_ai.assert_not_called()
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    def test_hedge_falls_through_when_first_tier_has_no_markdown(
+        self, mock_native, mock_workers_ai
+    ):
+        mock_native.return_value = None
+        mock_workers_ai.return_value = _make_result("# AI")
+        config = MarkdownFetcherConfig(hedge_after=5.0)
+
+        with MarkdownFetcher(config) as fetcher:
+            result = fetcher.fetch("https://example.com")
+
+        assert result.content == "# AI"
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    def test_hedged_deadline_raises_timeout(self, mock_native, mock_workers_ai):
+        release = threading.Event()
+
+        def hang(*args, **kwargs):
+            release.wait(5)
+            return None
+
+        mock_native.side_effect = hang
+        mock_workers_ai.side_effect = hang
+        config = MarkdownFetcherConfig(hedge_after=0.01, deadline=0.1)
+
+        with MarkdownFetcher(config) as fetcher:
+            start = time.monotonic()
+            with pytest.raises(MarkdownTimeoutError, match="Deadline exceeded"):
+                fetcher.fetch("https://example.com")
+            release.set()
+
+        assert time.monotonic() - start < 2
+
+
+def _streamed_response(chunks, headers=None):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {"content-type": "text/markdown; charset=utf-8"}
+    response.headers.update(headers or {})
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+class TestStreaming:
+    """Tests for streamed downloads and the max_bytes cap."""
+
+    def test_max_bytes_streams_and_decodes(self):
+        session = Mock()
+        session.post.return_value = _streamed_response(["# Ü".encode()[:3], b"\x9c"])
+
+        result = _fetch_with_workers_ai(
+            "https://example.com", MarkdownFetcherConfig(max_bytes=100), session
+        )
+
+        assert result.content == "# Ü"
+        assert session.post.call_args.kwargs["stream"] is True
+        session.post.return_value.close.assert_called_once()
+
+    def test_declared_length_over_cap_aborts_before_reading(self):
+        session = Mock()
+        session.post.return_value = _streamed_response(
+            [b"x" * 10], headers={"content-length": "5000"}
+        )
+
+        with pytest.raises(MarkdownTooLargeError, match="5000 bytes"):
+            _fetch_with_workers_ai(
+                "https://example.com", MarkdownFetcherConfig(max_bytes=100), session
+            )
+
+        session.post.return_value.iter_content.assert_not_called()
+
+    def test_body_over_cap_aborts_mid_stream(self):
+        chunks = iter([b"x" * 60, b"x" * 60, b"never read"])
+        session = Mock()
+        session.get.return_value = _streamed_response(chunks)
+
+        with pytest.raises(MarkdownTooLargeError) as exc_info:
+            _fetch_with_accept_header(
+                "https://example.com", MarkdownFetcherConfig(max_bytes=100), session
+            )
+
+        assert exc_info.value.max_bytes == 100
+        assert next(chunks) == b"never read"
+
+    def test_default_config_does_not_stream(self):
+        session = Mock()
+        session.post.return_value = Mock(status_code=200, text="# Buffered", headers={})
+
+        _fetch_with_workers_ai("https://example.com", MarkdownFetcherConfig(), session)
+
+        assert "stream" not in session.post.call_args.kwargs
+
+    def test_sink_receives_utf8_body(self):
+        session = Mock()
+        session.post.return_value = _streamed_response(
+            ["# Café".encode("latin-1")],
+            headers={"content-type": "text/markdown; charset=iso-8859-1"},
+        )
+        sink = io.BytesIO()
+
+        result = _fetch_with_workers_ai(
+            "https://example.com", MarkdownFetcherConfig(), session, sink=sink
+        )
+
+        assert result.content == ""
+        assert sink.getvalue().decode("utf-8") == "# Café"
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    def test_too_large_is_not_retried(self, mock_sleep):
+        func = Mock(side_effect=MarkdownTooLargeError("big", max_bytes=1))
+
+        with pytest.raises(MarkdownTooLargeError):
+            _retry_with_backoff(
+                func, "https://example.com", MarkdownFetcherConfig(), Mock()
+            )
+
+        assert func.call_count == 1
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_fetch_to_file_writes_content(self, mock_workers_ai, tmp_path):
+        def stream_into_sink(url, config, session, headers=None, sink=None):
+            sink.write(b"partial")
+            sink.seek(0)
+            sink.truncate()
+            sink.write("# Große Seite".encode())
+            return _make_result("")
+
+        mock_workers_ai.side_effect = stream_into_sink
+        target = tmp_path / "out" / "page.md"
+
+        with MarkdownFetcher(MarkdownFetcherConfig(method="ai")) as fetcher:
+            saved = fetcher.fetch_to_file("https://example.com", target)
+
+        assert saved.path == target
+        assert saved.read_text() == "# Große Seite"
+        assert saved.size_bytes == target.stat().st_size
+        assert saved.metadata.method_used == "ai"
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_fetch_to_file_failure_leaves_no_file(self, mock_workers_ai, tmp_path):
+        mock_workers_ai.side_effect = MarkdownTooLargeError("big", max_bytes=1)
+
+        with MarkdownFetcher(MarkdownFetcherConfig(method="ai")) as fetcher:
+            with pytest.raises(MarkdownTooLargeError):
+                fetcher.fetch_to_file("https://example.com", tmp_path / "page.md")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_iter_markdown_yields_chunks(self, mock_workers_ai):
+        text = "# Überschrift\n" + "ä" * 50
+
+        def stream_into_sink(url, config, session, headers=None, sink=None):
+            sink.write(text.encode())
+            return _make_result("")
+
+        mock_workers_ai.side_effect = stream_into_sink
+
+        with MarkdownFetcher(MarkdownFetcherConfig(method="ai")) as fetcher:
+            chunks = list(fetcher.iter_markdown("https://example.com", chunk_size=7))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == text
+
+
+def _html_response(html, content_type="text/html; charset=utf-8"):
+    response = _streamed_response([html.encode()])
+    response.headers["content-type"] = content_type
+    return response
+
+
+class TestLocalConversionTier:
+    """Tests for the local HTML-to-markdown tier."""
+
+    STATIC_PAGE = "<h1>Guide</h1><p>" + "Plain static text. " * 20 + "</p>"
+    JS_SHELL = (
+        '<div id="root"></div><noscript>Please enable JavaScript.</noscript>'
+        '<script src="/app.js"></script>'
+    )
+
+    def test_converts_static_html(self):
+        session = Mock()
+        session.get.return_value = _html_response(self.STATIC_PAGE)
+
+        result = _fetch_with_local_conversion(
+            "https://example.com", MarkdownFetcherConfig(local_conversion=True), session
+        )
+
+        assert result.content.startswith("# Guide\n\nPlain static text.")
+        assert result.metadata.method_used == "local"
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers["Accept"].startswith("text/markdown")
+        session.get.return_value.close.assert_called_once()
+
+    def test_uses_served_markdown_as_is(self):
+        session = Mock()
+        session.get.return_value = _html_response("# Native", "text/markdown")
+
+        result = _fetch_with_local_conversion(
+            "https://example.com", MarkdownFetcherConfig(), session
+        )
+
+        assert result.content == "# Native"
+
+    def test_js_shell_falls_back(self):
+        session = Mock()
+        session.get.return_value = _html_response(self.JS_SHELL)
+
+        result = _fetch_with_local_conversion(
+            "https://example.com", MarkdownFetcherConfig(), session
+        )
+
+        assert result is None
+
+    def test_local_method_returns_thin_conversion(self):
+        session = Mock()
+        session.get.return_value = _html_response("<p>Short</p>")
+
+        result = _fetch_with_local_conversion(
+            "https://example.com", MarkdownFetcherConfig(method="local"), session
+        )
+
+        assert result.content == "Short\n"
+
+    def test_non_html_returns_none(self):
+        session = Mock()
+        session.get.return_value = _html_response("%PDF", "application/pdf")
+
+        result = _fetch_with_local_conversion(
+            "https://example.com", MarkdownFetcherConfig(method="local"), session
+        )
+
+        assert result is None
+        session.get.return_value.iter_content.assert_not_called()
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_local_conversion")
+    def test_auto_chain_uses_local_tier_when_enabled(
+        self, mock_local, mock_native, mock_workers_ai
+    ):
+        mock_local.return_value = None
+        mock_workers_ai.return_value = _make_result("# AI")
+        config = MarkdownFetcherConfig(local_conversion=True)
+
+        with MarkdownFetcher(config) as fetcher:
+            result = fetcher.fetch("https://example.com")
+
+        assert result.content == "# AI"
+        mock_local.assert_called_once()
+        mock_native.assert_not_called()
+
+    def test_custom_endpoint_is_used(self):
+        session = Mock()
+        session.post.return_value = Mock(status_code=200, text="# AI", headers={})
+        config = MarkdownFetcherConfig(endpoint="http://127.0.0.1:8000/")
+
+        _fetch_with_workers_ai("https://example.com", config, session)
+
+        assert session.post.call_args[0][0] == "http://127.0.0.1:8000/"
+
+
+def _make_result(content: str) -> MarkdownResult:
+    return MarkdownResult(
+        content=content,
+        metadata=MarkdownMetadata(
+            token_count=None, method_used="ai", status_code=200, response_time_ms=1
+        ),
+    )
+
+
+class _FakeFetcher:
+    """Fetcher stand-in that tracks per-host concurrency."""
+
+    def __init__(self, delays=None, errors=()):
+        self.config = MarkdownFetcherConfig()
+        self.delays = delays or {}
+        self.errors = set(errors)
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.finished: list[str] = []
+        self.lock = threading.Lock()
+
+    def fetch(self, url, config=None):
+        _validate_url(url)
+        host = url.split("/")[2]
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        try:
+            delay = self.delays.get(host, 0)
+            if isinstance(delay, threading.Event):
+                delay.wait(5)
+            else:
+                time.sleep(delay)
+            if url in self.errors:
+                raise MarkdownFetchError(f"failed {url}")
+            return _make_result(url)
+        finally:
+            with self.lock:
+                self.active[host] -= 1
+                self.finished.append(url)
+
+
+class TestFetchMarkdownMany:
+    """Tests for fetch_markdown_many bulk fetching."""
+
+    def test_ordered_output_matches_input(self):
+        urls = [f"https://h{i % 3}.example/{i}" for i in range(12)]
+        fetcher = _FakeFetcher(delays={"h0.example": 0.02})
+
+        items = list(
+            fetch_markdown_many(urls, ordered=True, max_workers=4, fetcher=fetcher)
+        )
+
+        assert [item.url for item in items] == urls
+        assert [item.index for item in items] == list(range(12))
+        assert all(item.ok for item in items)
+
+    def test_unordered_yields_every_url(self):
+        urls = [f"https://h{i % 2}.example/{i}" for i in range(10)]
+        fetcher = _FakeFetcher()
+
+        items = list(fetch_markdown_many(urls, fetcher=fetcher))
+
+        assert sorted(item.url for item in items) == sorted(urls)
+
+    def test_errors_are_reported_per_url(self):
+        urls = ["https://a.example/1", "https://a.example/2", "not-a-url"]
+        fetcher = _FakeFetcher(errors=["https://a.example/2"])
+
+        items = {item.url: item for item in fetch_markdown_many(urls, fetcher=fetcher)}
+
+        assert items["https://a.example/1"].result.content == "https://a.example/1"
+        assert isinstance(items["https://a.example/2"].error, MarkdownFetchError)
+        assert not items["https://a.example/2"].ok
+        assert isinstance(items["not-a-url"].error, MarkdownValidationError)
+
+    def test_per_host_limit_is_respected(self):
+        urls = [f"https://busy.example/{i}" for i in range(8)]
+        urls += [f"https://other.example/{i}" for i in range(8)]
+        fetcher = _FakeFetcher(delays={"busy.example": 0.01, "other.example": 0.01})
+
+        list(fetch_markdown_many(urls, max_workers=6, max_per_host=2, fetcher=fetcher))
+
+        assert fetcher.peak["busy.example"] <= 2
+        assert fetcher.peak["other.example"] <= 2
+
+    def test_slow_host_does_not_block_others(self):
+        release = threading.Event()
+        urls = [f"https://slow.example/{i}" for i in range(4)]
+        urls += [f"https://fast.example/{i}" for i in range(4)]
+        fetcher = _FakeFetcher(delays={"slow.example": release})
+
+        # max_workers bounds how many slow URLs are parked ahead of the fast ones.
+        results = fetch_markdown_many(
+            urls, max_workers=4, max_per_host=1, fetcher=fetcher
+        )
+        first_four = [next(results) for _ in range(4)]
+        release.set()
+        rest = list(results)
+
+        assert all(item.url.startswith("https://fast") for item in first_four)
+        assert len(first_four) + len(rest) == 8
+
+    def test_single_host_input_is_consumed_lazily(self):
+        consumed = []
+
+        def urls():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"https://busy.example/{i}"
+
+        results = fetch_markdown_many(
+            urls(), max_workers=4, max_per_host=2, fetcher=_FakeFetcher()
+        )
+        next(results)
+
+        # Two URLs in flight plus at most max_workers parked behind them.
+        assert len(consumed) <= 6
+        assert len(list(results)) == 999
+        assert len(consumed) == 1000
 
-        with patch("requests.Session", return_value=mock_session):
-            with pytest.raises(MarkdownFetchError):
-                fetch_markdown("https://example.com")
+    def test_invalid_limits_raise_error(self):
+        with pytest.raises(MarkdownValidationError, match="at least 1"):
+            list(fetch_markdown_many(["https://example.com"], max_workers=0))
 
-        mock_session.close.assert_called_once()
+    def test_batch_item_ok_property(self):
+        assert MarkdownBatchItem(0, "u", result=_make_result("x")).ok
+        assert not MarkdownBatchItem(0, "u", error=MarkdownFetchError("x")).ok
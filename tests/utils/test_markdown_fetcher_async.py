@@ -0,0 +1,347 @@
+"""Tests for markdown_fetcher_async module."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from vibe_coding.utils.markdown_fetcher import (  # noqa: E402
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownRateLimitError,
+    MarkdownTimeoutError,
+    MarkdownTooLargeError,
+    MarkdownValidationError,
+)
+from vibe_coding.utils.markdown_fetcher_async import (  # noqa: E402
+    AsyncMarkdownFetcher,
+    _afetch_with_accept_header,
+    _afetch_with_browser_rendering,
+    _afetch_with_workers_ai,
+    _aretry_with_backoff,
+    fetch_markdown_async,
+)
+from vibe_coding.utils.markdown_policies import MarkdownRateLimiter  # noqa: E402
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _markdown_response(text: str, tokens: str | None = None) -> httpx.Response:
+    headers = {"content-type": "text/markdown; charset=utf-8"}
+    if tokens:
+        headers["x-markdown-tokens"] = tokens
+    return httpx.Response(200, headers=headers, text=text)
+
+
+class TestAsyncTiers:
+    """Tests for the async tier functions."""
+
+    def test_native_fetch_returns_markdown(self):
+        def handler(request):
+            assert request.headers["accept"] == "text/markdown"
+            return _markdown_response("# Native", tokens="42")
+
+        async def run():
+            async with _client(handler) as client:
+                return await _afetch_with_accept_header(
+                    "https://example.com", MarkdownFetcherConfig(), client
+                )
+
+        result = asyncio.run(run())
+
+        assert result.content == "# Native"
+        assert result.metadata.token_count == 42
+        assert result.metadata.method_used == "native"
+
+    def test_native_fetch_returns_none_for_html(self):
+        def handler(request):
+            return httpx.Response(200, headers={"content-type": "text/html"})
+
+        async def run():
+            async with _client(handler) as client:
+                return await _afetch_with_accept_header(
+                    "https://example.com", MarkdownFetcherConfig(), client
+                )
+
+        assert asyncio.run(run()) is None
+
+    def test_workers_ai_posts_to_markdown_new(self):
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["body"] = json.loads(request.content)
+            return _markdown_response("# AI")
+
+        async def run():
+            config = MarkdownFetcherConfig(retain_images=True)
+            async with _client(handler) as client:
+                return await _afetch_with_workers_ai(
+                    "https://example.com", config, client
+                )
+
+        result = asyncio.run(run())
+
+        assert result.metadata.method_used == "ai"
+        assert seen["url"] == "https://markdown.new/"
+        assert seen["body"] == {
+            "url": "https://example.com",
+            "method": "ai",
+            "retain_images": True,
+        }
+
+    def test_browser_rendering_method(self):
+        def handler(request):
+            assert json.loads(request.content)["method"] == "browser"
+            return _markdown_response("# Browser")
+
+        async def run():
+            async with _client(handler) as client:
+                return await _afetch_with_browser_rendering(
+                    "https://example.com", MarkdownFetcherConfig(), client
+                )
+
+        assert asyncio.run(run()).metadata.method_used == "browser"
+
+    def test_rate_limit_raises_error(self):
+        async def run():
+            async with _client(lambda request: httpx.Response(429)) as client:
+                await _afetch_with_workers_ai(
+                    "https://example.com", MarkdownFetcherConfig(), client
+                )
+
+        with pytest.raises(MarkdownRateLimitError):
+            asyncio.run(run())
+
+    def test_timeout_maps_to_timeout_error(self):
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        async def run():
+            async with _client(handler) as client:
+                await _afetch_with_workers_ai(
+                    "https://example.com", MarkdownFetcherConfig(), client
+                )
+
+        with pytest.raises(MarkdownTimeoutError, match="Workers AI timeout"):
+            asyncio.run(run())
+
+    def test_max_bytes_aborts_large_body(self):
+        async def run():
+            async with _client(lambda request: _markdown_response("x" * 500)) as client:
+                await _afetch_with_workers_ai(
+                    "https://example.com", MarkdownFetcherConfig(max_bytes=100), client
+                )
+
+        with pytest.raises(MarkdownTooLargeError):
+            asyncio.run(run())
+
+    def test_max_bytes_allows_small_body(self):
+        async def run():
+            async with _client(lambda request: _markdown_response("# Small")) as client:
+                return await _afetch_with_workers_ai(
+                    "https://example.com", MarkdownFetcherConfig(max_bytes=100), client
+                )
+
+        assert asyncio.run(run()).content == "# Small"
+
+    def test_http_error_maps_to_fetch_error(self):
+        async def run():
+            async with _client(lambda request: httpx.Response(500)) as client:
+                await _afetch_with_accept_header(
+                    "https://example.com", MarkdownFetcherConfig(), client
+                )
+
+        with pytest.raises(MarkdownFetchError, match="Native fetch failed"):
+            asyncio.run(run())
+
+
+class TestAsyncRetryWithBackoff:
+    """Tests for _aretry_with_backoff function."""
+
+    @patch("vibe_coding.utils.markdown_fetcher_async.asyncio.sleep")
+    def test_retries_rate_limit_with_async_sleep(self, mock_sleep):
+        mock_sleep.side_effect = AsyncMock()
+        func = AsyncMock(
+            side_effect=[MarkdownRateLimitError("limited"), "result"],
+        )
+
+        config = MarkdownFetcherConfig(max_retries=3, backoff_factor=2.0, jitter=0.0)
+        result = asyncio.run(
+            _aretry_with_backoff(func, "https://example.com", config, None)
+        )
+
+        assert result == "result"
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("vibe_coding.utils.markdown_fetcher_async.asyncio.sleep")
+    def test_exhausted_retries_raises_error(self, mock_sleep):
+        mock_sleep.side_effect = AsyncMock()
+        func = AsyncMock(side_effect=MarkdownRateLimitError("limited"))
+
+        config = MarkdownFetcherConfig(max_retries=2)
+        with pytest.raises(MarkdownFetchError, match="All 2 retries exhausted"):
+            asyncio.run(_aretry_with_backoff(func, "https://example.com", config, None))
+
+
+class TestAsyncRateLimiting:
+    """Tests for sharing a MarkdownRateLimiter with the async fetcher."""
+
+    def test_acquire_async_waits_for_refill(self):
+        limiter = MarkdownRateLimiter(rate=20.0, burst=1, jitter=0.0)
+
+        async def run():
+            await limiter.acquire_async("markdown.new")
+            return await limiter.acquire_async("markdown.new")
+
+        assert asyncio.run(run()) == pytest.approx(0.05, abs=0.02)
+
+    def test_honors_pause_from_other_callers(self):
+        limiter = MarkdownRateLimiter(jitter=0.0)
+        limiter.penalize("example.com", 0.2)
+
+        async def run():
+            fetcher = AsyncMarkdownFetcher(
+                client=_client(lambda request: _markdown_response("# Native")),
+                rate_limiter=limiter,
+            )
+            started = time.monotonic()
+            await fetcher.fetch("https://example.com")
+            await fetcher.client.aclose()
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.2
+
+    def test_rate_limit_pauses_host_for_sync_callers(self):
+        limiter = MarkdownRateLimiter(jitter=0.0)
+
+        def handler(request):
+            return httpx.Response(429, headers={"retry-after": "30"})
+
+        async def run():
+            async with AsyncMarkdownFetcher(
+                MarkdownFetcherConfig(method="ai", max_retries=1),
+                client=_client(handler),
+                rate_limiter=limiter,
+            ) as fetcher:
+                await fetcher.fetch("https://example.com")
+
+        with pytest.raises(MarkdownFetchError):
+            asyncio.run(run())
+        with pytest.raises(MarkdownTimeoutError):
+            limiter.acquire("markdown.new", deadline_at=time.monotonic() + 1)
+
+
+class TestAsyncMarkdownFetcher:
+    """Tests for AsyncMarkdownFetcher and fetch_markdown_async."""
+
+    def test_auto_falls_back_to_workers_ai(self):
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, headers={"content-type": "text/html"})
+            return _markdown_response("# AI")
+
+        async def run():
+            fetcher = AsyncMarkdownFetcher(client=_client(handler))
+            result = await fetcher.fetch("https://example.com")
+            await fetcher.client.aclose()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result.content == "# AI"
+        assert result.metadata.method_used == "ai"
+
+    def test_concurrent_fetches_share_client(self):
+        def handler(request):
+            return _markdown_response(f"# {request.url.path}")
+
+        async def run():
+            async with AsyncMarkdownFetcher(client=_client(handler)) as fetcher:
+                return await asyncio.gather(
+                    *(fetcher.fetch(f"https://example.com/{i}") for i in range(20))
+                )
+
+        results = asyncio.run(run())
+
+        assert [r.content for r in results] == [f"# /{i}" for i in range(20)]
+
+    def test_deadline_cancels_slow_fetch(self):
+        async def handler(request):
+            await asyncio.sleep(5)
+            return _markdown_response("# Late")
+
+        async def run():
+            async with AsyncMarkdownFetcher(client=_client(handler)) as fetcher:
+                await fetcher.fetch(
+                    "https://example.com", MarkdownFetcherConfig(deadline=0.05)
+                )
+
+        with pytest.raises(MarkdownTimeoutError, match="Deadline"):
+            asyncio.run(run())
+
+    def test_local_conversion_converts_html(self):
+        def handler(request):
+            assert "text/html" in request.headers["accept"]
+            body = "<h1>Doc</h1><p>" + "Static words here. " * 20 + "</p>"
+            return httpx.Response(200, headers={"content-type": "text/html"}, text=body)
+
+        async def run():
+            async with AsyncMarkdownFetcher(client=_client(handler)) as fetcher:
+                return await fetcher.fetch(
+                    "https://example.com", MarkdownFetcherConfig(local_conversion=True)
+                )
+
+        result = asyncio.run(run())
+
+        assert result.metadata.method_used == "local"
+        assert result.content.startswith("# Doc")
+
+    def test_fetch_markdown_async_validates_url(self):
+        with pytest.raises(MarkdownValidationError, match="Unsupported URL scheme"):
+            asyncio.run(fetch_markdown_async("ftp://example.com"))
+
+    def test_fetch_markdown_async_with_fetcher(self):
+        def handler(request):
+            return _markdown_response("# Browser")
+
+        async def run():
+            async with AsyncMarkdownFetcher(client=_client(handler)) as fetcher:
+                return await fetch_markdown_async(
+                    "https://example.com",
+                    MarkdownFetcherConfig(method="browser"),
+                    fetcher,
+                )
+
+        assert asyncio.run(run()).metadata.method_used == "browser"
+
+    def test_fetch_markdown_async_uses_fetcher_config(self):
+        def handler(request):
+            return _markdown_response("# Browser")
+
+        async def run():
+            async with AsyncMarkdownFetcher(
+                MarkdownFetcherConfig(method="browser"), client=_client(handler)
+            ) as fetcher:
+                return await fetch_markdown_async(
+                    "https://example.com", fetcher=fetcher
+                )
+
+        assert asyncio.run(run()).metadata.method_used == "browser"
+
+    def test_invalid_method_raises_error(self):
+        async def run():
+            async with AsyncMarkdownFetcher() as fetcher:
+                await fetcher.fetch(
+                    "https://example.com",
+                    MarkdownFetcherConfig(method="bogus"),  # type: ignore[arg-type]
+                )
+
+        with pytest.raises(MarkdownValidationError, match="Invalid method"):
+            asyncio.run(run())
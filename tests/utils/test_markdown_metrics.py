@@ -0,0 +1,223 @@
+"""Tests for markdown_metrics module."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownCircuitOpenError,
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownMetadata,
+    MarkdownRateLimitError,
+    MarkdownResult,
+)
+from vibe_coding.utils.markdown_metrics import MarkdownMetrics
+from vibe_coding.utils.markdown_policies import MarkdownCircuitBreaker
+
+
+def _result(method="ai", content="# Content", tokens=None):
+    return MarkdownResult(
+        content=content,
+        metadata=MarkdownMetadata(
+            token_count=tokens, method_used=method, status_code=200, response_time_ms=1
+        ),
+    )
+
+
+class TestMarkdownMetrics:
+    """Tests for MarkdownMetrics."""
+
+    def test_counters_accumulate_per_tier(self):
+        metrics = MarkdownMetrics()
+        metrics.increment("attempts", "ai")
+        metrics.increment("attempts", "ai")
+        metrics.increment("bytes", "native", 120)
+
+        assert metrics.counter("attempts", "ai") == 2
+        assert metrics.counter("bytes", "native") == 120
+        assert metrics.counter("attempts", "browser") == 0
+
+    def test_unknown_counter_is_rejected(self):
+        with pytest.raises(KeyError):
+            MarkdownMetrics().increment("typo", "ai")
+
+    def test_latency_histogram_and_percentiles(self):
+        metrics = MarkdownMetrics(buckets=(10.0, 100.0, 1000.0))
+        for latency in [5, 5, 50, 50, 50, 50, 50, 50, 500, 5000]:
+            metrics.observe_latency("ai", latency)
+
+        latency = metrics.snapshot()["latency_ms"]["ai"]
+
+        assert latency["count"] == 10
+        assert latency["sum"] == 5810
+        assert latency["buckets"] == {
+            "10.0": 2,
+            "100.0": 8,
+            "1000.0": 9,
+            "+Inf": 10,
+        }
+        assert latency["p50"] == 100.0
+        assert latency["p95"] == float("inf")
+
+    def test_reset_clears_everything(self):
+        metrics = MarkdownMetrics()
+        metrics.increment("errors", "ai")
+        metrics.observe_latency("ai", 12.5)
+        metrics.reset()
+
+        assert metrics.snapshot() == {"counters": {}, "latency_ms": {}}
+        assert metrics.to_prometheus() == ""
+
+    def test_prometheus_export(self):
+        metrics = MarkdownMetrics(buckets=(10.0, 100.0))
+        metrics.increment("attempts", "ai", 2)
+        metrics.increment("backoff_seconds", "ai", 1.5)
+        metrics.observe_latency("ai", 42.0)
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE markdown_fetcher_attempts_total counter" in text
+        assert 'markdown_fetcher_attempts_total{tier="ai"} 2\n' in text
+        assert 'markdown_fetcher_backoff_seconds_total{tier="ai"} 1.5\n' in text
+        assert "# TYPE markdown_fetcher_attempt_latency_ms histogram" in text
+        assert 'markdown_fetcher_attempt_latency_ms_bucket{tier="ai",le="10"} 0' in text
+        assert (
+            'markdown_fetcher_attempt_latency_ms_bucket{tier="ai",le="+Inf"} 1' in text
+        )
+        assert 'markdown_fetcher_attempt_latency_ms_sum{tier="ai"} 42\n' in text
+        assert 'markdown_fetcher_attempt_latency_ms_count{tier="ai"} 1\n' in text
+
+    def test_exports_circuit_breaker(self):
+        breaker = MarkdownCircuitBreaker(failure_threshold=1, reset_timeout=60)
+        metrics = MarkdownMetrics()
+        metrics.track_circuit_breaker(breaker)
+        breaker.record_failure("ai")
+        with pytest.raises(MarkdownCircuitOpenError):
+            breaker.allow("ai")
+        breaker.record_success("browser")
+
+        circuits = metrics.snapshot()["circuits"]
+        text = metrics.to_prometheus()
+
+        assert circuits["ai"]["state"] == "open"
+        assert circuits["ai"]["trips"] == 1
+        assert circuits["ai"]["rejected"] == 1
+        assert "# TYPE markdown_fetcher_circuit_state gauge" in text
+        assert 'markdown_fetcher_circuit_state{tier="ai",state="open"} 1\n' in text
+        assert 'markdown_fetcher_circuit_state{tier="ai",state="closed"} 0\n' in text
+        assert (
+            'markdown_fetcher_circuit_state{tier="browser",state="closed"} 1\n' in text
+        )
+        assert 'markdown_fetcher_circuit_trips_total{tier="ai"} 1\n' in text
+        assert 'markdown_fetcher_circuit_rejected_total{tier="ai"} 1\n' in text
+
+
+class TestFetcherWithMetrics:
+    """Tests for metrics recording in MarkdownFetcher."""
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_exports_fetcher_circuit_breaker(self, mock_workers_ai):
+        mock_workers_ai.side_effect = MarkdownFetchError("down")
+        metrics = MarkdownMetrics()
+        breaker = MarkdownCircuitBreaker(failure_threshold=1, reset_timeout=60)
+        fetcher = MarkdownFetcher(
+            MarkdownFetcherConfig(method="ai", max_retries=1),
+            circuit_breaker=breaker,
+            metrics=metrics,
+        )
+
+        for _ in range(2):
+            with pytest.raises(MarkdownFetchError):
+                fetcher.fetch("https://example.com")
+
+        assert metrics.snapshot()["circuits"]["ai"] == breaker.snapshot()["ai"]
+        assert 'markdown_fetcher_circuit_rejected_total{tier="ai"} 1\n' in (
+            metrics.to_prometheus()
+        )
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    def test_records_fallback_and_success(self, mock_native, mock_workers_ai):
+        mock_native.return_value = None
+        mock_workers_ai.return_value = _result("ai", "# Héllo", tokens=3)
+        metrics = MarkdownMetrics()
+
+        with MarkdownFetcher(metrics=metrics) as fetcher:
+            fetcher.fetch("https://example.com")
+
+        counters = metrics.snapshot()["counters"]
+        assert counters["attempts"] == {"native": 1, "ai": 1}
+        assert counters["fallbacks"] == {"native": 1}
+        assert counters["successes"] == {"ai": 1}
+        assert counters["bytes"] == {"ai": len("# Héllo".encode())}
+        assert counters["tokens"] == {"ai": 3}
+        assert set(metrics.snapshot()["latency_ms"]) == {"native", "ai"}
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_records_rate_limiter_waits(self, mock_workers_ai):
+        mock_workers_ai.return_value = _result("ai")
+        limiter = Mock()
+        limiter.acquire.side_effect = [0.0, 0.25, 0.5]
+        metrics = MarkdownMetrics()
+        config = MarkdownFetcherConfig(method="ai")
+
+        with MarkdownFetcher(config, rate_limiter=limiter, metrics=metrics) as fetcher:
+            for _ in range(3):
+                fetcher.fetch("https://example.com")
+
+        assert metrics.counter("ratelimit_wait_seconds", "ai") == 0.75
+        assert 'markdown_fetcher_ratelimit_wait_seconds_total{tier="ai"} 0.75\n' in (
+            metrics.to_prometheus()
+        )
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_records_retries_rate_limits_and_backoff(self, mock_workers_ai, mock_sleep):
+        mock_workers_ai.side_effect = [
+            MarkdownRateLimitError("limited", retry_after=2),
+            MarkdownFetchError("502 Bad Gateway"),
+            _result(),
+        ]
+        metrics = MarkdownMetrics()
+        config = MarkdownFetcherConfig(method="ai", jitter=0, backoff_factor=3)
+
+        with MarkdownFetcher(config, metrics=metrics) as fetcher:
+            fetcher.fetch("https://example.com")
+
+        assert metrics.counter("attempts", "ai") == 3
+        assert metrics.counter("rate_limited", "ai") == 1
+        assert metrics.counter("errors", "ai") == 1
+        assert metrics.counter("retries", "ai") == 2
+        assert metrics.counter("successes", "ai") == 1
+        assert metrics.counter("backoff_seconds", "ai") == 2 + 3
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_final_error_is_counted_without_retry(self, mock_workers_ai):
+        mock_workers_ai.side_effect = MarkdownFetchError("502 Bad Gateway")
+        metrics = MarkdownMetrics()
+        config = MarkdownFetcherConfig(method="ai", max_retries=1)
+
+        with MarkdownFetcher(config, metrics=metrics) as fetcher:
+            with pytest.raises(MarkdownFetchError):
+                fetcher.fetch("https://example.com")
+
+        assert metrics.counter("errors", "ai") == 1
+        assert metrics.counter("retries", "ai") == 0
+        assert metrics.counter("backoff_seconds", "ai") == 0
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_streamed_bytes_come_from_sink(self, mock_workers_ai, tmp_path):
+        def stream(url, config, session, headers=None, sink=None):
+            sink.write(b"# Streamed body")
+            return _result(content="")
+
+        mock_workers_ai.side_effect = stream
+        metrics = MarkdownMetrics()
+        config = MarkdownFetcherConfig(method="ai")
+
+        with MarkdownFetcher(config, metrics=metrics) as fetcher:
+            fetcher.fetch_to_file("https://example.com", tmp_path / "page.md")
+
+        assert metrics.counter("bytes", "ai") == len(b"# Streamed body")
@@ -0,0 +1,500 @@
+"""Tests for markdown_policies module."""
+
+import time
+from email.utils import formatdate
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownCircuitOpenError,
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownMetadata,
+    MarkdownRateLimitError,
+    MarkdownResult,
+    MarkdownTimeoutError,
+    MarkdownTooLargeError,
+    _fetch_with_workers_ai,
+    _parse_rate_limit_reset,
+    _parse_retry_after,
+    _retry_with_backoff,
+)
+from vibe_coding.utils.markdown_policies import (
+    MarkdownCircuitBreaker,
+    MarkdownRateLimiter,
+    MarkdownTierMemory,
+)
+
+
+def _http_session(status):
+    response = requests.Response()
+    response.status_code = status
+    response.url = "https://markdown.new/"
+    session = Mock()
+    session.post.return_value = response
+    return session
+
+
+def _result(method="ai"):
+    return MarkdownResult(
+        content="# Content",
+        metadata=MarkdownMetadata(
+            token_count=None, method_used=method, status_code=200, response_time_ms=1
+        ),
+    )
+
+
+class TestMarkdownTierMemory:
+    """Tests for MarkdownTierMemory."""
+
+    def test_unknown_tier_is_not_skipped(self):
+        memory = MarkdownTierMemory()
+        assert not memory.should_skip("example.com", "native")
+
+    def test_failure_skips_tier(self):
+        memory = MarkdownTierMemory()
+        memory.record("example.com", "native", False)
+
+        assert memory.should_skip("example.com", "native")
+        assert not memory.should_skip("other.example", "native")
+
+    def test_success_outweighs_failure(self):
+        memory = MarkdownTierMemory()
+        memory.record("example.com", "native", True)
+        memory.record("example.com", "native", True)
+        memory.record("example.com", "native", False)
+
+        assert not memory.should_skip("example.com", "native")
+
+    @patch("vibe_coding.utils.markdown_policies.time.time")
+    def test_failures_decay_over_time(self, mock_time):
+        mock_time.return_value = 1000.0
+        memory = MarkdownTierMemory(half_life=60)
+        memory.record("example.com", "native", False)
+
+        mock_time.return_value = 1059.0
+        assert memory.should_skip("example.com", "native")
+
+        mock_time.return_value = 1061.0
+        assert not memory.should_skip("example.com", "native")
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = tmp_path / "memory" / "tiers.json"
+        memory = MarkdownTierMemory(path=path)
+        memory.record("example.com", "native", False)
+        memory.save()
+
+        restored = MarkdownTierMemory(path=path)
+
+        assert restored.should_skip("example.com", "native")
+        assert restored.snapshot()["example.com"]["native"]["failures"] > 0.9
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        path = tmp_path / "tiers.json"
+        path.write_text("not json")
+
+        assert MarkdownTierMemory(path=path).snapshot() == {}
+
+
+class TestFetcherWithTierMemory:
+    """Tests for tier memory integration in MarkdownFetcher."""
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_auto_skips_native_after_miss(self, mock_workers_ai, mock_native):
+        mock_native.return_value = None
+        mock_workers_ai.return_value = _result()
+
+        with MarkdownFetcher(tier_memory=MarkdownTierMemory()) as fetcher:
+            fetcher.fetch("https://example.com/a")
+            fetcher.fetch("https://example.com/b")
+            fetcher.fetch("https://other.example/c")
+
+        assert mock_native.call_count == 2
+        assert mock_workers_ai.call_count == 3
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_native_success_keeps_native(self, mock_workers_ai, mock_native):
+        mock_native.return_value = _result("native")
+
+        with MarkdownFetcher(tier_memory=MarkdownTierMemory()) as fetcher:
+            fetcher.fetch("https://example.com/a")
+            fetcher.fetch("https://example.com/b")
+
+        assert mock_native.call_count == 2
+        mock_workers_ai.assert_not_called()
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_last_tier_is_never_skipped(self, mock_workers_ai):
+        mock_workers_ai.return_value = _result()
+        memory = MarkdownTierMemory()
+        memory.record("example.com", "ai", False)
+
+        with MarkdownFetcher(tier_memory=memory) as fetcher:
+            fetcher.fetch("https://example.com", MarkdownFetcherConfig(method="ai"))
+
+        mock_workers_ai.assert_called_once()
+
+    def test_close_saves_memory(self, tmp_path):
+        path = tmp_path / "tiers.json"
+        memory = MarkdownTierMemory(path=path)
+        memory.record("example.com", "native", False)
+
+        MarkdownFetcher(tier_memory=memory).close()
+
+        assert path.exists()
+
+
+class _FakeClock:
+    """Monotonic clock that advances only when slept on."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestMarkdownRateLimiter:
+    """Tests for MarkdownRateLimiter."""
+
+    @patch("vibe_coding.utils.markdown_policies.time.sleep")
+    def test_burst_is_served_without_waiting(self, mock_sleep):
+        limiter = MarkdownRateLimiter(rate=1.0, burst=3)
+
+        waits = [limiter.acquire("markdown.new") for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        mock_sleep.assert_not_called()
+
+    @patch("vibe_coding.utils.markdown_policies.time.sleep")
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    def test_waits_for_refill_when_empty(self, mock_monotonic, mock_sleep):
+        clock = _FakeClock()
+        mock_monotonic.side_effect = clock.monotonic
+        mock_sleep.side_effect = clock.sleep
+        limiter = MarkdownRateLimiter(rate=2.0, burst=1, jitter=0.0)
+
+        limiter.acquire("markdown.new")
+        waited = limiter.acquire("markdown.new")
+
+        assert waited == pytest.approx(0.5)
+
+    def test_host_limits_override_defaults(self):
+        limiter = MarkdownRateLimiter(rate=1.0, burst=1, host_limits={"a": (50.0, 5)})
+        assert limiter._limits("a") == (50.0, 5)
+        assert limiter._limits("b") == (1.0, 1)
+
+    @patch("vibe_coding.utils.markdown_policies.time.sleep")
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    def test_penalize_blocks_host(self, mock_monotonic, mock_sleep):
+        clock = _FakeClock()
+        mock_monotonic.side_effect = clock.monotonic
+        mock_sleep.side_effect = clock.sleep
+        limiter = MarkdownRateLimiter(jitter=0.0)
+
+        limiter.penalize("markdown.new", 7.0)
+
+        assert limiter.acquire("markdown.new") == pytest.approx(7.0)
+        assert limiter.acquire("example.com") == 0.0
+
+    @patch("vibe_coding.utils.markdown_policies.time.sleep")
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    def test_wait_past_deadline_raises(self, mock_monotonic, mock_sleep):
+        clock = _FakeClock()
+        mock_monotonic.side_effect = clock.monotonic
+        mock_sleep.side_effect = clock.sleep
+        limiter = MarkdownRateLimiter(jitter=0.0)
+        limiter.penalize("markdown.new", 7.0)
+
+        with pytest.raises(MarkdownTimeoutError, match="exceeds deadline"):
+            limiter.acquire("markdown.new", deadline_at=clock.now + 5.0)
+
+        mock_sleep.assert_not_called()
+
+    def test_observe_honors_retry_after(self):
+        limiter = MarkdownRateLimiter()
+        limiter.observe("markdown.new", {"retry-after": "30"})
+
+        blocked_until = limiter._buckets["markdown.new"][2]
+        assert blocked_until - time.monotonic() == pytest.approx(30, abs=1)
+
+    def test_observe_honors_exhausted_quota(self):
+        limiter = MarkdownRateLimiter()
+        limiter.observe(
+            "markdown.new", {"ratelimit-remaining": "0", "ratelimit-reset": "12"}
+        )
+        limiter.observe(
+            "example.com", {"x-ratelimit-remaining": "5", "x-ratelimit-reset": "12"}
+        )
+
+        assert limiter._buckets["markdown.new"][2] > time.monotonic() + 10
+        assert "example.com" not in limiter._buckets
+
+
+class TestRateLimitHeaders:
+    """Tests for Retry-After and rate-limit header parsing."""
+
+    def test_retry_after_seconds(self):
+        assert _parse_retry_after({"retry-after": "5"}) == 5.0
+
+    def test_retry_after_http_date(self):
+        future = formatdate(time.time() + 60, usegmt=True)
+        assert _parse_retry_after({"retry-after": future}) == pytest.approx(60, abs=2)
+
+    def test_retry_after_invalid(self):
+        assert _parse_retry_after({"retry-after": "soon"}) is None
+        assert _parse_retry_after({}) is None
+
+    def test_rate_limit_reset_epoch(self):
+        headers = {
+            "x-ratelimit-remaining": "0",
+            "x-ratelimit-reset": str(int(time.time()) + 20),
+        }
+        assert _parse_rate_limit_reset(headers) == pytest.approx(20, abs=2)
+
+    def test_rate_limit_reset_with_quota_left(self):
+        headers = {"ratelimit-remaining": "3", "ratelimit-reset": "20"}
+        assert _parse_rate_limit_reset(headers) is None
+
+
+class TestRetryWithRateLimiter:
+    """Tests for rate limiter integration in _retry_with_backoff."""
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    def test_rate_limit_penalizes_host_instead_of_sleeping(self, mock_sleep):
+        limiter = Mock()
+        func = Mock(
+            side_effect=[MarkdownRateLimitError("limited", retry_after=9.0), "done"]
+        )
+
+        result = _retry_with_backoff(
+            func,
+            "https://example.com",
+            MarkdownFetcherConfig(jitter=0.0),
+            Mock(),
+            rate_limiter=limiter,
+        )
+
+        assert result == "done"
+        assert limiter.acquire.call_count == 2
+        limiter.acquire.assert_called_with("markdown.new")
+        limiter.penalize.assert_called_once_with("markdown.new", 9.0)
+        mock_sleep.assert_not_called()
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    def test_retry_after_used_without_limiter(self, mock_sleep):
+        func = Mock(side_effect=[MarkdownRateLimitError("limited", 4.0), "done"])
+
+        _retry_with_backoff(
+            func, "https://example.com", MarkdownFetcherConfig(jitter=0.0), Mock()
+        )
+
+        mock_sleep.assert_called_once_with(4.0)
+
+    def test_tier_reports_retry_after(self):
+        response = Mock(status_code=429, headers={"retry-after": "3"})
+        session = Mock()
+        session.post.return_value = response
+
+        with pytest.raises(MarkdownRateLimitError) as exc_info:
+            _fetch_with_workers_ai(
+                "https://example.com", MarkdownFetcherConfig(), session
+            )
+
+        assert exc_info.value.retry_after == 3.0
+
+    def test_fetcher_session_feeds_limiter(self):
+        limiter = MarkdownRateLimiter()
+        with MarkdownFetcher(rate_limiter=limiter) as fetcher:
+            response = Mock(url="https://markdown.new/", headers={"retry-after": "15"})
+            for hook in fetcher.session.hooks["response"]:
+                hook(response)
+
+        assert limiter._buckets["markdown.new"][2] > time.monotonic() + 10
+
+
+class TestMarkdownCircuitBreaker:
+    """Tests for MarkdownCircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        breaker = MarkdownCircuitBreaker(failure_threshold=3)
+        for _ in range(2):
+            breaker.record_failure("ai")
+        assert breaker.state("ai") == "closed"
+
+        breaker.record_failure("ai")
+
+        assert breaker.state("ai") == "open"
+        with pytest.raises(MarkdownCircuitOpenError) as exc_info:
+            breaker.allow("ai")
+        assert exc_info.value.retry_after > 0
+        breaker.allow("browser")
+
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    def test_failures_outside_window_are_forgotten(self, mock_monotonic):
+        clock = _FakeClock()
+        mock_monotonic.side_effect = clock.monotonic
+        breaker = MarkdownCircuitBreaker(failure_threshold=2, window=10)
+
+        breaker.record_failure("ai")
+        clock.sleep(11)
+        breaker.record_failure("ai")
+
+        assert breaker.state("ai") == "closed"
+
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    def test_half_open_allows_single_probe(self, mock_monotonic):
+        clock = _FakeClock()
+        mock_monotonic.side_effect = clock.monotonic
+        breaker = MarkdownCircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure("ai")
+
+        clock.sleep(31)
+        assert breaker.state("ai") == "half_open"
+        breaker.allow("ai")
+        with pytest.raises(MarkdownCircuitOpenError):
+            breaker.allow("ai")
+
+        breaker.record_success("ai")
+
+        assert breaker.state("ai") == "closed"
+        breaker.allow("ai")
+
+    @patch("vibe_coding.utils.markdown_policies.time.monotonic")
+    def test_failed_probe_reopens(self, mock_monotonic):
+        clock = _FakeClock()
+        mock_monotonic.side_effect = clock.monotonic
+        breaker = MarkdownCircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure("ai")
+        clock.sleep(31)
+        breaker.allow("ai")
+
+        breaker.record_failure("ai")
+
+        assert breaker.state("ai") == "open"
+        assert breaker.snapshot()["ai"]["trips"] == 2
+
+    def test_snapshot_reports_counters(self):
+        breaker = MarkdownCircuitBreaker(failure_threshold=1)
+        breaker.record_failure("browser")
+        with pytest.raises(MarkdownCircuitOpenError):
+            breaker.allow("browser")
+
+        assert breaker.snapshot() == {
+            "browser": {
+                "state": "open",
+                "recent_failures": 1,
+                "trips": 1,
+                "rejected": 1,
+            }
+        }
+
+
+class TestFetcherWithCircuitBreaker:
+    """Tests for circuit breaker integration in MarkdownFetcher."""
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    def test_open_circuit_fails_fast(self, mock_workers_ai, mock_sleep):
+        mock_workers_ai.side_effect = MarkdownFetchError("502 Bad Gateway")
+        breaker = MarkdownCircuitBreaker(failure_threshold=2)
+        config = MarkdownFetcherConfig(method="ai", max_retries=3)
+
+        with MarkdownFetcher(config, circuit_breaker=breaker) as fetcher:
+            with pytest.raises(MarkdownCircuitOpenError):
+                fetcher.fetch("https://example.com")
+            with pytest.raises(MarkdownCircuitOpenError):
+                fetcher.fetch("https://example.com/other")
+
+        assert mock_workers_ai.call_count == 2
+        assert breaker.state("ai") == "open"
+
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_workers_ai")
+    @patch("vibe_coding.utils.markdown_fetcher._fetch_with_accept_header")
+    def test_native_tier_is_not_guarded(self, mock_native, mock_workers_ai):
+        mock_native.return_value = _result("native")
+        breaker = MarkdownCircuitBreaker(failure_threshold=1)
+        breaker.record_failure("ai")
+
+        with MarkdownFetcher(circuit_breaker=breaker) as fetcher:
+            result = fetcher.fetch("https://example.com")
+
+        assert result.metadata.method_used == "native"
+        assert "native" not in breaker.snapshot()
+
+    @patch("vibe_coding.utils.markdown_fetcher.time.sleep")
+    def test_rate_limit_does_not_count_as_failure(self, mock_sleep):
+        breaker = MarkdownCircuitBreaker(failure_threshold=1)
+        func = Mock(side_effect=[MarkdownRateLimitError("limited"), "done"])
+
+        result = _retry_with_backoff(
+            func,
+            "https://example.com",
+            MarkdownFetcherConfig(),
+            Mock(),
+            circuit_breaker=breaker,
+            circuit_key="ai",
+        )
+
+        assert result == "done"
+        assert breaker.state("ai") == "closed"
+
+    def test_client_errors_do_not_open_circuit(self):
+        breaker = MarkdownCircuitBreaker(failure_threshold=2)
+        config = MarkdownFetcherConfig(method="ai", max_retries=1)
+
+        for i in range(5):
+            with pytest.raises(MarkdownFetchError) as exc_info:
+                _retry_with_backoff(
+                    _fetch_with_workers_ai,
+                    f"https://example.com/missing/{i}",
+                    config,
+                    _http_session(404),
+                    circuit_breaker=breaker,
+                    circuit_key="ai",
+                )
+            assert not isinstance(exc_info.value, MarkdownCircuitOpenError)
+
+        assert breaker.state("ai") == "closed"
+        assert breaker.snapshot()["ai"]["recent_failures"] == 0
+
+    def test_server_errors_open_circuit(self):
+        breaker = MarkdownCircuitBreaker(failure_threshold=2)
+        config = MarkdownFetcherConfig(method="ai", max_retries=1)
+
+        for _ in range(2):
+            with pytest.raises(MarkdownFetchError):
+                _retry_with_backoff(
+                    _fetch_with_workers_ai,
+                    "https://example.com",
+                    config,
+                    _http_session(503),
+                    circuit_breaker=breaker,
+                    circuit_key="ai",
+                )
+
+        assert breaker.state("ai") == "open"
+
+    def test_too_large_does_not_count_as_failure(self):
+        breaker = MarkdownCircuitBreaker(failure_threshold=1)
+        func = Mock(side_effect=MarkdownTooLargeError("too big", max_bytes=10))
+
+        with pytest.raises(MarkdownTooLargeError):
+            _retry_with_backoff(
+                func,
+                "https://example.com",
+                MarkdownFetcherConfig(),
+                Mock(),
+                circuit_breaker=breaker,
+                circuit_key="ai",
+            )
+
+        assert breaker.state("ai") == "closed"
@@ -0,0 +1,98 @@
+"""Tests for markdown_refresh module."""
+
+from vibe_coding.utils.markdown_crawler import load_manifest
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownMetadata,
+    MarkdownResult,
+)
+from vibe_coding.utils.markdown_refresh import refresh_manifest
+
+URLS = ["https://example.com/a", "https://example.com/b"]
+
+
+class _PageFetcher:
+    """Fetcher stand-in serving mutable page contents."""
+
+    def __init__(self, pages, etag=None):
+        self.config = MarkdownFetcherConfig()
+        self.pages = pages
+        self.etag = etag
+
+    def fetch(self, url, config=None):
+        if url not in self.pages:
+            raise MarkdownFetchError(f"404 for {url}")
+        return MarkdownResult(
+            content=self.pages[url],
+            metadata=MarkdownMetadata(
+                token_count=None,
+                method_used="native",
+                status_code=200,
+                response_time_ms=1,
+                etag=self.etag,
+            ),
+        )
+
+
+class TestRefreshManifest:
+    """Tests for refresh_manifest."""
+
+    def test_first_run_adds_every_page(self, tmp_path):
+        fetcher = _PageFetcher({URLS[0]: "# A", URLS[1]: "# B"}, etag='"v1"')
+
+        report = refresh_manifest(tmp_path, URLS, fetcher=fetcher)
+        manifest = load_manifest(report.manifest_path)
+
+        assert report.counts == {"added": 2, "changed": 0, "unchanged": 0, "failed": 0}
+        assert len(report.written) == 2
+        assert manifest[URLS[0]].etag == '"v1"'
+        assert (tmp_path / manifest[URLS[1]].path).read_text() == "# B"
+
+    def test_only_changed_pages_are_written(self, tmp_path):
+        pages = {URLS[0]: "# A", URLS[1]: "# B"}
+        refresh_manifest(tmp_path, URLS, fetcher=_PageFetcher(pages))
+        before = load_manifest(tmp_path / "manifest.jsonl")
+        unchanged_file = tmp_path / before[URLS[0]].path
+        mtime = unchanged_file.stat().st_mtime_ns
+
+        pages[URLS[1]] = "# B, edited"
+        report = refresh_manifest(tmp_path, fetcher=_PageFetcher(pages))
+        after = load_manifest(report.manifest_path)
+
+        assert report.changed == [URLS[1]]
+        assert report.unchanged == [URLS[0]]
+        assert report.written == [tmp_path / after[URLS[1]].path]
+        assert unchanged_file.stat().st_mtime_ns == mtime
+        assert after[URLS[1]].sha256 != before[URLS[1]].sha256
+        assert after[URLS[0]].changed_at == before[URLS[0]].changed_at
+
+    def test_failed_fetch_keeps_previous_copy(self, tmp_path):
+        refresh_manifest(tmp_path, URLS, fetcher=_PageFetcher({URLS[0]: "# A"}))
+
+        report = refresh_manifest(tmp_path, URLS, fetcher=_PageFetcher({}))
+        manifest = load_manifest(report.manifest_path)
+
+        assert sorted(report.failed) == URLS
+        assert manifest[URLS[0]].path is not None
+        assert manifest[URLS[0]].error is not None
+        assert (tmp_path / manifest[URLS[0]].path).read_text() == "# A"
+
+    def test_urls_outside_the_list_are_untouched(self, tmp_path):
+        pages = {URLS[0]: "# A", URLS[1]: "# B"}
+        refresh_manifest(tmp_path, URLS, fetcher=_PageFetcher(pages))
+
+        report = refresh_manifest(
+            tmp_path, ["https://EXAMPLE.com/a#top"], fetcher=_PageFetcher(pages)
+        )
+
+        assert report.unchanged == [URLS[0]]
+        assert set(load_manifest(report.manifest_path)) == set(URLS)
+
+    def test_manifest_is_compacted(self, tmp_path):
+        fetcher = _PageFetcher({URLS[0]: "# A"})
+        for _ in range(3):
+            refresh_manifest(tmp_path, URLS[:1], fetcher=fetcher)
+
+        lines = (tmp_path / "manifest.jsonl").read_text().splitlines()
+        assert len(lines) == 1
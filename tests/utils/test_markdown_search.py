@@ -0,0 +1,182 @@
+"""Tests for markdown_search module."""
+
+import json
+
+import pytest
+
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownValidationError,
+)
+from vibe_coding.utils.markdown_search import (
+    MarkdownSearchIndex,
+    iter_crawl_documents,
+    parse_query,
+)
+
+DOCS = {
+    "https://docs.example.com/retry": (
+        "# Retries\n\nThe fetcher retries on a rate limit with exponential backoff."
+    ),
+    "https://docs.example.com/cache": (
+        "# Caching\n\nThe disk cache stores converted pages. A limit on the rate "
+        "of writes is not enforced."
+    ),
+    "https://docs.example.com/crawl": (
+        "# Crawling\n\nThe crawler follows links and honors robots.txt. "
+        "Crawl politeness: one request per second per host."
+    ),
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    with MarkdownSearchIndex(tmp_path / "index.sqlite3") as index:
+        index.add_many(DOCS.items())
+        yield index
+
+
+def _urls(results):
+    return [hit.url for hit in results.hits]
+
+
+class TestParseQuery:
+    """Tests for parse_query."""
+
+    def test_terms_and_phrases(self):
+        assert parse_query('Retry "rate limit" cache "single"') == (
+            ["retry", "cache", "single"],
+            [["rate", "limit"]],
+        )
+
+
+class TestMarkdownSearchIndex:
+    """Tests for MarkdownSearchIndex."""
+
+    def test_bm25_ranks_matching_documents(self, index):
+        results = index.search("crawler robots")
+
+        assert _urls(results) == ["https://docs.example.com/crawl"]
+        assert results.hits[0].title == "Crawling"
+        assert results.total == 1
+        assert results.took_ms >= 0
+
+    def test_rarer_terms_score_higher(self, index):
+        results = index.search("backoff the")
+
+        assert _urls(results)[0] == "https://docs.example.com/retry"
+        assert results.total == 3
+        scores = [hit.score for hit in results.hits]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_phrase_requires_consecutive_words(self, index):
+        phrase = index.search('"rate limit"')
+        words = index.search("rate limit")
+
+        assert _urls(phrase) == ["https://docs.example.com/retry"]
+        assert set(_urls(words)) == {
+            "https://docs.example.com/retry",
+            "https://docs.example.com/cache",
+        }
+
+    def test_phrase_filters_free_terms(self, index):
+        results = index.search('crawler "rate limit"')
+
+        assert _urls(results) == ["https://docs.example.com/retry"]
+
+    def test_no_match_and_empty_query(self, index):
+        assert index.search("nonexistent").hits == []
+        assert index.search("").total == 0
+        assert index.search('"limit rate"').total == 0
+
+    def test_limit(self, index):
+        assert len(index.search("the", limit=2).hits) == 2
+
+    def test_update_replaces_postings(self, index):
+        url = "https://docs.example.com/retry"
+
+        assert index.add(url, DOCS[url]) == "unchanged"
+        assert index.add(url, "# Retries\n\nNow about jitter only.") == "updated"
+
+        assert _urls(index.search("jitter")) == [url]
+        assert index.search("backoff").hits == []
+        assert len(index) == 3
+
+    def test_accepts_fetch_results(self, tmp_path):
+        result = MarkdownResult(
+            content="# Title\n\nSearchable words",
+            metadata=MarkdownMetadata(
+                token_count=None, method_used="ai", status_code=200, response_time_ms=1
+            ),
+        )
+        with MarkdownSearchIndex(tmp_path / "index.sqlite3") as index:
+            assert index.add("https://e.com/", result) == "added"
+            assert _urls(index.search("searchable")) == ["https://e.com/"]
+
+    def test_remove(self, index):
+        assert index.remove("https://docs.example.com/crawl")
+        assert not index.remove("https://docs.example.com/crawl")
+
+        assert "https://docs.example.com/crawl" not in index
+        assert index.search("crawler").hits == []
+
+    def test_index_persists_across_reopen(self, index):
+        index.close()
+
+        with MarkdownSearchIndex(index.path) as reopened:
+            assert len(reopened) == 3
+            assert _urls(reopened.search('"exponential backoff"')) == [
+                "https://docs.example.com/retry"
+            ]
+
+    def test_optimize_merges_blocks_and_keeps_results(self, index):
+        index.add("https://docs.example.com/new", "# New\n\nA rate limit page.")
+        index.add("https://docs.example.com/retry", "# Retries\n\nRewritten.")
+        before = {hit.url: hit.score for hit in index.search("rate limit").hits}
+
+        index.optimize()
+
+        blocks = index._db.execute(
+            "SELECT COUNT(*) FROM postings WHERE term = 'rate'"
+        ).fetchone()[0]
+        after = {hit.url: hit.score for hit in index.search("rate limit").hits}
+        assert blocks == 1
+        assert after == pytest.approx(before)
+        assert _urls(index.search('"rate limit"')) == ["https://docs.example.com/new"]
+
+    def test_add_many_streams_in_batches(self, tmp_path):
+        def documents():
+            for i in range(7):
+                yield f"https://e.com/{i}", f"# Page {i}\n\ncommon word{i}"
+
+        with MarkdownSearchIndex(tmp_path / "index.sqlite3") as index:
+            report = index.add_many(documents(), batch_size=3)
+            again = index.add_many(documents(), batch_size=3)
+
+            blocks = index._db.execute(
+                "SELECT COUNT(*) FROM postings WHERE term = 'common'"
+            ).fetchone()[0]
+            assert (report.added, again.unchanged) == (7, 7)
+            assert blocks == 3
+            assert index.search("common").total == 7
+            with pytest.raises(MarkdownValidationError):
+                index.add_many([], batch_size=0)
+
+
+class TestIterCrawlDocuments:
+    """Tests for iter_crawl_documents."""
+
+    def test_reads_pages_from_manifest(self, tmp_path):
+        (tmp_path / "pages").mkdir()
+        (tmp_path / "pages" / "a.md").write_text("# A", encoding="utf-8")
+        entries = [
+            {"url": "https://e.com/a", "depth": 0, "path": "pages/a.md"},
+            {"url": "https://e.com/b", "depth": 0, "path": None, "error": "404"},
+            {"url": "https://e.com/c", "depth": 0, "path": "pages/missing.md"},
+        ]
+        (tmp_path / "manifest.jsonl").write_text(
+            "".join(json.dumps(entry) + "\n" for entry in entries)
+        )
+
+        assert list(iter_crawl_documents(tmp_path)) == [("https://e.com/a", "# A")]
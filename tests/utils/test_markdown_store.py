@@ -0,0 +1,147 @@
+"""Tests for markdown_store module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from vibe_coding.utils.markdown_fetcher import (
+    MarkdownFileResult,
+    MarkdownMetadata,
+    MarkdownResult,
+    MarkdownValidationError,
+)
+from vibe_coding.utils.markdown_store import MarkdownStore
+
+METADATA = MarkdownMetadata(
+    token_count=12, method_used="ai", status_code=200, response_time_ms=5
+)
+
+
+def _result(content):
+    return MarkdownResult(content=content, metadata=METADATA)
+
+
+def _blobs(store):
+    return sorted(path for path in (store.directory / "blobs").glob("*/*"))
+
+
+class TestMarkdownStore:
+    """Tests for MarkdownStore."""
+
+    def test_put_and_get_round_trip(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+
+        document = store.put("https://example.com/a", _result("# Café\n\nBody"))
+        result = store.get("https://example.com/a")
+
+        assert result.content == "# Café\n\nBody"
+        assert result.metadata == METADATA
+        assert document.size_bytes == len("# Café\n\nBody".encode())
+        assert document.codec == "gzip"
+        assert _blobs(store)[0].name == f"{document.sha256}.gz"
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+        content = "# Mirror\n\n" + "same text " * 500
+
+        first = store.put("https://example.com/a", _result(content))
+        second = store.put("https://mirror.example.com/a?ref=x", _result(content))
+
+        assert first.sha256 == second.sha256
+        assert len(_blobs(store)) == 1
+        assert len(store) == 2
+        stats = store.stats()
+        assert stats.blobs == 1
+        assert stats.raw_bytes == 2 * len(content)
+        assert stats.saved_bytes > len(content)
+
+    def test_missing_url(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+
+        assert store.get("https://example.com/missing") is None
+        assert "https://example.com/missing" not in store
+        with pytest.raises(KeyError):
+            store.open("https://example.com/missing")
+
+    def test_index_is_reloaded_and_last_entry_wins(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+        store.put("https://example.com/a", _result("v1"))
+        store.put("https://example.com/b", _result("b"))
+        store.put("https://example.com/a", _result("v2"))
+
+        reopened = MarkdownStore(tmp_path, codec="gzip")
+
+        assert reopened.urls() == ["https://example.com/b", "https://example.com/a"]
+        assert reopened.get("https://example.com/a").content == "v2"
+
+    def test_streaming_reads(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+        content = "".join(f"line {i}\n" for i in range(1000))
+        store.put("https://example.com/a", _result(content))
+
+        pieces = list(store.iter_text("https://example.com/a", chunk_size=100))
+        with store.open("https://example.com/a") as f:
+            first_line = f.readline()
+
+        assert "".join(pieces) == content
+        assert max(len(piece) for piece in pieces) == 100
+        assert first_line == "line 0\n"
+
+    def test_put_stream_matches_put(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+        content = "# Big\n\n" + "word " * 5000
+
+        streamed = store.put_stream(
+            "https://example.com/s",
+            (content[i : i + 333] for i in range(0, len(content), 333)),
+            METADATA,
+        )
+        whole = store.put("https://example.com/w", _result(content))
+
+        assert streamed.sha256 == whole.sha256
+        assert streamed.size_bytes == whole.size_bytes
+        assert len(_blobs(store)) == 1
+        assert not list((tmp_path / "blobs").glob(".tmp-*"))
+        assert store.get("https://example.com/s").content == content
+
+    def test_put_file_result(self, tmp_path):
+        path = tmp_path / "page.md"
+        path.write_text("# From disk\n", encoding="utf-8")
+        store = MarkdownStore(tmp_path / "store", codec="gzip")
+
+        store.put("https://example.com/f", MarkdownFileResult(path, METADATA, 12))
+
+        assert store.get("https://example.com/f").content == "# From disk\n"
+
+    def test_compact_removes_orphan_blobs(self, tmp_path):
+        store = MarkdownStore(tmp_path, codec="gzip")
+        store.put("https://example.com/a", _result("old"))
+        store.put("https://example.com/a", _result("new"))
+
+        assert store.compact() == 1
+        assert len(_blobs(store)) == 1
+        assert len(store.index_path.read_text().splitlines()) == 1
+        assert store.get("https://example.com/a").content == "new"
+
+    def test_unknown_codec_is_rejected(self, tmp_path):
+        with pytest.raises(MarkdownValidationError):
+            MarkdownStore(tmp_path, codec="lz4")
+
+    def test_zstd_requires_zstandard(self, tmp_path):
+        with patch("vibe_coding.utils.markdown_store.zstandard", None):
+            with pytest.raises(ImportError, match="zstandard"):
+                MarkdownStore(tmp_path, codec="zstd")
+            assert MarkdownStore(tmp_path).codec == "gzip"
+
+    def test_zstd_round_trip_and_mixed_codecs(self, tmp_path):
+        pytest.importorskip("zstandard")
+        MarkdownStore(tmp_path, codec="gzip").put("https://e.com/g", _result("gz"))
+        store = MarkdownStore(tmp_path, codec="zstd")
+
+        document = store.put("https://e.com/z", _result("# zstd\n" * 100))
+        store.put_stream("https://e.com/s", ["# zstd\n"] * 100, METADATA)
+
+        assert document.codec == "zstd"
+        assert len(_blobs(store)) == 2
+        assert store.get("https://e.com/g").content == "gz"
+        assert "".join(store.iter_text("https://e.com/s")) == "# zstd\n" * 100
@@ -0,0 +1,127 @@
+"""Tests for markdown_transport module."""
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+pytest.importorskip("h2")
+pytest.importorskip("httpx")
+
+from scripts.markdown_stub_server import StubServer, StubSettings  # noqa: E402
+from vibe_coding.utils.markdown_fetcher import (  # noqa: E402
+    MarkdownFetcher,
+    MarkdownFetcherConfig,
+    MarkdownFetchError,
+    MarkdownPoolConfig,
+    MarkdownTimeoutError,
+)
+from vibe_coding.utils.markdown_transport import HTTP2Adapter  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubSettings(ai_latency=0.0), http2=True) as stub:
+        yield stub
+
+
+def _fetcher(stub, **overrides):
+    config = MarkdownFetcherConfig(
+        method="ai", endpoint=stub.endpoint, max_retries=1, **overrides
+    )
+    return MarkdownFetcher(config, transport=HTTP2Adapter(http1=False))
+
+
+class TestHTTP2Adapter:
+    """Tests for HTTP2Adapter against an h2c stub server."""
+
+    def test_session_round_trip(self, stub):
+        session = requests.Session()
+        session.mount("http://", HTTP2Adapter(http1=False))
+
+        response = session.get(stub.page_url("docs"), timeout=5)
+
+        assert response.status_code == 200
+        assert response.raw.http_version == "HTTP/2"
+        assert response.encoding == "utf-8"
+        assert "API Reference" in response.text
+        assert response.headers["content-type"].startswith("text/html")
+        session.close()
+
+    def test_raw_read_honors_amt(self):
+        with StubServer(StubSettings(payload_kb=64), http2=True) as stub:
+            session = requests.Session()
+            session.mount("http://", HTTP2Adapter(http1=False))
+
+            body = session.get(stub.page_url("docs"), timeout=5).content
+            response = session.get(stub.page_url("docs"), stream=True, timeout=5)
+            head = response.raw.read(100)
+            tail = response.raw.read()
+            response.close()
+            session.close()
+
+        assert len(head) == 100
+        assert head + tail == body
+
+    def test_fetch_through_tiers(self, stub):
+        with _fetcher(stub) as fetcher:
+            result = fetcher.fetch(stub.page_url("article"))
+
+        assert result.metadata.method_used == "ai"
+        assert result.metadata.status_code == 200
+        assert "# An Article" in result.content
+        assert result.metadata.token_count is not None
+
+    def test_concurrent_fetches_share_one_connection(self):
+        urls = [f"article?{i}" for i in range(20)]
+        with StubServer(StubSettings(ai_latency=0.2), http2=True) as stub:
+            with _fetcher(stub) as fetcher, ThreadPoolExecutor(20) as pool:
+                results = list(
+                    pool.map(lambda path: fetcher.fetch(stub.page_url(path)), urls)
+                )
+
+            assert all("# An Article" in result.content for result in results)
+            assert stub.requests == 20
+            assert stub.connections == 1
+
+    def test_large_response_respects_flow_control(self):
+        with StubServer(StubSettings(payload_kb=512), http2=True) as stub:
+            session = requests.Session()
+            session.mount("http://", HTTP2Adapter(http1=False))
+
+            response = session.get(stub.page_url("docs"), timeout=5)
+
+            assert len(response.content) > 512 * 1024
+            session.close()
+
+    def test_streaming_with_max_bytes(self, stub):
+        with _fetcher(stub, max_bytes=100) as fetcher:
+            with pytest.raises(MarkdownFetchError, match="max_bytes"):
+                fetcher.fetch(stub.page_url("article"))
+
+    def test_timeout_maps_to_markdown_timeout_error(self):
+        with StubServer(StubSettings(ai_latency=1.0), http2=True) as stub:
+            with _fetcher(stub, timeout=0.2) as fetcher:
+                with pytest.raises(MarkdownTimeoutError):
+                    fetcher.fetch(stub.page_url("article"))
+
+    def test_connection_error_maps_to_markdown_fetch_error(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        config = MarkdownFetcherConfig(
+            method="ai", endpoint=f"http://127.0.0.1:{port}/", max_retries=1
+        )
+
+        with MarkdownFetcher(config, transport=HTTP2Adapter(http1=False)) as fetcher:
+            with pytest.raises(MarkdownFetchError) as exc_info:
+                fetcher.fetch("https://example.com/page")
+
+        assert not isinstance(exc_info.value, MarkdownTimeoutError)
+
+    def test_pool_config_selects_http2_adapter(self):
+        fetcher = MarkdownFetcher(pool=MarkdownPoolConfig(http2=True))
+
+        assert isinstance(fetcher._adapter, HTTP2Adapter)
+        fetcher.close()